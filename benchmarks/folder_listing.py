@@ -0,0 +1,80 @@
+"""Peak memory and time of the item mirror listing a large folder, buffered against streamed.
+
+Usage: python benchmarks/folder_listing.py [--jobs 50000]
+
+The listing is a synthetic ``SYNC_ITEMS_QUERY`` response of one flat folder. ``buffered`` reads the
+whole body, decodes it whole and then validates it, as the mirror did before it streamed listings.
+``streamed`` is the path of the client, fed by a fake response in chunks of ``JSON_CHUNK_SIZE``.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from unittest import mock
+
+from mcp_jenkins.jenkins import Jenkins, json_codec
+from mcp_jenkins.jenkins.json_stream import JSON_CHUNK_SIZE
+
+
+def listing(jobs: int) -> bytes:
+    return json.dumps(
+        {
+            '_class': 'com.cloudbees.hudson.plugins.folder.Folder',
+            'jobs': [
+                {
+                    '_class': 'hudson.model.FreeStyleProject',
+                    'name': f'job-{i}',
+                    'url': f'https://jenkins.example.com/job/big/job/job-{i}/',
+                    'color': 'blue',
+                    'lastBuild': {'_class': 'hudson.model.FreeStyleBuild', 'number': i},
+                }
+                for i in range(jobs)
+            ],
+        }
+    ).encode()
+
+
+def measure(name: str, run: object) -> None:
+    # Timed without tracemalloc, which slows small allocations down far more than large ones
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    _, items, _ = run()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{name:>9}: {elapsed * 1000:5.0f} ms, peak {peak / 2**20:6.1f} MiB '
+        f'for {len(items)} items held in {size / 2**20:.1f} MiB'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--jobs', type=int, default=50_000)
+    args = parser.parse_args()
+
+    body = listing(args.jobs)
+    print(f'listing of {args.jobs} jobs, {len(body) / 2**20:.1f} MiB body, json backend {json_codec.BACKEND}')
+
+    jenkins = Jenkins(url='https://jenkins.example.com', username='user', password='token')  # noqa: S106
+    chunks = [body[i : i + JSON_CHUNK_SIZE] for i in range(0, len(body), JSON_CHUNK_SIZE)]
+
+    def buffered() -> tuple:
+        # The body is copied, like reading response.content
+        return jenkins._parse_synced_items(json_codec.loads(bytes(body))['jobs'], fullname='big')
+
+    def streamed() -> tuple:
+        response = mock.Mock(iter_content=lambda chunk_size: iter(chunks))
+        with mock.patch.object(jenkins, '_stream', return_value=response):
+            return jenkins._list_synced_folder('big')
+
+    for _ in range(2):
+        measure('buffered', buffered)
+        measure('streamed', streamed)
+
+
+if __name__ == '__main__':
+    main()
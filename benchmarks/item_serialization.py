@@ -0,0 +1,112 @@
+"""Validate and dump times of bulk item and node listings, one model at a time against one call per list.
+
+Usage: python benchmarks/item_serialization.py [--items 50000] [--repeat 3]
+
+``per model`` is the path before the listings went through a TypeAdapter: ``model_validate`` then
+``model_dump(exclude_none=True)`` on every item. ``per list`` is ``serialize_items`` / ``dump_items``
+(``serialize_nodes`` / ``dump_nodes``), what the clients and tools use. ``model_construct`` skips
+validation altogether, for reference.
+"""
+
+import argparse
+import gc
+import time
+from collections.abc import Callable
+
+from mcp_jenkins.jenkins.model.item import Job, dump_items, serialize_item, serialize_items
+from mcp_jenkins.jenkins.model.node import Node, dump_nodes, serialize_nodes
+
+
+def items(count: int) -> list[dict]:
+    return [
+        {
+            '_class': 'hudson.model.FreeStyleProject' if i % 2 else 'org.jenkinsci.plugins.workflow.job.WorkflowJob',
+            'name': f'job-{i}',
+            'url': f'https://jenkins.example.com/job/folder-{i // 100}/job/job-{i}/',
+            'fullname': f'folder-{i // 100}/job-{i}',
+            'color': 'blue' if i % 3 else 'red',
+        }
+        for i in range(count)
+    ]
+
+
+def nodes(count: int) -> list[dict]:
+    return [
+        {
+            '_class': 'hudson.slaves.SlaveComputer',
+            'displayName': f'agent-{i}',
+            'offline': bool(i % 7 == 0),
+            'executors': [{'_class': 'hudson.model.Executor'} for _ in range(4)],
+        }
+        for i in range(count)
+    ]
+
+
+def best(run: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        # Like timeit, the collector would otherwise charge a run for the garbage of the previous ones
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return min(times) * 1000
+
+
+def row(label: str, runs: dict[str, Callable[[], object]], repeat: int) -> None:
+    print(f'  {label:<9}' + ''.join(f'  {name} {best(run, repeat):7.1f}' for name, run in runs.items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    item_data, node_data = items(args.items), nodes(args.items // 100)
+    item_models, node_models = serialize_items(item_data), serialize_nodes(node_data)
+
+    print(f'{len(item_data)} items, best of {args.repeat}, in ms')
+    row(
+        'validate',
+        {
+            'per model': lambda: [serialize_item(item) for item in item_data],
+            'per list': lambda: serialize_items(item_data),
+            'model_construct': lambda: [Job.model_construct(**item) for item in item_data],
+        },
+        args.repeat,
+    )
+    row(
+        'dump',
+        {
+            'per model': lambda: [item.model_dump(exclude_none=True) for item in item_models],
+            'per list': lambda: dump_items(item_models),
+        },
+        args.repeat,
+    )
+
+    print(f'{len(node_data)} nodes, best of {args.repeat}, in ms')
+    row(
+        'validate',
+        {
+            'per model': lambda: [Node.model_validate(node) for node in node_data],
+            'per list': lambda: serialize_nodes(node_data),
+        },
+        args.repeat,
+    )
+    row(
+        'dump',
+        {
+            'per model': lambda: [node.model_dump(exclude={'executors'}) for node in node_models],
+            'per list': lambda: dump_nodes(node_models, exclude={'executors'}),
+        },
+        args.repeat,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Decode and encode times of the JSON backends on payloads shaped like large Jenkins responses.
+
+Usage: python benchmarks/json_codec.py [--repeat 5]
+
+Compares the stdlib json module, ``json_codec`` (orjson when installed) and ``pydantic_core.to_json``,
+which FastMCP serializes tool results with. The payloads are synthetic, built with the fields of
+``pluginManager/api/json?depth=2`` and of a nested ``jobs`` tree, the largest responses a client reads.
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from unittest import mock
+
+import pydantic_core
+
+from mcp_jenkins.core.middleware import truncate_json
+from mcp_jenkins.jenkins import json_codec
+
+
+def plugin_list(plugins: int) -> dict:
+    return {
+        '_class': 'hudson.LocalPluginManager',
+        'plugins': [
+            {
+                'active': True,
+                'backupVersion': None,
+                'bundled': False,
+                'deleted': False,
+                'dependencies': [
+                    {'optional': bool(d % 2), 'shortName': f'dependency-{d}', 'version': f'{d}.{i}'} for d in range(8)
+                ],
+                'downgradable': False,
+                'enabled': True,
+                'hasUpdate': bool(i % 5),
+                'longName': f'Example Plugin {i}',
+                'minimumJavaVersion': '11',
+                'pinned': False,
+                'requiredCoreVersion': '2.401.3',
+                'shortName': f'plugin-{i}',
+                'supportsDynamicLoad': 'MAYBE',
+                'url': f'https://plugins.jenkins.io/plugin-{i}',
+                'version': f'{i}.{i % 7}.0',
+            }
+            for i in range(plugins)
+        ],
+    }
+
+
+def item_tree(folders: int, jobs: int) -> dict:
+    return {
+        '_class': 'hudson.model.Hudson',
+        'jobs': [
+            {
+                '_class': 'com.cloudbees.hudson.plugins.folder.Folder',
+                'name': f'folder-{f}',
+                'url': f'https://jenkins.example.com/job/folder-{f}/',
+                'jobs': [
+                    {
+                        '_class': 'hudson.model.FreeStyleProject',
+                        'name': f'job-{j}',
+                        'url': f'https://jenkins.example.com/job/folder-{f}/job/job-{j}/',
+                        'color': 'blue' if j % 3 else 'red',
+                    }
+                    for j in range(jobs)
+                ],
+            }
+            for f in range(folders)
+        ],
+    }
+
+
+def best(run: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+def report(name: str, payload: dict, repeat: int) -> None:
+    body = json.dumps(payload).encode()
+    print(f'{name} ({len(body) / 2**20:.1f} MiB)')
+    print(f'  loads  stdlib {best(lambda: json.loads(body), repeat):7.1f}', end='')
+    print(f'  json_codec {best(lambda: json_codec.loads(body), repeat):7.1f}')
+    print(f'  dumps  stdlib {best(lambda: json.dumps(payload), repeat):7.1f}', end='')
+    print(f'  json_codec {best(lambda: json_codec.dumps(payload), repeat):7.1f}', end='')
+    print(f'  pydantic_core {best(lambda: pydantic_core.to_json(payload), repeat):7.1f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'json_codec backend: {json_codec.BACKEND}, best of {args.repeat}, in ms')
+    report('plugins depth=2, 400 plugins', plugin_list(400), args.repeat)
+    report('item tree, 500 folders x 100 jobs', item_tree(500, 100), args.repeat)
+
+    tree = item_tree(100, 100)['jobs']
+    print('truncate_json of 100 folders x 100 jobs to 50 kB')
+    with mock.patch.object(json_codec, 'orjson', None):
+        print(f'  stdlib {best(lambda: truncate_json(tree, 50_000, lambda part: "token"), args.repeat):7.1f}', end='')
+    print(f'  json_codec {best(lambda: truncate_json(tree, 50_000, lambda part: "token"), args.repeat):7.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -26,6 +26,34 @@ if sys.platform == 'win32':
     default=True,
     help='Whether to verify SSL certificates, default is True',
 )
+@click.option(
+    '--jenkins-async/--no-jenkins-async',
+    default=False,
+    help='Whether to use the native asyncio (httpx) Jenkins client instead of the blocking one, default is False',
+)
+@click.option(
+    '--jenkins-worker-threads',
+    default=0,
+    type=click.IntRange(min=0),
+    help='Number of worker threads the blocking Jenkins client runs on, 0 runs calls on the event loop',
+)
+@click.option(
+    '--jenkins-max-connections',
+    default=10,
+    type=click.IntRange(min=1),
+    help='Maximum number of pooled HTTP connections to Jenkins per client, default is 10',
+)
+@click.option(
+    '--jenkins-keepalive-expiry',
+    default=15,
+    type=click.IntRange(min=0),
+    help='Seconds an idle pooled connection is kept alive (--jenkins-async only), default is 15',
+)
+@click.option(
+    '--jenkins-tcp-keepalive/--no-jenkins-tcp-keepalive',
+    default=True,
+    help='Whether to enable TCP keep-alive probes on connections to Jenkins, default is True',
+)
 @click.option(
     '--read-only',
     default=False,
@@ -40,9 +68,44 @@ if sys.platform == 'win32':
 @click.option(
     '--jenkins-session-singleton/--no-jenkins-session-singleton',
     default=True,
-    help='In the same session, does it share the Jenkins request instance, '
+    help='Whether sessions with the same credentials share a pooled Jenkins client, '
     'significantly reducing the number of instantiations and crumb requests',
 )
+@click.option(
+    '--jenkins-client-pool-size',
+    default=32,
+    type=click.IntRange(min=1),
+    help='Maximum number of pooled Jenkins clients, the least recently used one is evicted first',
+)
+@click.option(
+    '--jenkins-client-idle-timeout',
+    default=300,
+    type=click.IntRange(min=1),
+    help='Seconds a pooled Jenkins client may stay unused before it is closed',
+)
+@click.option(
+    '--jenkins-cache-size',
+    default=256,
+    type=click.IntRange(min=0),
+    help='Number of Jenkins read responses cached per client, 0 disables the cache',
+)
+@click.option(
+    '--jenkins-build-cache/--no-jenkins-build-cache',
+    default=True,
+    help='Whether to keep the data of finished builds on disk under ~/.mcp_jenkins/builds, default is True',
+)
+@click.option(
+    '--jenkins-crawl-concurrency',
+    default=0,
+    type=click.IntRange(min=0),
+    help='Number of folders listed at once when syncing the item index folder by folder, 0 uses the default of 8',
+)
+@click.option(
+    '--response-max-bytes',
+    default=256 * 1024,
+    type=click.IntRange(min=0),
+    help='Maximum size of a tool response, larger ones are truncated with a continuation token, 0 disables the limit',
+)
 @click.option(
     '--transport',
     type=click.Choice(['stdio', 'sse', 'streamable-http']),
@@ -64,9 +127,20 @@ def main(
     jenkins_password: str,
     jenkins_timeout: int,
     jenkins_verify_ssl: bool,  # noqa: FBT001
+    jenkins_async: bool,  # noqa: FBT001
+    jenkins_worker_threads: int,
+    jenkins_max_connections: int,
+    jenkins_keepalive_expiry: int,
+    jenkins_tcp_keepalive: bool,  # noqa: FBT001
     read_only: bool,  # noqa: FBT001
     tool_regex: str,
     jenkins_session_singleton: bool,  # noqa: FBT001
+    jenkins_client_pool_size: int,
+    jenkins_client_idle_timeout: int,
+    jenkins_cache_size: int,
+    jenkins_build_cache: bool,  # noqa: FBT001
+    jenkins_crawl_concurrency: int,
+    response_max_bytes: int,
     transport: str,
     host: str,
     port: int,
@@ -80,7 +154,18 @@ def main(
 
     os.environ['jenkins_timeout'] = str(jenkins_timeout)
     os.environ['jenkins_verify_ssl'] = str(jenkins_verify_ssl).lower()
+    os.environ['jenkins_async'] = str(jenkins_async).lower()
+    os.environ['jenkins_worker_threads'] = str(jenkins_worker_threads)
+    os.environ['jenkins_max_connections'] = str(jenkins_max_connections)
+    os.environ['jenkins_keepalive_expiry'] = str(jenkins_keepalive_expiry)
+    os.environ['jenkins_tcp_keepalive'] = str(jenkins_tcp_keepalive).lower()
     os.environ['jenkins_session_singleton'] = str(jenkins_session_singleton).lower()
+    os.environ['jenkins_client_pool_size'] = str(jenkins_client_pool_size)
+    os.environ['jenkins_client_idle_timeout'] = str(jenkins_client_idle_timeout)
+    os.environ['jenkins_cache_size'] = str(jenkins_cache_size)
+    os.environ['jenkins_build_cache'] = str(jenkins_build_cache).lower()
+    os.environ['jenkins_crawl_concurrency'] = str(jenkins_crawl_concurrency)
+    os.environ['response_max_bytes'] = str(response_max_bytes)
 
     from mcp_jenkins.server import mcp
 
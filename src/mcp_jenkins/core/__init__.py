@@ -1,4 +1,12 @@
+from .client_pool import JenkinsClientPool
 from .lifespan import LifespanContext, lifespan
-from .middleware import AuthMiddleware
+from .middleware import AuthMiddleware, ClientLeaseMiddleware, ResponseBudgetMiddleware
 
-__all__ = ['AuthMiddleware', 'lifespan', 'LifespanContext']
+__all__ = [
+    'AuthMiddleware',
+    'ClientLeaseMiddleware',
+    'JenkinsClientPool',
+    'lifespan',
+    'LifespanContext',
+    'ResponseBudgetMiddleware',
+]
@@ -0,0 +1,145 @@
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+PoolKey = tuple[str, str, str]
+
+# Releases of the clients leased during the current tool call, None outside of a lease scope
+_releases: ContextVar[list[Callable[[], Awaitable[None]]] | None] = ContextVar('jenkins_client_releases', default=None)
+
+
+@asynccontextmanager
+async def lease_scope() -> AsyncIterator[None]:
+    """Hold the clients leased within the block (a tool call) until it ends, then release them."""
+    releases = []
+    token = _releases.set(releases)
+    try:
+        yield
+    finally:
+        _releases.reset(token)
+        for release in releases:
+            await release()
+
+
+def defer_release(release: Callable[[], Awaitable[None]]) -> bool:
+    """Await ``release`` once the current lease scope ends, False (and nothing deferred) outside of one."""
+    releases = _releases.get()
+    if releases is None:
+        return False
+    releases.append(release)
+    return True
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    last_used: float
+    leases: int = 0
+    evicted: bool = False
+
+
+class JenkinsClientPool:
+    """Process-wide LRU pool of Jenkins clients shared by every MCP session.
+
+    Clients are keyed by the resolved url, username and a hash of the credential, so short-lived
+    streamable-http sessions reuse warm connections and CSRF crumbs instead of building a new
+    client each. The pool is bounded by ``max_size`` (least recently used client is evicted first)
+    and clients unused for ``idle_timeout`` seconds are closed on the next lookup.
+
+    Within a :func:`lease_scope` a client is leased until the scope ends: an idle client is only one
+    without leases, and an evicted client still leased is closed once its last lease is released,
+    so a long search or crawl never has its client closed under it.
+    """
+
+    def __init__(self, *, max_size: int = 32, idle_timeout: float = 300) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._clients: OrderedDict[PoolKey, _PooledClient] = OrderedDict()
+        # Keep a reference to pending close tasks so they are not garbage collected mid-flight
+        self._closing: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def key(*, url: str, username: str, password: str) -> PoolKey:
+        """Build the pool key, the credential is hashed so it never sits in the pool in plain text."""
+        return url.rstrip('/'), username, hashlib.sha256(password.encode('utf-8')).hexdigest()
+
+    def get(self, *, url: str, username: str, password: str, factory: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Get the pooled client for the given credentials, creating it with ``factory`` on a miss.
+
+        Args:
+            url: The Jenkins URL.
+            username: The Jenkins username.
+            password: The Jenkins password or API token.
+            factory: Called without arguments to build a new client.
+
+        Returns:
+            The pooled client.
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        key = self.key(url=url, username=username, password=password)
+        pooled = self._clients.pop(key, None)
+        if pooled is None:
+            pooled = _PooledClient(client=factory(), last_used=now)
+        pooled.last_used = now
+        self._clients[key] = pooled
+
+        if defer_release(functools.partial(self._release, pooled)):
+            pooled.leases += 1
+
+        while len(self._clients) > self.max_size:
+            evicted_key, evicted = self._clients.popitem(last=False)
+            logger.info(f'Jenkins client pool is full, evicting client of {evicted_key[0]} ({evicted_key[1]})')
+            self._evict(evicted)
+
+        return pooled.client
+
+    async def _release(self, pooled: _PooledClient) -> None:
+        pooled.leases -= 1
+        pooled.last_used = time.monotonic()
+        if pooled.evicted and not pooled.leases:
+            await pooled.client.aclose()
+
+    def _evict_idle(self, now: float) -> None:
+        for key, pooled in list(self._clients.items()):
+            if not pooled.leases and now - pooled.last_used >= self.idle_timeout:
+                del self._clients[key]
+                logger.info(f'Evicting Jenkins client of {key[0]} ({key[1]}) idle for {now - pooled.last_used:.0f}s')
+                self._evict(pooled)
+
+    def _evict(self, pooled: _PooledClient) -> None:
+        """Close an evicted client, or leave it to its last lease when still leased."""
+        pooled.evicted = True
+        if pooled.leases:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(pooled.client.aclose())
+        else:
+            task = loop.create_task(pooled.client.aclose())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        clients = [pooled.client for pooled in self._clients.values()]
+        self._clients.clear()
+
+        for client in clients:
+            await client.aclose()
@@ -1,13 +1,23 @@
 import os
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastmcp import Context, FastMCP
 from fastmcp.server.dependencies import get_http_request
 from loguru import logger
 from pydantic import BaseModel, ConfigDict
 
-from mcp_jenkins.jenkins import Jenkins
+from mcp_jenkins.core.client_pool import JenkinsClientPool, defer_release
+from mcp_jenkins.jenkins import AsyncJenkins, AsyncJenkinsAdapter, Jenkins
+from mcp_jenkins.jenkins.cache import ResponseCache
+
+BUILD_STORE_DIR = Path.home() / '.mcp_jenkins' / 'builds'
+# Parts removed from truncated responses kept for get_response_continuation
+RESPONSE_CONTINUATIONS = 32
+# Total bytes of those parts, the oldest are dropped first
+RESPONSE_CONTINUATIONS_MAX_BYTES = 32 * 1024 * 1024
 
 
 class LifespanContext(BaseModel):
@@ -18,8 +28,27 @@ class LifespanContext(BaseModel):
     jenkins_password: str | None
     jenkins_timeout: int = 5
     jenkins_verify_ssl: bool = True
+    jenkins_async: bool = False
+    jenkins_worker_threads: int = 0
+    jenkins_max_connections: int = 10
+    jenkins_keepalive_expiry: int = 15
+    jenkins_tcp_keepalive: bool = True
+    jenkins_cache_size: int = 256
+    jenkins_build_cache: bool = True
+    jenkins_crawl_concurrency: int = 0
 
     jenkins_session_singleton: bool = True
+    jenkins_client_pool_size: int = 32
+    jenkins_client_idle_timeout: int = 300
+
+    response_max_bytes: int = 256 * 1024
+
+    # Shared by every session to run the blocking Jenkins client off the event loop
+    jenkins_executor: ThreadPoolExecutor | None = None
+    # Shared by every session so clients, connections and crumbs outlive a single session
+    jenkins_client_pool: JenkinsClientPool | None = None
+    # Parts removed from truncated responses, keyed by session and continuation token
+    response_continuations: ResponseCache | None = None
 
 
 @asynccontextmanager
@@ -30,28 +59,81 @@ async def lifespan(app: FastMCP[LifespanContext]) -> AsyncIterator['LifespanCont
 
     jenkins_timeout = int(os.getenv('jenkins_timeout', '5'))
     jenkins_verify_ssl = os.getenv('jenkins_verify_ssl', 'true').lower() == 'true'
+    jenkins_async = os.getenv('jenkins_async', 'false').lower() == 'true'
+    jenkins_worker_threads = int(os.getenv('jenkins_worker_threads', '0'))
+    jenkins_max_connections = int(os.getenv('jenkins_max_connections', '10'))
+    jenkins_keepalive_expiry = int(os.getenv('jenkins_keepalive_expiry', '15'))
+    jenkins_tcp_keepalive = os.getenv('jenkins_tcp_keepalive', 'true').lower() == 'true'
+    jenkins_cache_size = int(os.getenv('jenkins_cache_size', '256'))
+    jenkins_build_cache = os.getenv('jenkins_build_cache', 'true').lower() == 'true'
+    jenkins_crawl_concurrency = int(os.getenv('jenkins_crawl_concurrency', '0'))
     jenkins_session_singleton = os.getenv('jenkins_session_singleton', 'true').lower() == 'true'
+    jenkins_client_pool_size = int(os.getenv('jenkins_client_pool_size', '32'))
+    jenkins_client_idle_timeout = int(os.getenv('jenkins_client_idle_timeout', '300'))
+    response_max_bytes = int(os.getenv('response_max_bytes', str(256 * 1024)))
+
+    jenkins_client_pool = JenkinsClientPool(max_size=jenkins_client_pool_size, idle_timeout=jenkins_client_idle_timeout)
+
+    jenkins_executor = None
+    if jenkins_worker_threads > 0 and not jenkins_async:
+        jenkins_executor = ThreadPoolExecutor(max_workers=jenkins_worker_threads, thread_name_prefix='jenkins')
+
+    try:
+        yield LifespanContext(
+            jenkins_url=jenkins_url,
+            jenkins_username=jenkins_username,
+            jenkins_password=jenkins_password,
+            jenkins_timeout=jenkins_timeout,
+            jenkins_verify_ssl=jenkins_verify_ssl,
+            jenkins_async=jenkins_async,
+            jenkins_worker_threads=jenkins_worker_threads,
+            jenkins_max_connections=jenkins_max_connections,
+            jenkins_keepalive_expiry=jenkins_keepalive_expiry,
+            jenkins_tcp_keepalive=jenkins_tcp_keepalive,
+            jenkins_cache_size=jenkins_cache_size,
+            jenkins_build_cache=jenkins_build_cache,
+            jenkins_crawl_concurrency=jenkins_crawl_concurrency,
+            jenkins_session_singleton=jenkins_session_singleton,
+            jenkins_client_pool_size=jenkins_client_pool_size,
+            jenkins_client_idle_timeout=jenkins_client_idle_timeout,
+            jenkins_executor=jenkins_executor,
+            jenkins_client_pool=jenkins_client_pool,
+            response_max_bytes=response_max_bytes,
+            response_continuations=ResponseCache(
+                max_size=RESPONSE_CONTINUATIONS, max_bytes=RESPONSE_CONTINUATIONS_MAX_BYTES, copy=False
+            ),
+        )
+    finally:
+        await jenkins_client_pool.aclose()
+        if jenkins_executor is not None:
+            jenkins_executor.shutdown(wait=False, cancel_futures=True)
 
-    yield LifespanContext(
-        jenkins_url=jenkins_url,
-        jenkins_username=jenkins_username,
-        jenkins_password=jenkins_password,
-        jenkins_timeout=jenkins_timeout,
-        jenkins_verify_ssl=jenkins_verify_ssl,
-        jenkins_session_singleton=jenkins_session_singleton,
-    )
 
+def jenkins(ctx: Context) -> AsyncJenkins | AsyncJenkinsAdapter:
+    """Get a Jenkins client for the credentials of the current request.
 
-def jenkins(ctx: Context) -> Jenkins:
-    if ctx.request_context.lifespan_context.jenkins_session_singleton and getattr(ctx.session, 'jenkins', None):
-        return ctx.session.jenkins
+    With ``--jenkins-session-singleton`` (the default) clients come from the process-wide
+    ``JenkinsClientPool``, so every session using the same credentials shares one client.
+    Otherwise a new client is built per call and closed once the tool call ends.
 
+    The returned client is always awaited by the tools: either the native ``AsyncJenkins``
+    (``--jenkins-async``) or the blocking ``Jenkins`` wrapped in an ``AsyncJenkinsAdapter``,
+    which runs its calls on the shared worker threads when ``--jenkins-worker-threads`` is set.
+    """
     jenkins_url = ctx.request_context.lifespan_context.jenkins_url
     jenkins_username = ctx.request_context.lifespan_context.jenkins_username
     jenkins_password = ctx.request_context.lifespan_context.jenkins_password
 
     jenkins_timeout = ctx.request_context.lifespan_context.jenkins_timeout
     jenkins_verify_ssl = ctx.request_context.lifespan_context.jenkins_verify_ssl
+    jenkins_async = ctx.request_context.lifespan_context.jenkins_async
+    jenkins_executor = ctx.request_context.lifespan_context.jenkins_executor
+    jenkins_max_connections = ctx.request_context.lifespan_context.jenkins_max_connections
+    jenkins_keepalive_expiry = ctx.request_context.lifespan_context.jenkins_keepalive_expiry
+    jenkins_tcp_keepalive = ctx.request_context.lifespan_context.jenkins_tcp_keepalive
+    jenkins_cache_size = ctx.request_context.lifespan_context.jenkins_cache_size
+    jenkins_build_cache = ctx.request_context.lifespan_context.jenkins_build_cache
+    jenkins_crawl_concurrency = ctx.request_context.lifespan_context.jenkins_crawl_concurrency
 
     try:
         requests = get_http_request()
@@ -76,17 +158,38 @@ def jenkins(ctx: Context) -> Jenkins:
         )
         raise ValueError(msg)
 
-    logger.info(
-        f'Creating Jenkins client with url: '
-        f'{jenkins_url}, username: {jenkins_username}, timeout: {jenkins_timeout}, verify_ssl: {jenkins_verify_ssl}'
-    )
+    def create_client() -> AsyncJenkins | AsyncJenkinsAdapter:
+        logger.info(
+            f'Creating Jenkins client with url: '
+            f'{jenkins_url}, username: {jenkins_username}, timeout: {jenkins_timeout}, '
+            f'verify_ssl: {jenkins_verify_ssl}, async: {jenkins_async}, max_connections: {jenkins_max_connections}'
+        )
 
-    ctx.session.jenkins = Jenkins(
+        client_kwargs = {
+            'url': jenkins_url,
+            'username': jenkins_username,
+            'password': jenkins_password,
+            'timeout': jenkins_timeout,
+            'verify_ssl': jenkins_verify_ssl,
+            'max_connections': jenkins_max_connections,
+            'tcp_keepalive': jenkins_tcp_keepalive,
+            'cache_size': jenkins_cache_size,
+            'build_store_dir': BUILD_STORE_DIR if jenkins_build_cache else None,
+            'crawl_concurrency': jenkins_crawl_concurrency,
+        }
+        if jenkins_async:
+            return AsyncJenkins(**client_kwargs, keepalive_expiry=jenkins_keepalive_expiry)
+        return AsyncJenkinsAdapter(Jenkins(**client_kwargs), executor=jenkins_executor)
+
+    if not ctx.request_context.lifespan_context.jenkins_session_singleton:
+        client = create_client()
+        # Not pooled, nothing else would close it
+        defer_release(client.aclose)
+        return client
+
+    return ctx.request_context.lifespan_context.jenkins_client_pool.get(
         url=jenkins_url,
         username=jenkins_username,
         password=jenkins_password,
-        timeout=jenkins_timeout,
-        verify_ssl=jenkins_verify_ssl,
+        factory=create_client,
     )
-
-    return ctx.session.jenkins
@@ -1,6 +1,23 @@
+import secrets
+from collections.abc import Callable
+from typing import Any
+
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
 from loguru import logger
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from mcp_jenkins.core.client_pool import lease_scope
+from mcp_jenkins.jenkins import json_codec
+
+# Tool serving the continuation of truncated responses, its own pages are never truncated again
+CONTINUATION_TOOL = 'get_response_continuation'
+# Seconds the removed parts of a truncated response stay available to the continuation tool
+CONTINUATION_TTL = 600
+# Bytes set aside for the truncation markers inside a budget
+MARKER_SIZE = 128
+
 
 class AuthMiddleware:
     """ASGI-compliant middleware to extract Jenkins auth from X-Jenkins-* headers."""
@@ -47,3 +64,150 @@ class AuthMiddleware:
 
         # Call the next application with modified scope and safe send wrapper
         await self.app(scope_copy, receive, send)
+
+
+class ClientLeaseMiddleware(Middleware):
+    """Hold the Jenkins clients a tool call gets from ``jenkins(ctx)`` until the call ends.
+
+    Pooled clients are not closed by an eviction while leased, unpooled ones are closed afterwards.
+    """
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[mt.CallToolRequestParams], call_next: CallNext[mt.CallToolRequestParams, Any]
+    ) -> ToolResult:
+        async with lease_scope():
+            return await call_next(context)
+
+
+def _size(value: Any) -> int:  # noqa: ANN401
+    return len(json_codec.dumps(value))
+
+
+def char_boundary(data: bytes, index: int) -> int:
+    """Move a byte index of UTF-8 text back to the start of the character it falls in."""
+    while 0 < index < len(data) and data[index] & 0xC0 == 0x80:
+        index -= 1
+    return index
+
+
+def truncate_json(value: Any, budget: int, omit: Callable[[Any], str]) -> Any:  # noqa: ANN401
+    """Shrink a JSON value to about ``budget`` bytes, keeping the head and tail of long strings and lists.
+
+    Dicts keep all their keys, their largest values are shrunk first. Each removed part is handed
+    to ``omit``, which keeps it and returns its continuation token, and is replaced by a marker of
+    the same type as its neighbours carrying that token.
+    """
+    if _size(value) <= budget:
+        return value
+
+    if isinstance(value, str):
+        data = value.encode()
+        half = max((budget - MARKER_SIZE) // 2, 0)
+        head, tail = char_boundary(data, half), char_boundary(data, len(data) - half)
+        token = omit(data[head:tail].decode())
+        return (
+            data[:head].decode()
+            + f'\n... [{tail - head} bytes truncated, continuation: {token}] ...\n'
+            + data[tail:].decode()
+        )
+
+    if isinstance(value, list):
+        sizes = [_size(item) + 1 for item in value]
+        head, tail, used = 0, 0, MARKER_SIZE
+        # Take items from both ends in turn while they fit
+        while head + tail < len(value):
+            index = head if head <= tail else len(value) - 1 - tail
+            if used + sizes[index] > budget:
+                break
+            used += sizes[index]
+            if head <= tail:
+                head += 1
+            else:
+                tail += 1
+
+        items = value[:head]
+        if not head and not tail:
+            items = [truncate_json(value[0], budget - MARKER_SIZE, omit)]
+        omitted = value[len(items) : len(value) - tail]
+        token = omit(omitted)
+        marker = (
+            f'... [{len(omitted)} items truncated, continuation: {token}] ...'
+            if all(isinstance(item, str) for item in value)
+            else {'truncated_items': len(omitted), 'continuation': token}
+        )
+        return [*items, marker, *value[len(value) - tail :]]
+
+    if isinstance(value, dict):
+        sizes = {key: _size(item) for key, item in value.items()}
+        total, result = _size(value), dict(value)
+        for key in sorted(sizes, key=sizes.get, reverse=True):
+            if total <= budget:
+                break
+            result[key] = truncate_json(value[key], max(budget - (total - sizes[key]), MARKER_SIZE), omit)
+            total += _size(result[key]) - sizes[key]
+        return result
+
+    return value
+
+
+def continuation_key(session_id: str, token: str) -> str:
+    """The key of a removed part in ``response_continuations``, only the session it was cut for can read it."""
+    return f'{session_id}:{token}'
+
+
+class ResponseBudgetMiddleware(Middleware):
+    """Bound the size of every tool response to ``--response-max-bytes``.
+
+    An oversized response is cut down with :func:`truncate_json`, keeping its head and tail. Only the
+    removed parts are kept for a while, as UTF-8 JSON (or plain) text, in the ``response_continuations``
+    store of the lifespan context, keyed by session. ``get_response_continuation`` pages through a part
+    with the token found in its marker (and in the ``continuations`` field of the result meta). The
+    store is bounded in entries and bytes, a part it cannot hold reads as an expired token.
+
+    Only the size of the transmitted response is bounded: the tool still builds its whole result in
+    memory, and this middleware serializes it once more before cutting it down. Tools bound what they
+    build where they can (the console output stops at the budget), this middleware is the last resort
+    for the others.
+    """
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[mt.CallToolRequestParams], call_next: CallNext[mt.CallToolRequestParams, Any]
+    ) -> ToolResult:
+        result = await call_next(context)
+
+        if result.is_error or context.fastmcp_context is None or context.message.name == CONTINUATION_TOOL:
+            return result
+
+        lifespan_context = context.fastmcp_context.request_context.lifespan_context
+        max_bytes = lifespan_context.response_max_bytes
+        text = ''.join(block.text for block in result.content if isinstance(block, mt.TextContent))
+        size = len(text.encode())
+        if not max_bytes or size <= max_bytes:
+            return result
+
+        session_id = context.fastmcp_context.session_id
+        tokens = []
+
+        def omit(part: Any) -> str:  # noqa: ANN401
+            token = secrets.token_urlsafe(12)
+            data = part.encode() if isinstance(part, str) else json_codec.dumps(part)
+            lifespan_context.response_continuations.set(continuation_key(session_id, token), data, ttl=CONTINUATION_TTL)
+            tokens.append(token)
+            return token
+
+        structured = result.structured_content
+        # Tools not returning an object have their value wrapped under ``result``, as their output schema says
+        tool = await context.fastmcp_context.fastmcp.get_tool(context.message.name)
+        wrapped = structured is not None and bool(tool and (tool.output_schema or {}).get('x-fastmcp-wrap-result'))
+        value = structured['result'] if wrapped else structured
+        if value is None:
+            value = text
+
+        truncated = truncate_json(value, max_bytes, omit)
+        logger.debug(f'Truncated the {size} bytes response of {context.message.name} to {max_bytes} bytes')
+        meta = {**(result.meta or {}), 'truncated': True, 'size': size, 'continuations': tokens}
+        return ToolResult(
+            content=truncated if isinstance(truncated, str) else json_codec.dumps(truncated).decode(),
+            structured_content=None if structured is None else ({'result': truncated} if wrapped else truncated),
+            meta=meta,
+        )
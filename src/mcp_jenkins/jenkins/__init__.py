@@ -1,3 +1,5 @@
+from .async_adapter import AsyncJenkinsAdapter
+from .async_rest_client import AsyncJenkins
 from .rest_client import Jenkins
 
-__all__ = ['Jenkins']
+__all__ = ['AsyncJenkins', 'AsyncJenkinsAdapter', 'Jenkins']
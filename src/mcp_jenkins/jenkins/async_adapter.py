@@ -0,0 +1,43 @@
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from mcp_jenkins.jenkins.rest_client import Jenkins
+
+
+class AsyncJenkinsAdapter:
+    """Expose the blocking :class:`Jenkins` client through the coroutine interface of ``AsyncJenkins``.
+
+    Tools always ``await`` the client they get from ``jenkins(ctx)``, this adapter lets them do so
+    when the server runs with the ``requests`` based client. With an executor, every call runs on
+    a worker thread so a slow Jenkins response no longer freezes the event loop; without one the
+    call runs inline on the loop.
+    """
+
+    def __init__(self, jenkins: Jenkins, *, executor: Executor | None = None) -> None:
+        self.jenkins = jenkins
+        self.executor = executor
+
+    async def aclose(self) -> None:
+        """Close the wrapped client."""
+        self.jenkins.close()
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self.jenkins, name)
+        if not callable(attr):
+            return attr
+
+        return self._wrap(attr)
+
+    def _wrap(self, func: Callable) -> Callable[..., Awaitable]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            if self.executor is None:
+                return func(*args, **kwargs)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+        return wrapper
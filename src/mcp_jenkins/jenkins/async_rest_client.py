@@ -0,0 +1,843 @@
+import asyncio
+import re
+import secrets
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing, asynccontextmanager, nullcontext
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Literal
+
+import httpx
+from loguru import logger
+
+from mcp_jenkins.jenkins import json_codec, rest_endpoint
+from mcp_jenkins.jenkins.base import (
+    CRAWL_CONCURRENCY,
+    ITEM_PAGE_SIZE,
+    ITEM_SNAPSHOTS,
+    SYNC_ITEMS_QUERY,
+    JenkinsBase,
+)
+from mcp_jenkins.jenkins.build_store import CONSOLE_CHUNK_SIZE, BuildStore
+from mcp_jenkins.jenkins.cache import (
+    TTL,
+    TTL_BUILD_FINISHED,
+    TTL_BUILD_RUNNING,
+    TTL_ITEM,
+    TTL_ITEM_INDEX,
+    TTL_ITEM_SNAPSHOT,
+    TTL_LAST_BUILD,
+    TTL_NODE,
+    TTL_PLUGIN,
+    TTL_QUEUE,
+    TTL_VIEW,
+    ResponseCache,
+    build_ttl,
+)
+from mcp_jenkins.jenkins.connection import PoolUsage, socket_options
+from mcp_jenkins.jenkins.console import (
+    SCAN_CHUNK_SIZE,
+    ConsoleGrep,
+    ConsoleLineSelector,
+    ConsoleLineSplitter,
+    ConsolePrefilter,
+    ConsoleTail,
+    compile_prefilter,
+    console_cut_note,
+    decode_cursor,
+    iter_prefiltered_lines,
+)
+from mcp_jenkins.jenkins.failure import EXCERPT_MAX_BYTES, FailureExtractor
+from mcp_jenkins.jenkins.item_index import ItemIndex, ItemMirror
+from mcp_jenkins.jenkins.json_stream import JSON_CHUNK_SIZE, JSONArrayStream
+from mcp_jenkins.jenkins.model.build import (
+    Artifact,
+    Build,
+    BuildReplay,
+    ConsoleChunk,
+    ConsoleExcerpt,
+    ConsoleMatch,
+    ConsoleSearchResult,
+)
+from mcp_jenkins.jenkins.model.item import ITEM_MODELS, ItemPage, ItemType, serialize_item
+from mcp_jenkins.jenkins.model.node import Node, serialize_nodes
+from mcp_jenkins.jenkins.model.queue import Queue, QueueItem
+from mcp_jenkins.jenkins.model.view import View
+from mcp_jenkins.jenkins.tree import model_tree
+
+# Lines of a stored console log read per hop to a worker thread
+STORED_LINES_BATCH = 4096
+
+
+class AsyncJenkins(JenkinsBase):
+    """Asyncio Jenkins client built on ``httpx.AsyncClient``.
+
+    Mirrors the method surface of :class:`mcp_jenkins.jenkins.Jenkins`, but every
+    method is a coroutine so a slow Jenkins response never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        username: str,
+        password: str,
+        timeout: int = 75,
+        verify_ssl: bool = True,
+        max_connections: int = 10,
+        tcp_keepalive: bool = True,
+        cache_size: int = 0,
+        keepalive_expiry: float = 5,
+        build_store_dir: Path | None = None,
+        crawl_concurrency: int = 0,
+    ) -> None:
+        self.url = url
+        self.timeout = timeout
+        self.crawl_concurrency = crawl_concurrency
+
+        self._crumb_header = None
+        self._cache = ResponseCache(max_size=cache_size)
+        self._build_store = BuildStore(build_store_dir, url=url, username=username)
+        self._console_sizes = ResponseCache()
+        # Item lists behind page cursors, shared as is since pages only read them
+        self._item_snapshots = ResponseCache(max_size=ITEM_SNAPSHOTS, copy=False)
+        self._item_mirror = ItemMirror()
+        self._item_index: ItemIndex | None = None
+        self._item_index_refresh: asyncio.Task | None = None
+        # Held while the item mirror is synced, so concurrent queries never list the same folders twice
+        self._item_index_sync_lock = asyncio.Lock()
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._usage = PoolUsage(max_connections=max_connections)
+        self._client = httpx.AsyncClient(
+            auth=httpx.BasicAuth(username, password),
+            timeout=timeout,
+            limits=limits,
+            transport=httpx.AsyncHTTPTransport(
+                verify=verify_ssl,
+                limits=limits,
+                socket_options=socket_options(tcp_keepalive=tcp_keepalive),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: dict | str | None,
+        headers: dict | None,
+        params: dict | None,
+    ) -> httpx.Request:
+        # httpx separates form fields (data) from a raw body (content), requests does not
+        body = {'content': data} if isinstance(data, str | bytes) else {'data': data}
+        return self._client.build_request(method, url, headers=headers, params=params, **body)
+
+    async def request(
+        self,
+        method: Literal['GET', 'POST', 'PUT', 'DELETE', 'PATCH'],
+        endpoint: str,
+        *,
+        data: dict | str = None,
+        headers: dict = None,
+        crumb: bool = True,
+        params: dict = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send an HTTP request to a Jenkins REST endpoint.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: Jenkins REST endpoint path.
+            data: Data to send.
+            headers: Optional headers to include in the request.
+            crumb: Whether to include a CSRF crumb header.
+            params: Optional query parameters to include in the request.
+            stream: Whether to leave the body unread, the caller must close the response.
+
+        Returns:
+            Response: The HTTP response object.
+
+        Raises:
+            HTTPStatusError: If the response status is not successful.
+        """
+        headers = dict(headers or {})
+        if crumb:
+            headers.update(await self.get_crumb_header())
+
+        url = self.endpoint_url(endpoint)
+        logger.debug(f'Sending [{method}] request to {url}')
+
+        request = self._build_request(method, url, data=data, headers=headers, params=params)
+        with self._usage.track():
+            response = await self._client.send(request, stream=stream)
+
+        # Same stale-crumb retry as the blocking client, see Jenkins.request
+        if crumb and response.status_code == 403 and self._crumb_header:
+            logger.warning('Received 403 with a cached crumb — refreshing crumb and retrying the request')
+            await response.aclose()
+            self._crumb_header = None
+            headers.update(await self.get_crumb_header())
+            request = self._build_request(method, url, data=data, headers=headers, params=params)
+            with self._usage.track():
+                response = await self._client.send(request, stream=stream)
+
+        if response.is_error and stream:
+            await response.aread()
+        response.raise_for_status()
+
+        return response
+
+    async def get_crumb_header(self) -> dict[str, str]:
+        """Get the CSRF crumb header for Jenkins requests.
+
+        Returns:
+            A dictionary containing the crumb header.
+        """
+        if self._crumb_header is None:
+            try:
+                response = await self.request('GET', rest_endpoint.CRUMB, crumb=False)
+                crumb = json_codec.loads(response.content)
+                self._crumb_header = {crumb['crumbRequestField']: crumb['crumb']}
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    self._crumb_header = {}
+                else:
+                    raise
+
+        return self._crumb_header
+
+    async def _get_json(self, endpoint: str, *, ttl: TTL) -> Any:  # noqa: ANN401
+        """GET a JSON endpoint through the response cache.
+
+        Args:
+            endpoint: The Jenkins REST endpoint path, also the cache key.
+            ttl: Seconds the response stays fresh, or a callable computing them from the payload.
+
+        Returns:
+            The decoded JSON payload.
+        """
+        body = self._cache.get(endpoint)
+        if body is not None:
+            return json_codec.loads(body)
+
+        body = (await self.request('GET', endpoint)).content
+        data = json_codec.loads(body)
+        self._cache.set(endpoint, body, ttl=ttl(data) if callable(ttl) else ttl)
+        return data
+
+    async def _iter_json_array(self, endpoint: str, key: str) -> AsyncIterator[list]:
+        """GET a JSON endpoint streaming its body, yielding the elements of its ``key`` array in batches."""
+        stream = JSONArrayStream(key)
+        response = await self.request('GET', endpoint, crumb=False, stream=True)
+        try:
+            async for chunk in response.aiter_bytes(JSON_CHUNK_SIZE):
+                yield stream.feed(chunk)
+        finally:
+            await response.aclose()
+        yield stream.close()
+
+    async def _is_build_finished(self, fullname: str, number: int) -> bool:
+        """Whether a build is finished, asking Jenkins unless the build store already knows."""
+        if self._build_store.enabled and await asyncio.to_thread(self._build_store.is_finished, fullname, number):
+            return True
+
+        folder, name = self._parse_fullname(fullname)
+        data = await self._get_json(
+            rest_endpoint.BUILD(folder=folder, name=name, number=number, tree='building'), ttl=build_ttl
+        )
+        if data.get('building') is False:
+            if self._build_store.enabled:
+                await asyncio.to_thread(self._build_store.mark_finished, fullname, number)
+            return True
+        return False
+
+    async def _store_get(self, fullname: str, number: int, key: str) -> Any | None:  # noqa: ANN401
+        """Get a payload from the build store, its file is read in a worker thread off the event loop."""
+        if not self._build_store.enabled:
+            return None
+        return await asyncio.to_thread(self._build_store.get, fullname, number, key)
+
+    async def _store_put(self, fullname: str, number: int, key: str, data: Any) -> None:  # noqa: ANN401
+        """Put a payload in the build store from a worker thread, see :meth:`_store_get`."""
+        await asyncio.to_thread(self._build_store.put, fullname, number, key, data)
+
+    async def _has_stored_console_log(self, fullname: str, number: int) -> bool:
+        """Whether the build store holds the console log, checked in a worker thread off the event loop."""
+        return self._build_store.enabled and await asyncio.to_thread(
+            self._build_store.has_console_log, fullname, number
+        )
+
+    @asynccontextmanager
+    async def _write_console_log(self, fullname: str, number: int) -> AsyncIterator[IO[bytes]]:
+        """Open the console log of a finished build for writing, see :meth:`BuildStore.write_console_log`."""
+        writer = self._build_store.write_console_log(fullname, number)
+        log = await asyncio.to_thread(writer.__enter__)
+        try:
+            yield log
+        except BaseException as e:
+            # Only drops the partial file, shielded so a cancelled read still removes it
+            await asyncio.shield(asyncio.to_thread(writer.__exit__, type(e), e, e.__traceback__))
+            raise
+        # Renaming the file may evict other builds from the store
+        await asyncio.to_thread(writer.__exit__, None, None, None)
+
+    async def _iter_stored_console_lines(
+        self, fullname: str, number: int, *, start: int, prefilter: re.Pattern[bytes] | None
+    ) -> AsyncIterator[str]:
+        """Iterate the lines of a stored console log, scanned in batches in a worker thread."""
+
+        def scan() -> Iterator[str]:
+            if prefilter is not None:
+                with self._build_store.map_console_log(fullname, number) as log:
+                    yield from iter_prefiltered_lines(log, prefilter)
+            else:
+                yield from self._build_store.iter_console_log(fullname, number, start=start)
+
+        lines = scan()
+        try:
+            while batch := await asyncio.to_thread(lambda: list(islice(lines, STORED_LINES_BATCH))):
+                for line in batch:
+                    yield line
+        finally:
+            lines.close()
+
+    async def _get_build_json(self, fullname: str, number: int, endpoint: str, *, ttl: TTL) -> Any:  # noqa: ANN401
+        """GET a JSON endpoint of a build, kept in the build store once the build is finished."""
+        if not self._build_store.enabled:
+            return await self._get_json(endpoint, ttl=ttl)
+
+        data = await self._store_get(fullname, number, endpoint)
+        if data is None:
+            finished = await self._is_build_finished(fullname, number)
+            data = await self._get_json(endpoint, ttl=ttl)
+            if finished:
+                await self._store_put(fullname, number, endpoint, data)
+        return data
+
+    async def get_views(self) -> list[dict]:
+        """Get all top-level views from Jenkins."""
+        data = await self._get_json(rest_endpoint.VIEWS, ttl=TTL_VIEW)
+        return data.get('views', [])
+
+    async def get_view(self, *, view_path: str, depth: int = 0, fields: str | None = None) -> dict:
+        """Get a specific view by slash-separated path."""
+        url_path = self._build_view_path(view_path)
+        tree = model_tree(View, depth=depth, fields=fields)
+        return await self._get_json(rest_endpoint.VIEW(view_path=url_path, tree=tree), ttl=TTL_VIEW)
+
+    async def get_queue(self, *, depth: int = 1, fields: str | None = None) -> Queue:
+        """Get queue."""
+        # Queue items are exported inline, so they sit one level below the queue itself
+        tree = f'discoverableItems,items[{model_tree(QueueItem, depth=depth, fields=fields)}]'
+        data = await self._get_json(rest_endpoint.QUEUE(tree=tree), ttl=TTL_QUEUE)
+        return Queue.model_validate(data)
+
+    async def get_queue_item(self, *, id: int, depth: int = 0, fields: str | None = None) -> QueueItem:
+        """Get a queue item by its ID."""
+        tree = model_tree(QueueItem, depth=depth, fields=fields)
+        data = await self._get_json(rest_endpoint.QUEUE_ITEM(id=id, tree=tree), ttl=TTL_QUEUE)
+        return QueueItem.model_validate(data)
+
+    async def cancel_queue_item(self, *, id: int) -> None:
+        """Cancel a queue item by its ID."""
+        await self.request('POST', rest_endpoint.QUEUE_CANCEL_ITEM(id=id))
+        self._cache.invalidate('queue/')
+
+    async def get_node(self, *, name: str, depth: int = 0, fields: str | None = None) -> Node:
+        """Get a specific node by name."""
+        name = '(master)' if name in ('master', 'Built-In Node') else name
+        tree = model_tree(Node, depth=depth, fields=fields)
+        data = await self._get_json(rest_endpoint.NODE(name=name, tree=tree), ttl=TTL_NODE)
+        return Node.model_validate(data)
+
+    async def get_nodes(self, *, depth: int = 0, fields: str | None = None) -> list[Node]:
+        """Get a list of nodes connected to the Master."""
+        tree = model_tree(Node, depth=depth, fields=fields)
+        data = await self._get_json(rest_endpoint.NODES(tree=tree), ttl=TTL_NODE)
+        return serialize_nodes(data['computer'])
+
+    async def get_node_config(self, *, name: str) -> str:
+        """Get the configuration for a node."""
+        response = await self.request('GET', rest_endpoint.NODE_CONFIG(name=name))
+        return response.text
+
+    async def set_node_config(self, *, name: str, config_xml: str) -> None:
+        """Set the configuration for a node."""
+        await self.request(
+            'POST',
+            rest_endpoint.NODE_CONFIG(name=name),
+            headers=self.DEFAULT_HEADERS,
+            data=config_xml,
+        )
+        self._cache.invalidate('computer/')
+
+    async def get_build(self, *, fullname: str, number: int, depth: int = 0, fields: str | None = None) -> Build:
+        """Get build by fullname and number."""
+        folder, name = self._parse_fullname(fullname)
+        tree = model_tree(Build, depth=depth, fields=fields)
+        endpoint = rest_endpoint.BUILD(folder=folder, name=name, number=number, tree=tree)
+
+        data = await self._store_get(fullname, number, endpoint)
+        if data is None:
+            data = await self._get_json(endpoint, ttl=build_ttl)
+            if data.get('building') is False and self._build_store.enabled:
+                await self._store_put(fullname, number, endpoint, data)
+        return Build.model_validate(data)
+
+    async def get_build_console_output(
+        self,
+        *,
+        fullname: str,
+        number: int,
+        pattern: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        tail: int | None = None,
+        max_bytes: int | None = None,
+    ) -> str:
+        """Get the console output of a specific build, streamed line by line."""
+        if tail is not None:
+            return await self._get_build_console_tail(fullname=fullname, number=number, tail=tail, pattern=pattern)
+
+        # Without a pattern, the line index of a stored log skips straight to ``offset``
+        start = 0 if pattern else offset
+        selector = ConsoleLineSelector(pattern=pattern, offset=offset - start, limit=limit, max_bytes=max_bytes)
+
+        # Lines that cannot match are skipped in their raw bytes, only the candidates are decoded
+        prefilter = compile_prefilter(pattern) if pattern else None
+
+        async with aclosing(self._iter_console_lines(fullname, number, start=start, prefilter=prefilter)) as lines:
+            async for line in lines:
+                if selector.feed(line):
+                    break
+        if selector.cut:
+            return selector.result() + console_cut_note(offset + len(selector.matched), max_bytes)
+        return selector.result()
+
+    async def grep_build_console_output(
+        self,
+        *,
+        fullname: str,
+        number: int,
+        patterns: dict[str, str],
+        before: int = 0,
+        after: int = 0,
+        limit: int | None = None,
+    ) -> dict[str, list[ConsoleMatch]]:
+        """Search the console output of a specific build for several patterns in one pass."""
+        grep = ConsoleGrep(patterns=patterns, before=before, after=after, limit=limit)
+
+        async with aclosing(self._iter_console_lines(fullname, number)) as lines:
+            async for line in lines:
+                if grep.feed(line):
+                    break
+        return grep.result()
+
+    async def search_build_console_output(
+        self, *, fullname: str, number: int, pattern: str
+    ) -> ConsoleSearchResult | None:
+        """Count the lines of the console output of a build matching a pattern, None if the build does not exist."""
+        compiled = re.compile(pattern)
+        result = ConsoleSearchResult(number=number, count=0)
+
+        try:
+            lines = self._iter_console_lines(fullname, number, prefilter=compile_prefilter(pattern))
+            async with aclosing(lines):
+                async for line in lines:
+                    if compiled.search(line):
+                        result.count += 1
+                        result.first_match = result.first_match or line
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        return result
+
+    async def get_build_failure_excerpt(
+        self, *, fullname: str, number: int, max_bytes: int = EXCERPT_MAX_BYTES
+    ) -> list[ConsoleExcerpt]:
+        """Extract the regions of the console output of a build explaining its failure."""
+        extractor = FailureExtractor(max_bytes=max_bytes)
+
+        async with aclosing(self._iter_console_lines(fullname, number)) as lines:
+            async for line in lines:
+                extractor.feed(line)
+        return extractor.result()
+
+    async def _iter_console_lines(
+        self, fullname: str, number: int, *, start: int = 0, prefilter: re.Pattern[bytes] | None = None
+    ) -> AsyncIterator[str]:
+        """Iterate the lines of a console log from line ``start``, read from the build store once finished.
+
+        With a ``prefilter`` (see :func:`compile_prefilter`), only the lines it finds are decoded and
+        yielded, ``start`` is then ignored.
+        """
+        if await self._has_stored_console_log(fullname, number):
+            lines = self._iter_stored_console_lines(fullname, number, start=start, prefilter=prefilter)
+            async with aclosing(lines):
+                async for line in lines:
+                    yield line
+            return
+
+        # A finished log read to its end is written to the build store on the way, a read stopped early drops it
+        store = self._build_store.enabled and await self._is_build_finished(fullname, number)
+        lines = ConsolePrefilter(prefilter) if prefilter is not None else ConsoleLineSplitter(start=start)
+
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request(
+            'GET',
+            rest_endpoint.BUILD_CONSOLE_OUTPUT(folder=folder, name=name, number=number),
+            crumb=False,
+            stream=True,
+        )
+        try:
+            async with self._write_console_log(fullname, number) if store else nullcontext() as log:
+                async for chunk in response.aiter_bytes(SCAN_CHUNK_SIZE if prefilter else CONSOLE_CHUNK_SIZE):
+                    if log is not None:
+                        await asyncio.to_thread(log.write, chunk)
+                    for line in lines.feed(chunk):
+                        yield line
+            for line in lines.close():
+                yield line
+        finally:
+            await response.aclose()
+
+    async def _get_build_console_tail(self, *, fullname: str, number: int, tail: int, pattern: str | None) -> str:
+        """Read the last lines of a console log from its end, see :class:`ConsoleTail`."""
+        selector = ConsoleTail(tail=tail, pattern=pattern)
+
+        if await self._has_stored_console_log(fullname, number):
+
+            def read_stored_tail() -> str:
+                with self._build_store.map_console_log(fullname, number) as log:
+                    while (start := selector.next_start(len(log))) is not None:
+                        selector.feed(start, log[start:])
+                return selector.result()
+
+            return await asyncio.to_thread(read_stored_tail)
+
+        folder, name = self._parse_fullname(fullname)
+        key = f'{fullname}#{number}'
+        size = self._console_sizes.get(key)
+
+        if size is None:
+            # Only the X-Text-Size header of a read from the start is needed, the body is never read
+            response = await self.request(
+                'GET',
+                rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=0),
+                crumb=False,
+                stream=True,
+            )
+            await response.aclose()
+            size = int(response.headers.get('X-Text-Size', 0))
+
+        while (start := selector.next_start(size)) is not None:
+            response = await self.request(
+                'GET',
+                rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=start),
+                crumb=False,
+            )
+            selector.feed(start, response.content)
+            size = int(response.headers.get('X-Text-Size', size))
+
+        # A log only grows, so a remembered size is always a valid start
+        self._console_sizes.set(key, size, ttl=TTL_BUILD_FINISHED)
+        return selector.result()
+
+    async def get_build_console_progress(
+        self, *, fullname: str, number: int, cursor: str | None = None
+    ) -> ConsoleChunk:
+        """Get the console output a build wrote since a previous read.
+
+        Each chunk carries the cursor to resume from, so polling a running build only transfers
+        the bytes written in between. While the build runs the chunk stops at its last complete line.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The number of the build.
+            cursor: The cursor of the previous chunk, None to read from the start of the log.
+
+        Returns:
+            The new output, the cursor of the next read and whether the build is still writing.
+        """
+        start = decode_cursor(cursor, number) if cursor is not None else 0
+
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request(
+            'GET',
+            rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=start),
+            crumb=False,
+        )
+        self._console_sizes.set(
+            f'{fullname}#{number}', int(response.headers.get('X-Text-Size', start)), ttl=TTL_BUILD_FINISHED
+        )
+        return self._parse_console_chunk(number, start, response.content, response.headers)
+
+    async def stop_build(self, *, fullname: str, number: int) -> None:
+        """Stop a running Jenkins build."""
+        folder, name = self._parse_fullname(fullname)
+        await self.request('POST', rest_endpoint.BUILD_STOP(folder=folder, name=name, number=number))
+        self._cache.invalidate(self._item_cache_prefix(fullname), 'computer/', 'queue/')
+
+    async def get_build_replay(self, *, fullname: str, number: int) -> BuildReplay:
+        """Get the pipeline scripts of a specific build."""
+        data = await self._store_get(fullname, number, 'replay')
+        if data is not None:
+            return BuildReplay.model_validate(data)
+
+        finished = self._build_store.enabled and await self._is_build_finished(fullname, number)
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request('GET', rest_endpoint.BUILD_REPLAY(folder=folder, name=name, number=number))
+        replay = self._parse_build_replay(response.text)
+        if finished:
+            await self._store_put(fullname, number, 'replay', replay.model_dump())
+        return replay
+
+    async def get_build_parameters(self, *, fullname: str, number: int) -> dict:
+        """Get the build parameters of a specific build."""
+        folder, name = self._parse_fullname(fullname)
+        data = await self._get_build_json(
+            fullname,
+            number,
+            rest_endpoint.BUILD_PARAMETERS(folder=folder, name=name, number=number),
+            ttl=TTL_BUILD_RUNNING,
+        )
+        return self._parse_build_parameters(data)
+
+    async def get_build_test_report(self, *, fullname: str, number: int, depth: int = 0) -> dict:
+        """Get the test report of a specific build."""
+        folder, name = self._parse_fullname(fullname)
+        return await self._get_build_json(
+            fullname,
+            number,
+            rest_endpoint.BUILD_TEST_REPORT(folder=folder, name=name, number=number, depth=depth),
+            ttl=TTL_BUILD_RUNNING,
+        )
+
+    async def get_build_artifacts(self, *, fullname: str, number: int) -> list[Artifact]:
+        """Get the list of artifacts from a specific build."""
+        folder, name = self._parse_fullname(fullname)
+        data = await self._get_json(
+            rest_endpoint.BUILD_ARTIFACTS(folder=folder, name=name, number=number), ttl=TTL_BUILD_RUNNING
+        )
+        return [Artifact.model_validate(a) for a in data.get('artifacts', [])]
+
+    async def get_build_artifact(self, *, fullname: str, number: int, relative_path: str) -> bytes:
+        """Download the content of a specific artifact from a build."""
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request(
+            'GET',
+            rest_endpoint.BUILD_ARTIFACT(folder=folder, name=name, number=number, relative_path=relative_path),
+        )
+        return response.content
+
+    async def get_build_artifact_url(self, *, fullname: str, number: int, relative_path: str) -> str:
+        """Get the direct URL of a specific artifact from a build."""
+        folder, name = self._parse_fullname(fullname)
+        return self.endpoint_url(
+            rest_endpoint.BUILD_ARTIFACT(folder=folder, name=name, number=number, relative_path=relative_path),
+        )
+
+    async def get_running_builds(self) -> list[Build]:
+        """Get all running builds across all nodes."""
+        data = await self._get_json(rest_endpoint.RUNNING_BUILDS, ttl=TTL_NODE)
+        return self._parse_running_builds(data.get('computer', []))
+
+    async def get_item(self, *, fullname: str, depth: int = 0, fields: str | None = None) -> ItemType:
+        """Get item by its fullname."""
+        folder, name = self._parse_fullname(fullname)
+        tree = model_tree(*ITEM_MODELS, depth=depth, fields=fields)
+        data = await self._get_json(rest_endpoint.ITEM(folder=folder, name=name, tree=tree), ttl=TTL_ITEM)
+        return serialize_item(data)
+
+    async def get_last_build_number(self, *, fullname: str) -> int | None:
+        """Get the number of the last build of a job, None if it never ran."""
+        folder, name = self._parse_fullname(fullname)
+        data = await self._get_json(rest_endpoint.ITEM_LAST_BUILD(folder=folder, name=name), ttl=TTL_LAST_BUILD)
+        return (data.get('lastBuild') or {}).get('number')
+
+    async def get_item_config(self, *, fullname: str) -> str:
+        """Get item configuration by its fullname."""
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request('GET', rest_endpoint.ITEM_CONFIG(folder=folder, name=name))
+        return response.text
+
+    async def set_item_config(self, *, fullname: str, config_xml: str) -> None:
+        """Set item configuration by its fullname."""
+        folder, name = self._parse_fullname(fullname)
+        await self.request(
+            'POST',
+            rest_endpoint.ITEM_CONFIG(folder=folder, name=name),
+            headers=self.DEFAULT_HEADERS,
+            data=config_xml,
+        )
+        self._cache.invalidate(self._item_cache_prefix(fullname))
+
+    async def query_items(
+        self,
+        *,
+        folder_depth: int | None = None,
+        class_pattern: str | None = None,
+        fullname_pattern: str | None = None,
+        color_pattern: str | None = None,
+        max_staleness: float | None = None,
+    ) -> list[ItemType]:
+        """Query items by specific field patterns, out of an item mirror synced in the background."""
+        index = await self._get_item_index(max_staleness, folder_depth)
+        return index.query(
+            folder_depth=folder_depth,
+            class_pattern=class_pattern,
+            fullname_pattern=fullname_pattern,
+            color_pattern=color_pattern,
+        )
+
+    async def _get_item_index(self, max_staleness: float | None, folder_depth: int | None) -> ItemIndex:
+        index = self._item_index
+        if index is None or self._item_mirror.needs_sync(folder_depth=folder_depth, max_staleness=max_staleness):
+            async with self._item_index_sync_lock:
+                # Another query may have synced the mirror while this one waited
+                if self._item_index is None or self._item_mirror.needs_sync(
+                    folder_depth=folder_depth, max_staleness=max_staleness
+                ):
+                    self._item_mirror.widen(folder_depth)
+                    return await self._sync_item_index(max_age=max_staleness)
+                return self._item_index
+
+        if index.age() >= TTL_ITEM_INDEX and (self._item_index_refresh is None or self._item_index_refresh.done()):
+            self._item_index_refresh = asyncio.create_task(self._sync_item_index_quietly())
+        return index
+
+    async def _sync_item_index(self, *, max_age: float | None = None) -> ItemIndex:
+        """List the folders of the item mirror that are due, and the new sub-folders they reveal, then reindex."""
+        semaphore = asyncio.Semaphore(self.crawl_concurrency or CRAWL_CONCURRENCY)
+
+        async def list_folder(fullname: str) -> tuple[tuple, list[ItemType], list[str]]:
+            # Not cached: the mirror decides when a folder is listed again
+            endpoint = rest_endpoint.ITEMS(folder=self._crawl_folder_url(fullname), query=SYNC_ITEMS_QUERY)
+            async with semaphore:
+                batches = [
+                    self._parse_synced_items(jobs, fullname=fullname)
+                    async for jobs in self._iter_json_array(endpoint, 'jobs')
+                ]
+            return self._merge_synced_items(batches)
+
+        listed = set()
+        while due := [fullname for fullname in self._item_mirror.due(max_age=max_age) if fullname not in listed]:
+            listed.update(due)
+            listings = await asyncio.gather(*(list_folder(fullname) for fullname in due))
+            for fullname, (signature, items, folders) in zip(due, listings, strict=True):
+                self._item_mirror.update(fullname, signature=signature, items=items, folders=folders)
+
+        self._item_index = ItemIndex(self._item_mirror.items())
+        return self._item_index
+
+    async def _sync_item_index_quietly(self) -> None:
+        try:
+            async with self._item_index_sync_lock:
+                await self._sync_item_index()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f'Failed to sync the item index, keeping the previous one: {e}')
+
+    async def get_items_page(
+        self,
+        *,
+        folder_depth: int | None = None,
+        class_pattern: str | None = None,
+        fullname_pattern: str | None = None,
+        color_pattern: str | None = None,
+        page_size: int = ITEM_PAGE_SIZE,
+        cursor: str | None = None,
+        max_staleness: float | None = None,
+    ) -> ItemPage:
+        """Page through the items of the Jenkins instance, optionally filtered, out of a cached snapshot."""
+        if page_size < 1:
+            raise ValueError(f'Invalid page size: {page_size}, it must be 1 or more')
+
+        if cursor is not None:
+            snapshot, offset = self._parse_page_cursor(cursor)
+            items = self._item_snapshots.get(snapshot)
+            if items is None:
+                raise ValueError(f'Expired page cursor: {cursor}, request the first page again')
+            return self._item_page(snapshot, items, offset, page_size)
+
+        items = await self.query_items(
+            folder_depth=folder_depth,
+            class_pattern=class_pattern,
+            fullname_pattern=fullname_pattern,
+            color_pattern=color_pattern,
+            max_staleness=max_staleness,
+        )
+
+        snapshot = secrets.token_urlsafe(8)
+        self._item_snapshots.set(snapshot, items, ttl=TTL_ITEM_SNAPSHOT)
+        return self._item_page(snapshot, items, 0, page_size)
+
+    async def build_item(
+        self,
+        *,
+        fullname: str,
+        build_type: Literal['build', 'buildWithParameters'],
+        data: dict | None = None,
+    ) -> int:
+        """Trigger a build for a specific item and return its queue item number."""
+        folder, name = self._parse_fullname(fullname)
+        response = await self.request(
+            'POST',
+            rest_endpoint.ITEM_BUILD(folder=folder, name=name, build_type=build_type),
+            data=data,
+        )
+        self._cache.invalidate(self._item_cache_prefix(fullname), 'queue/')
+
+        return self._parse_queue_item_number(response.headers.get('Location', None))
+
+    async def get_plugins(self, *, depth: int = 0, fields: str | None = None) -> list[dict]:
+        """Get a list of all installed plugins."""
+        data = await self._get_json(self._plugin_list_endpoint(depth=depth, fields=fields), ttl=TTL_PLUGIN)
+        return data.get('plugins', [])
+
+    async def get_plugin(self, *, short_name: str, depth: int = 2, fields: str | None = None) -> dict | None:
+        """Get a specific plugin by short name."""
+        for plugin in await self.get_plugins(depth=depth, fields=fields):
+            if plugin.get('shortName') == short_name:
+                return plugin
+        return None
+
+    async def get_plugins_with_problems(self) -> list[dict]:
+        """Get a list of plugins that have dependency problems."""
+        jenkins_version = await self._get_jenkins_version()
+        plugins = await self.get_plugins(depth=2)
+        return self._find_plugin_problems(plugins, jenkins_version)
+
+    async def get_plugins_with_updates(self, depth: int = 0) -> list[dict]:
+        """Get plugins that have available updates."""
+        return self._filter_plugins_with_updates(await self.get_plugins(depth=depth))
+
+    async def get_plugins_with_backup(self, depth: int = 0) -> list[dict]:
+        """Get plugins that can be downgraded."""
+        return self._filter_plugins_with_backup(await self.get_plugins(depth=depth))
+
+    async def _get_jenkins_version(self) -> str:
+        """Get the Jenkins core version from response header."""
+        response = await self.request('GET', '', crumb=False)
+        return response.headers.get('X-Jenkins', '')
+
+    async def get_plugin_dependency_graph(self, short_name: str) -> dict:
+        """Get dependency graph for a specific plugin in Graphviz format."""
+        return self._build_plugin_dependency_graph(await self.get_plugins(depth=2), short_name)
+
+    async def run_script(self, script: str) -> str:
+        """Execute a Groovy script on Jenkins."""
+        response = await self.request('POST', rest_endpoint.SCRIPT_TEXT, data={'script': script})
+        # A script can change anything
+        self._cache.clear()
+        return self._parse_script_result(response.text)
@@ -0,0 +1,428 @@
+import base64
+import binascii
+import re
+from collections.abc import Mapping
+from urllib.parse import quote
+
+from bs4 import BeautifulSoup
+
+from mcp_jenkins.jenkins import rest_endpoint
+from mcp_jenkins.jenkins.console import encode_cursor, split_console_chunk
+from mcp_jenkins.jenkins.model.build import Build, BuildReplay, ConsoleChunk
+from mcp_jenkins.jenkins.model.item import (
+    ItemPage,
+    ItemType,
+    serialize_items,
+)
+from mcp_jenkins.jenkins.model.plugin import Plugin
+from mcp_jenkins.jenkins.tree import model_tree
+
+# Default number of items per page of a paged item listing
+ITEM_PAGE_SIZE = 100
+# Number of item snapshots kept for page cursors at once
+ITEM_SNAPSHOTS = 8
+# Tree query of one folder level synced by the item mirror, lastBuild tells the jobs that ran since
+SYNC_ITEMS_QUERY = 'jobs[url,color,name,lastBuild[number],jobs[name]]'
+# Default number of folders listed at once when syncing the item mirror
+CRAWL_CONCURRENCY = 8
+
+
+class JenkinsBase:
+    """Transport independent helpers shared by the sync and async Jenkins clients.
+
+    Everything in here is pure: it builds URLs or turns Jenkins payloads into models,
+    so the same parsing rules apply whichever HTTP stack sent the request.
+    """
+
+    DEFAULT_HEADERS = {'Content-Type': 'text/xml; charset=utf-8'}
+
+    url: str
+
+    def endpoint_url(self, endpoint: str) -> str:
+        """Construct the full URL for a given Jenkins REST endpoint.
+
+        Args:
+            endpoint: The Jenkins REST endpoint path.
+
+        Returns:
+            The full URL as a string. (e.g., https://example.com/crumbIssuer/api/json)
+        """
+        return '/'.join(str(s).strip('/') for s in [self.url, endpoint])
+
+    def _parse_fullname(self, fullname: str) -> tuple[str, str]:
+        """Parse a fullname into folder URL and short name.
+
+        Args:
+            fullname: A string representing the full path (e.g., "folder1/folder2/name").
+
+        Returns:
+            A tuple containing:
+                - folder: The constructed folder URL (e.g., "job/folder1/job/folder2/").
+                - name: The last component of the path (e.g., "name").
+        """
+        parts = fullname.split('/')
+        name = parts[-1]
+        folder = f'job/{"/job/".join(parts[:-1])}/' if len(parts) > 1 else ''
+        return folder, name
+
+    def _item_cache_prefix(self, fullname: str) -> str:
+        """The endpoint prefix shared by an item and everything below it (config, builds)."""
+        folder, name = self._parse_fullname(fullname)
+        return f'{folder}job/{name}/'
+
+    def _build_view_path(self, view_path: str) -> str:
+        """Build a Jenkins view URL path from a slash-separated view path.
+
+        Args:
+            view_path: Slash-separated view path (e.g. "frontend/nightly").
+
+        Returns:
+            The Jenkins URL path segment (e.g. "view/frontend/view/nightly").
+        """
+        parts = [quote(p.strip(), safe='') for p in view_path.split('/') if p.strip()]
+        return '/'.join(f'view/{p}' for p in parts)
+
+    def _plugin_list_endpoint(self, *, depth: int, fields: str | None = None) -> str:
+        """Build the plugin list endpoint projecting the fields of the Plugin model.
+
+        The plugins are exported one level below the plugin manager, so the plugin
+        fields start expanding at ``depth=1`` (dependencies need ``depth=2``).
+        """
+        return rest_endpoint.PLUGIN_LIST_TREE(tree=model_tree(Plugin, depth=max(depth - 1, 0), fields=fields))
+
+    def _parse_running_builds(self, computers: list[dict]) -> list[Build]:
+        """Collect the builds currently occupying an executor of any computer.
+
+        Pipelines run their flyweight part on one-off executors, which are listed apart
+        from the regular executors, so both are scanned.
+        """
+        builds, seen = [], set()
+
+        for computer in computers:
+            for executor in [*computer.get('executors', []), *computer.get('oneOffExecutors', [])]:
+                executable = (executor or {}).get('currentExecutable')
+                if not executable or not executable.get('number') or executable.get('url') in seen:
+                    continue
+
+                seen.add(executable.get('url'))
+                builds.append(Build.model_validate(executable))
+
+        return builds
+
+    def _parse_console_chunk(self, number: int, start: int, data: bytes, headers: Mapping[str, str]) -> ConsoleChunk:
+        """Turn a ``progressiveText`` response read from ``start`` into a chunk with the cursor of the next read.
+
+        ``X-Text-Size`` is the byte offset the response ends at and ``X-More-Data`` tells whether
+        the build is still writing to its log.
+        """
+        size = int(headers.get('X-Text-Size', start + len(data)))
+        more_data = headers.get('X-More-Data', '').lower() == 'true'
+
+        text, offset = split_console_chunk(start, data, size=size, more_data=more_data)
+        return ConsoleChunk(text=text, cursor=encode_cursor(number, offset), more_data=more_data)
+
+    def _parse_build_replay(self, html: str) -> BuildReplay:
+        """Extract the pipeline scripts from the HTML of a build replay page."""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        scripts = [textarea.text for textarea in soup.find_all('textarea', {'name': re.compile(r'_\..*Script.*')})]
+        return BuildReplay(scripts=scripts)
+
+    def _parse_build_parameters(self, data: dict) -> dict:
+        """Flatten the parameters action of a build into a name → value mapping."""
+        for action in data.get('actions', []):
+            if 'parameters' in action:
+                return {p['name']: p.get('value') for p in action['parameters']}
+        return {}
+
+    def _crawl_folder_url(self, fullname: str) -> str:
+        """The folder URL whose items the item mirror lists, the root of the instance for an empty fullname."""
+        return '/'.join(f'job/{name}' for name in fullname.split('/')) if fullname else ''
+
+    def _parse_synced_items(self, jobs: list[dict], *, fullname: str) -> tuple[tuple, list[ItemType], list[str]]:
+        """Turn the items of a folder listed by the item mirror into its signature, items and sub-folders.
+
+        The signature changes whenever a child is added, removed, recolored or built, so comparing
+        it with the previous one tells whether the folder changed. The folders come without ``jobs``:
+        their children are items of their own once the folder is listed.
+
+        Args:
+            jobs: The ``jobs`` list of a :data:`SYNC_ITEMS_QUERY` response, or a batch of it.
+            fullname: The fullname of the listed folder, empty for the root of the instance.
+
+        Returns:
+            The signature, the items and the fullnames of the non empty sub-folders.
+        """
+        signature = tuple(
+            (
+                job.get('_class'),
+                job['name'],
+                job.get('color'),
+                (job.pop('lastBuild', None) or {}).get('number'),
+                len(job.get('jobs') or ()),
+            )
+            for job in jobs
+        )
+        folders = []
+        for item in jobs:
+            item_fullname = f'{fullname}/{item["name"]}' if fullname else item['name']
+            if 'fullName' not in item:
+                item.setdefault('fullname', item_fullname)
+            if item.pop('jobs', None):
+                folders.append(item_fullname)
+
+        return signature, serialize_items(jobs), folders
+
+    @staticmethod
+    def _merge_synced_items(
+        batches: list[tuple[tuple, list[ItemType], list[str]]],
+    ) -> tuple[tuple, list[ItemType], list[str]]:
+        """Join the signatures, items and sub-folders of a folder listing parsed batch by batch."""
+        return (
+            tuple(entry for signature, _, _ in batches for entry in signature),
+            [item for _, items, _ in batches for item in items],
+            [folder for _, _, folders in batches for folder in folders],
+        )
+
+    def _item_page(self, snapshot: str, items: list[ItemType], offset: int, page_size: int) -> ItemPage:
+        """Slice a page out of an item snapshot, with the cursor of the next page unless it is the last."""
+        end = offset + page_size
+        next_cursor = base64.urlsafe_b64encode(f'{snapshot}:{end}'.encode()).decode() if end < len(items) else None
+        return ItemPage(items=items[offset:end], next_cursor=next_cursor, total=len(items))
+
+    def _parse_page_cursor(self, cursor: str) -> tuple[str, int]:
+        """Split a cursor of :meth:`_item_page` into its snapshot and offset.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            snapshot, offset = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit(':', 1)
+            if int(offset) >= 0:
+                return snapshot, int(offset)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            pass
+        raise ValueError(f'Invalid page cursor: {cursor}')
+
+    def _parse_queue_item_number(self, location: str | None) -> int:
+        """Extract the queue item number from the Location header of a build trigger."""
+        return int(location.strip('/').split('/')[-1])
+
+    def _parse_script_result(self, result: str) -> str:
+        """Strip the ``Result: `` prefix Jenkins adds to the output of a Groovy script."""
+        result_prefix = 'Result: '
+        if result.startswith(result_prefix):
+            return result[len(result_prefix) :].rstrip('\n')
+        return result
+
+    def _find_plugin_problems(self, plugins: list[dict], jenkins_version: str) -> list[dict]:
+        """Check each plugin's core requirement and dependencies against the installed plugins.
+
+        Args:
+            plugins: The installed plugins, fetched with depth >= 2 so dependencies are included.
+            jenkins_version: The Jenkins core version.
+
+        Returns:
+            A list of plugins with dependency problems.
+        """
+        installed = {p['shortName']: p for p in plugins}
+
+        problems = []
+        for plugin in plugins:
+            short_name = plugin.get('shortName', '')
+            version = plugin.get('version', '')
+            required_core = plugin.get('requiredCoreVersion', '')
+
+            if required_core and jenkins_version:
+                if not self._is_core_compatible(jenkins_version, required_core):
+                    problems.append(
+                        {
+                            'shortName': short_name,
+                            'problem': 'incompatible_core_version',
+                            'pluginVersion': version,
+                            'requiredCoreVersion': required_core,
+                            'jenkinsVersion': jenkins_version,
+                            'severity': 'error',
+                            'message': (
+                                f'Plugin requires Jenkins {required_core}, but current version is {jenkins_version}'
+                            ),
+                        }
+                    )
+
+            if not plugin.get('enabled'):
+                problems.append(
+                    {
+                        'shortName': short_name,
+                        'problem': 'plugin_disabled',
+                        'pluginVersion': version,
+                        'severity': 'warning',
+                        'message': 'Plugin is currently disabled',
+                    }
+                )
+
+            deps = plugin.get('dependencies', [])
+            for dep in deps:
+                dep_name = dep.get('shortName', '')
+                dep_version = dep.get('version', '')
+                is_optional = dep.get('optional', False)
+                is_bundled = dep.get('bundled', False)
+
+                if dep_name not in installed:
+                    if is_optional:
+                        problems.append(
+                            {
+                                'shortName': short_name,
+                                'problem': 'missing_optional_dependency',
+                                'dependency': dep_name,
+                                'requiredVersion': dep_version,
+                                'severity': 'info',
+                                'message': f'Missing optional dependency: {dep_name}',
+                            }
+                        )
+                    elif not is_bundled:
+                        problems.append(
+                            {
+                                'shortName': short_name,
+                                'problem': 'missing_dependency',
+                                'dependency': dep_name,
+                                'requiredVersion': dep_version,
+                                'severity': 'error',
+                                'message': f'Missing required dependency: {dep_name}',
+                            }
+                        )
+                else:
+                    installed_ver = installed[dep_name].get('version', '')
+                    if dep_version and installed_ver and installed_ver != dep_version:
+                        if self._is_version_greater(installed_ver, dep_version):
+                            continue
+                        if is_optional:
+                            problems.append(
+                                {
+                                    'shortName': short_name,
+                                    'problem': 'version_mismatch_optional',
+                                    'dependency': dep_name,
+                                    'requiredVersion': dep_version,
+                                    'installedVersion': installed_ver,
+                                    'severity': 'info',
+                                    'message': (
+                                        f'Optional dependency {dep_name} version mismatch: '
+                                        f'required {dep_version}, installed {installed_ver}'
+                                    ),
+                                }
+                            )
+                        else:
+                            problems.append(
+                                {
+                                    'shortName': short_name,
+                                    'problem': 'version_mismatch',
+                                    'dependency': dep_name,
+                                    'requiredVersion': dep_version,
+                                    'installedVersion': installed_ver,
+                                    'severity': 'error',
+                                    'message': (
+                                        f'Dependency {dep_name} version mismatch: '
+                                        f'required {dep_version}, installed {installed_ver}'
+                                    ),
+                                }
+                            )
+
+        return problems
+
+    def _filter_plugins_with_updates(self, plugins: list[dict]) -> list[dict]:
+        """Summarize the plugins that have an update available."""
+        return [
+            {
+                'shortName': p.get('shortName'),
+                'longName': p.get('longName'),
+                'version': p.get('version'),
+            }
+            for p in plugins
+            if p.get('hasUpdate')
+        ]
+
+    def _filter_plugins_with_backup(self, plugins: list[dict]) -> list[dict]:
+        """Summarize the plugins that have a backupVersion and can be rolled back."""
+        return [
+            {
+                'shortName': p.get('shortName'),
+                'longName': p.get('longName'),
+                'version': p.get('version'),
+                'backupVersion': p.get('backupVersion'),
+                'downgradable': p.get('downgradable'),
+            }
+            for p in plugins
+            if p.get('backupVersion') and p.get('downgradable')
+        ]
+
+    def _is_core_compatible(self, jenkins_ver: str, required_ver: str) -> bool:
+        """Check if Jenkins version is compatible with required core version."""
+        if not isinstance(jenkins_ver, str) or not isinstance(required_ver, str):
+            return True
+
+        def normalize_version(v: str) -> tuple:
+            parts = v.split('.')
+            return tuple(int(p) if p.isdigit() else 0 for p in parts[:3])
+
+        core = normalize_version(jenkins_ver)
+        required = normalize_version(required_ver)
+        return core >= required
+
+    def _is_version_greater(self, installed_ver: str, required_ver: str) -> bool:
+        """Check if installed version is greater than required version."""
+        if not isinstance(installed_ver, str) or not isinstance(required_ver, str):
+            return False
+
+        def normalize_version(v: str) -> tuple:
+            parts = v.split('.')
+            return tuple(int(p) if p.isdigit() else 0 for p in parts[:3])
+
+        installed = normalize_version(installed_ver)
+        required = normalize_version(required_ver)
+        return installed > required
+
+    def _build_plugin_dependency_graph(self, plugins: list[dict], short_name: str) -> dict:
+        """Recursively walk the dependencies of a plugin down to leaf nodes.
+
+        Args:
+            plugins: The installed plugins, fetched with depth >= 2 so dependencies are included.
+            short_name: The short name of the plugin to analyze.
+
+        Returns:
+            A dictionary containing 'nodes' and 'edges' for Graphviz rendering.
+        """
+        installed = {p['shortName']: p for p in plugins}
+
+        if short_name not in installed:
+            return {'nodes': [], 'edges': [], 'error': f'Plugin not found: {short_name}'}
+
+        nodes = []
+        edges = []
+        visited = set()
+
+        def traverse(name: str) -> None:
+            if name in visited:
+                return
+            visited.add(name)
+
+            if name not in installed:
+                nodes.append({'id': name, 'label': name, 'status': 'missing'})
+                return
+
+            plugin = installed[name]
+            nodes.append(
+                {
+                    'id': name,
+                    'label': f'{name}\n({plugin.get("version", "?")})',
+                    'status': 'installed',
+                }
+            )
+
+            deps = plugin.get('dependencies', [])
+            for dep in deps:
+                dep_name = dep.get('shortName', '')
+                edges.append({'from': name, 'to': dep_name})
+                traverse(dep_name)
+
+        traverse(short_name)
+
+        return {'nodes': nodes, 'edges': edges}
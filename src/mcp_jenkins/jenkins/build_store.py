@@ -0,0 +1,244 @@
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import quote
+
+from loguru import logger
+
+from mcp_jenkins.jenkins.console import decode_line
+
+FINISHED_MARKER = 'finished'
+CONSOLE_LOG = 'console.log'
+# Console logs of finished builds are downloaded to disk in chunks of this size
+CONSOLE_CHUNK_SIZE = 64 * 1024
+CONSOLE_INDEX = 'console-index'
+# The line index of a console log records the byte offset of every Nth line
+CONSOLE_INDEX_STRIDE = 1000
+# Size the store of one server and user may grow to before the least recently used builds are evicted
+BUILD_STORE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class BuildStore:
+    """On-disk cache of the data of finished builds.
+
+    Once a build stops building its metadata, test report, parameters, replay and console log
+    never change, so they are kept under ``<root>/<server>/<job>/<number>/`` and survive restarts.
+    ``<server>`` hashes the Jenkins url and username, as permissions differ between users.
+    Only finished builds are written, a build directory carries a marker once a client saw the
+    build finished. Files are written atomically and the whole directory can be deleted at any time.
+
+    The store of a server and user is capped at ``max_bytes``: once a write goes over, the builds
+    least recently read or written are deleted until it fits again. Reads touch the build directory,
+    so its modification time orders the builds.
+
+    A store without ``root`` is disabled: lookups miss and writes are dropped.
+    """
+
+    def __init__(self, root: Path | None, *, url: str, username: str, max_bytes: int = BUILD_STORE_MAX_BYTES) -> None:
+        self.root = None
+        if root is not None:
+            server = hashlib.sha256(f'{url.rstrip("/")}\n{username}'.encode()).hexdigest()[:16]
+            self.root = Path(root) / server
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Measured from the disk on the first write
+        self._size: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def _build_dir(self, fullname: str, number: int) -> Path:
+        return self.root / quote(fullname, safe='') / str(number)
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        return f'{hashlib.sha1(key.encode()).hexdigest()[:16]}.json'  # noqa: S324
+
+    def is_finished(self, fullname: str, number: int) -> bool:
+        """Whether the build was already seen finished."""
+        return self.enabled and (self._build_dir(fullname, number) / FINISHED_MARKER).exists()
+
+    def mark_finished(self, fullname: str, number: int) -> None:
+        if not self.enabled:
+            return
+
+        build_dir = self._build_dir(fullname, number)
+        try:
+            build_dir.mkdir(parents=True, exist_ok=True)
+            (build_dir / FINISHED_MARKER).touch()
+        except OSError as e:
+            logger.warning(f'Failed to write the build cache in {build_dir}: {e}')
+
+    def get(self, fullname: str, number: int, key: str) -> Any | None:  # noqa: ANN401
+        """Get a cached payload of a finished build, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        build_dir = self._build_dir(fullname, number)
+        try:
+            with (build_dir / self._file_name(key)).open(encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable build cache entry of {fullname} #{number}: {e}')
+            return None
+
+        self._touch(build_dir)
+        return data
+
+    def put(self, fullname: str, number: int, key: str, data: Any) -> None:  # noqa: ANN401
+        """Cache a payload of a finished build, marking the build finished."""
+        if not self.enabled:
+            return
+
+        self.mark_finished(fullname, number)
+        try:
+            with self._atomic_write(self._build_dir(fullname, number) / self._file_name(key), mode='w') as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.warning(f'Failed to write the build cache of {fullname} #{number}: {e}')
+
+    def console_log_path(self, fullname: str, number: int) -> Path:
+        return self._build_dir(fullname, number) / CONSOLE_LOG
+
+    def has_console_log(self, fullname: str, number: int) -> bool:
+        return self.enabled and self.console_log_path(fullname, number).exists()
+
+    @contextmanager
+    def write_console_log(self, fullname: str, number: int) -> Iterator[IO[bytes]]:
+        """Open the console log of a finished build for writing, it only appears once fully written."""
+        self.mark_finished(fullname, number)
+        with self._atomic_write(self.console_log_path(fullname, number), mode='wb') as f:
+            yield f
+
+    def console_index(self, fullname: str, number: int) -> list[int]:
+        """Get the byte offsets of every ``CONSOLE_INDEX_STRIDE``-th line of a cached console log.
+
+        The index is built by one scan of the log the first time it is needed and kept next to it.
+        """
+        index = self.get(fullname, number, CONSOLE_INDEX)
+        if index is not None:
+            return index
+
+        index, position = [], 0
+        with self.console_log_path(fullname, number).open('rb') as f:
+            for line_number, line in enumerate(f):
+                if line_number % CONSOLE_INDEX_STRIDE == 0:
+                    index.append(position)
+                position += len(line)
+
+        self.put(fullname, number, CONSOLE_INDEX, index)
+        return index
+
+    @contextmanager
+    def map_console_log(self, fullname: str, number: int) -> Iterator[mmap.mmap | bytes]:
+        """Map a cached console log read-only into memory.
+
+        Pages are loaded on access and belong to the OS page cache, so reading a log of any size
+        keeps the memory of the process flat and repeated reads never copy it onto the heap.
+        """
+        path = self.console_log_path(fullname, number)
+        with path.open('rb') as f:
+            self._touch(path.parent)
+            if not os.fstat(f.fileno()).st_size:
+                # An empty file cannot be mapped
+                yield b''
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                yield log
+
+    def iter_console_log(self, fullname: str, number: int, *, start: int = 0) -> Iterator[str]:
+        """Iterate the lines of a cached console log, without their line endings.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The number of the build.
+            start: The number of lines to skip, the line index jumps close to the first one read.
+        """
+        block, position = start // CONSOLE_INDEX_STRIDE, 0
+        if block:
+            index = self.console_index(fullname, number)
+            if block >= len(index):
+                return
+            position = index[block]
+
+        line_number = block * CONSOLE_INDEX_STRIDE
+        with self.map_console_log(fullname, number) as log:
+            size = len(log)
+            while position < size:
+                end = log.find(b'\n', position)
+                if end == -1:
+                    end = size
+                if line_number >= start:
+                    yield decode_line(log[position:end])
+                position, line_number = end + 1, line_number + 1
+
+    @staticmethod
+    def _touch(build_dir: Path) -> None:
+        with suppress(OSError):
+            os.utime(build_dir)
+
+    @staticmethod
+    def _dir_size(build_dir: Path) -> int:
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(build_dir) if entry.is_file())
+        except OSError:
+            return 0
+
+    def _build_dirs(self) -> list[Path]:
+        """The build directories of the store, least recently used first."""
+        build_dirs = []
+        for path in self.root.glob('*/*'):
+            try:
+                build_dirs.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        return [path for _, path in sorted(build_dirs)]
+
+    def _grow(self, build_dir: Path, size: int) -> None:
+        """Account ``size`` more bytes written in ``build_dir``, evicting other builds when over budget."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(self._dir_size(path) for path in self._build_dirs())
+            else:
+                self._size += size
+            if self._size <= self.max_bytes:
+                return
+
+            for path in self._build_dirs():
+                if path == build_dir:
+                    continue
+                self._size -= self._dir_size(path)
+                shutil.rmtree(path, ignore_errors=True)
+                with suppress(OSError):
+                    # The directory of the job, once its last build is gone
+                    path.parent.rmdir()
+                logger.debug(f'Evicted {path} from the build cache')
+                if self._size <= self.max_bytes:
+                    break
+
+    @contextmanager
+    def _atomic_write(self, path: Path, *, mode: str) -> Iterator[IO]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        try:
+            with os.fdopen(fd, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+                yield f
+            size = Path(tmp_path).stat().st_size - (path.stat().st_size if path.exists() else 0)
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._grow(path.parent, size)
@@ -0,0 +1,109 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Seconds a cached response stays fresh, by kind of resource
+TTL_BUILD_FINISHED = 3600
+TTL_BUILD_RUNNING = 5
+TTL_ITEM = 30
+TTL_LAST_BUILD = 5
+TTL_VIEW = 60
+TTL_NODE = 5
+TTL_QUEUE = 2
+TTL_PLUGIN = 300
+# Seconds the item list behind a page cursor stays available
+TTL_ITEM_SNAPSHOT = 300
+# Seconds after which the item index is synced in the background, queries keep using it meanwhile
+TTL_ITEM_INDEX = 10
+
+TTL = float | Callable[[Any], float]
+
+
+def build_ttl(data: dict) -> float:
+    """A finished build never changes, a running one (or one without ``building`` in its projection) does."""
+    return TTL_BUILD_FINISHED if data.get('building') is False else TTL_BUILD_RUNNING
+
+
+class ResponseCache:
+    """LRU cache of Jenkins responses, keyed by endpoint, with a TTL per entry.
+
+    The clients cache raw response bodies and decode them on every hit, since the parsing
+    helpers mutate the payloads they are handed and copying a decoded payload costs more than
+    decoding it again. Other values are deep copied in and out, unless ``copy`` is False for
+    values nobody mutates. Write methods drop the entries of the resources they touch with
+    :meth:`invalidate`. A ``max_size`` of 0 disables the cache.
+
+    ``max_bytes`` also bounds the total length of the values, for caches of bytes or text: the least
+    recently used entries are dropped to fit a new one, and a value longer than ``max_bytes`` on its
+    own is not cached. 0 leaves the total unbounded.
+    """
+
+    def __init__(self, *, max_size: int = 256, max_bytes: int = 0, copy: bool = True) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.copy = copy
+
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Get a fresh cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                self._drop(key)
+                return None
+
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value) if self.copy else value
+
+    def set(self, key: str, value: Any, *, ttl: TTL) -> None:  # noqa: ANN401
+        """Cache a value, ``ttl`` is either seconds or a callable computing them from the value."""
+        if not self.max_size:
+            return
+
+        seconds = ttl(value) if callable(ttl) else ttl
+        if seconds <= 0:
+            return
+
+        size = len(value) if self.max_bytes else 0
+        if size > self.max_bytes:
+            return
+
+        if self.copy:
+            value = copy.deepcopy(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + seconds, value)
+            self._size += size
+            while len(self._entries) > self.max_size or self._size > self.max_bytes > 0:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop every entry whose endpoint starts with one of the prefixes."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefixes)]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        # Callers hold the lock
+        _, value = self._entries.pop(key)
+        if self.max_bytes:
+            self._size -= len(value)
@@ -0,0 +1,93 @@
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# Probe idle connections after 60s, every 10s, give up after 5 failed probes
+TCP_KEEPALIVE_IDLE = 60
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 5
+
+
+def socket_options(*, tcp_keepalive: bool) -> list[tuple[int, int, int]]:
+    """Socket options for connections to Jenkins.
+
+    Args:
+        tcp_keepalive: Whether to enable TCP keep-alive probes, so idle pooled connections
+            dropped by a proxy or firewall are detected instead of failing the next request.
+
+    Returns:
+        A list of ``(level, option, value)`` tuples accepted by urllib3 and httpx.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    if not tcp_keepalive:
+        return options
+
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # The tuning knobs are not available on every platform (e.g. TCP_KEEPIDLE is missing on macOS)
+    for name, value in (
+        ('TCP_KEEPIDLE', TCP_KEEPALIVE_IDLE),
+        ('TCP_KEEPINTVL', TCP_KEEPALIVE_INTERVAL),
+        ('TCP_KEEPCNT', TCP_KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+    return options
+
+
+class PoolUsage:
+    """Count in-flight requests and warn when they exceed the connection pool size.
+
+    Requests beyond ``max_connections`` either open a throwaway connection or wait for a free
+    one, so a sustained warning means the pool should be enlarged. Warnings are rate limited
+    to one per ``warn_interval`` seconds.
+    """
+
+    def __init__(self, *, max_connections: int, warn_interval: float = 60) -> None:
+        self.max_connections = max_connections
+        self.warn_interval = warn_interval
+
+        self.in_flight = 0
+        self._last_warning = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        with self._lock:
+            self.in_flight += 1
+            if self.in_flight > self.max_connections:
+                now = time.monotonic()
+                if self._last_warning is None or now - self._last_warning >= self.warn_interval:
+                    self._last_warning = now
+                    logger.warning(
+                        f'Jenkins connection pool saturated: {self.in_flight} requests in flight '
+                        f'for {self.max_connections} pooled connections, consider raising --jenkins-max-connections'
+                    )
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class JenkinsHTTPAdapter(HTTPAdapter):
+    """``requests`` adapter with a sized connection pool, custom socket options and saturation logging."""
+
+    def __init__(self, *, max_connections: int, tcp_keepalive: bool) -> None:
+        self.socket_options = socket_options(tcp_keepalive=tcp_keepalive)
+        self.usage = PoolUsage(max_connections=max_connections)
+        super().__init__(pool_maxsize=max_connections)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, *args, **kwargs):  # noqa: ANN002, ANN003, ANN201
+        with self.usage.track():
+            return super().send(*args, **kwargs)
@@ -0,0 +1,324 @@
+import base64
+import binascii
+import functools
+import re
+from collections import deque
+from collections.abc import Iterator
+
+from mcp_jenkins.jenkins.model.build import ConsoleMatch
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parser
+except ImportError:  # pragma: no cover - private modules of the stdlib, without them nothing is prefiltered
+    sre_constants = sre_parser = None
+
+
+# Size of the first window read from the end of a log in tail mode, it grows 4x per miss
+TAIL_WINDOW = 64 * 1024
+TAIL_GROWTH = 4
+# Size of the blocks of raw bytes scanned at once by the byte level prefilter
+SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def decode_line(line: bytes) -> str:
+    """Decode a raw console line. Every console read splits lines on ``\\n`` and drops a trailing ``\\r``."""
+    return line.rstrip(b'\r').decode('utf-8', errors='replace')
+
+
+def _required_literals(items: list) -> list[str] | None:
+    """Find substrings one of which every match of a parsed pattern contains, None when there are none."""
+    best, best_score, run = None, 0, ''
+
+    def consider(literals: list[str] | None) -> None:
+        nonlocal best, best_score
+        score = min((len(literal) for literal in literals), default=0) if literals else 0
+        if score > best_score:
+            best, best_score = literals, score
+
+    for op, av in [*items, (None, None)]:
+        if op is sre_constants.LITERAL:
+            run += chr(av)
+            continue
+
+        consider([run] if run else None)
+        run = ''
+        if op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            consider(_required_literals(list(av[3])))
+        elif op is sre_constants.BRANCH:
+            branches = [_required_literals(list(branch)) for branch in av[1]]
+            if all(branches):
+                consider([literal for branch in branches for literal in branch])
+
+    return best
+
+
+@functools.lru_cache(maxsize=64)
+def compile_prefilter(*patterns: str) -> re.Pattern[bytes] | None:
+    """Compile a bytes regex finding the literal text any line matching one of the patterns must contain.
+
+    Lines without such text can be skipped without being decoded. The prefilter only narrows
+    the lines down: the candidates still go through the real patterns. Returns None when a
+    pattern has no such text (e.g. ``\\d+``), is case insensitive or its text spans a line break.
+    """
+    if sre_parser is None:
+        return None
+
+    literals = []
+    for pattern in patterns:
+        try:
+            parsed = sre_parser.parse(pattern)
+        except re.error:
+            return None
+
+        required = None if parsed.state.flags & re.IGNORECASE else _required_literals(list(parsed))
+        if not required or any('\n' in literal for literal in required):
+            # A literal line break would find matches across lines, which no line can hold
+            return None
+        literals.extend(required)
+
+    return re.compile(b'|'.join(re.escape(literal.encode()) for literal in literals))
+
+
+def iter_prefiltered_lines(data: bytes, prefilter: re.Pattern[bytes]) -> Iterator[str]:
+    """Decode the lines of a block of raw bytes containing a match of ``prefilter``, skipping the others."""
+    position, size = 0, len(data)
+    while (match := prefilter.search(data, position)) is not None:
+        start = data.rfind(b'\n', 0, match.start()) + 1
+        end = data.find(b'\n', match.end())
+        if end == -1:
+            end = size
+        yield decode_line(data[start:end])
+        position = end + 1
+
+
+class ConsolePrefilter:
+    """Run :func:`iter_prefiltered_lines` over a log arriving in chunks, carrying partial lines over.
+
+    Like :class:`ConsoleLineSplitter`, a partial line is kept as a list of parts joined once it ends.
+    """
+
+    def __init__(self, prefilter: re.Pattern[bytes]) -> None:
+        self.prefilter = prefilter
+        self._rest: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> Iterator[str]:
+        end = chunk.rfind(b'\n')
+        if end == -1:
+            self._rest.append(chunk)
+            return iter(())
+
+        block = b''.join([*self._rest, chunk[:end]])
+        self._rest = [chunk[end + 1 :]]
+        return iter_prefiltered_lines(block, self.prefilter)
+
+    def close(self) -> Iterator[str]:
+        rest, self._rest = b''.join(self._rest), []
+        return iter_prefiltered_lines(rest, self.prefilter)
+
+
+class ConsoleLineSplitter:
+    """Split a log arriving in chunks into lines, skipping the first ``start`` ones without decoding them.
+
+    Lines follow :func:`decode_line`, like the lines of a log read from the build store.
+    A partial line is carried over as a list of parts, so a very long line is joined once.
+    """
+
+    def __init__(self, *, start: int = 0) -> None:
+        self.start = start
+        self._rest: list[bytes] = []
+        self._line_number = 0
+
+    def feed(self, chunk: bytes) -> Iterator[str]:
+        end = chunk.rfind(b'\n')
+        if end == -1:
+            self._rest.append(chunk)
+            return iter(())
+
+        block = b''.join([*self._rest, chunk[:end]])
+        self._rest = [chunk[end + 1 :]]
+        return self._lines(block.split(b'\n'))
+
+    def close(self) -> Iterator[str]:
+        rest, self._rest = b''.join(self._rest), []
+        return self._lines([rest] if rest else [])
+
+    def _lines(self, lines: list[bytes]) -> Iterator[str]:
+        for line in lines:
+            self._line_number += 1
+            if self._line_number > self.start:
+                yield decode_line(line)
+
+
+class ConsoleLineSelector:
+    """Apply the pattern / offset / limit rules of console output to a stream of lines.
+
+    Lines are pushed in one at a time so the same selection works for both blocking
+    and asyncio streams; ``feed`` returns True once enough lines have been collected.
+    With ``max_bytes`` the selection is also ``cut`` before the line that would take it over.
+    """
+
+    def __init__(
+        self, *, pattern: str | None = None, offset: int = 0, limit: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        self.compiled = re.compile(pattern) if pattern else None
+        self.offset = offset
+        self.limit = limit
+        self.max_bytes = max_bytes
+
+        self.matched: list[str] = []
+        self.cut = False
+        self._skipped = 0
+        self._size = 0
+
+    def feed(self, line: str) -> bool:
+        if self.compiled is not None and not self.compiled.search(line):
+            return False
+        if self._skipped < self.offset:
+            self._skipped += 1
+            return False
+
+        if self.max_bytes is not None:
+            self._size += len(line.encode()) + 1
+            if self._size > self.max_bytes and self.matched:
+                self.cut = True
+                return True
+        self.matched.append(line)
+        return self.limit is not None and len(self.matched) >= self.limit
+
+    def result(self) -> str:
+        return '\n'.join(self.matched)
+
+
+class ConsoleGrep:
+    """Match several named patterns against a stream of lines in a single pass.
+
+    Each match keeps its 1-based line number and up to ``before`` / ``after`` lines of context.
+    ``feed`` returns True once every pattern found ``limit`` matches and their context is complete.
+    """
+
+    def __init__(self, *, patterns: dict[str, str], before: int = 0, after: int = 0, limit: int | None = None) -> None:
+        self.compiled = {name: re.compile(pattern) for name, pattern in patterns.items()}
+        self.after = after
+        self.limit = limit
+
+        self.matches: dict[str, list[ConsoleMatch]] = {name: [] for name in patterns}
+        self._previous: deque[str] = deque(maxlen=before)
+        self._pending: list[ConsoleMatch] = []
+        self._line_number = 0
+
+    def _is_full(self, name: str) -> bool:
+        return self.limit is not None and len(self.matches[name]) >= self.limit
+
+    def feed(self, line: str) -> bool:
+        self._line_number += 1
+
+        for match in self._pending:
+            match.after.append(line)
+        self._pending = [match for match in self._pending if len(match.after) < self.after]
+
+        for name, compiled in self.compiled.items():
+            if self._is_full(name) or not compiled.search(line):
+                continue
+
+            match = ConsoleMatch(line=self._line_number, text=line, before=list(self._previous))
+            self.matches[name].append(match)
+            if self.after:
+                self._pending.append(match)
+
+        self._previous.append(line)
+        return not self._pending and all(self._is_full(name) for name in self.compiled)
+
+    def result(self) -> dict[str, list[ConsoleMatch]]:
+        return self.matches
+
+
+class ConsoleTail:
+    """Collect the last ``tail`` lines (matching ``pattern``) of a log read from its end.
+
+    The caller asks :meth:`next_start` for the byte offset to read from, reads from there to
+    the end of the log and hands the bytes to :meth:`feed`. The window grows geometrically
+    until enough lines are found or the start of the log is reached, so the bytes read stay
+    proportional to the lines returned rather than to the size of the log.
+    """
+
+    def __init__(self, *, tail: int, pattern: str | None = None, window: int = TAIL_WINDOW) -> None:
+        self.compiled = re.compile(pattern) if pattern else None
+        self.tail = tail
+        self.window = window
+
+        self.matched: deque[str] = deque(maxlen=tail)
+        self._done = tail <= 0
+
+    def next_start(self, size: int) -> int | None:
+        """The byte offset of the next read for a log of ``size`` bytes, None once done."""
+        if self._done:
+            return None
+        return max(size - self.window, 0)
+
+    def feed(self, start: int, data: bytes) -> None:
+        """Take the bytes of the log from ``start`` to its end."""
+        lines = data.split(b'\n')
+        if not lines[-1]:
+            # The log ends with a line break
+            lines.pop()
+        if start > 0 and lines:
+            # The window most likely starts in the middle of a line
+            lines = lines[1:]
+
+        self.matched.clear()
+        for line in lines:
+            self.feed_line(decode_line(line))
+
+        if start == 0 or len(self.matched) >= self.tail:
+            self._done = True
+        else:
+            self.window *= TAIL_GROWTH
+
+    def feed_line(self, line: str) -> None:
+        if self.compiled is None or self.compiled.search(line):
+            self.matched.append(line)
+
+    def result(self) -> str:
+        return '\n'.join(self.matched)
+
+
+def console_cut_note(offset: int, max_bytes: int) -> str:
+    """The line ending a console output cut by :class:`ConsoleLineSelector`, telling where to go on from."""
+    return f'\n... [output cut at {max_bytes} bytes, continue with offset={offset}] ...'
+
+
+def encode_cursor(number: int, offset: int) -> str:
+    """Encode the byte offset a console log was read up to into an opaque cursor."""
+    return base64.urlsafe_b64encode(f'{number}:{offset}'.encode()).decode()
+
+
+def decode_cursor(cursor: str, number: int) -> int:
+    """Decode a cursor of :func:`encode_cursor` back into a byte offset.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another build.
+    """
+    try:
+        cursor_number, offset = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+        if int(cursor_number) == number and int(offset) >= 0:
+            return int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        pass
+    raise ValueError(f'Invalid console cursor for build #{number}: {cursor}')
+
+
+def split_console_chunk(start: int, data: bytes, *, size: int, more_data: bool) -> tuple[str, int]:
+    """Cut a chunk of a console log, read from ``start`` up to ``size`` bytes, at its last complete line.
+
+    While the build is still writing, the trailing partial line is left for the next read, so
+    lines are not returned split across two chunks. This needs the body to map byte for byte onto
+    the log: when Jenkins stripped console annotations from it, the chunk ends at ``size`` instead.
+
+    Returns:
+        The text of the chunk and the byte offset the next read starts from.
+    """
+    if more_data and start + len(data) == size:
+        data = data[: data.rfind(b'\n') + 1]
+        size = start + len(data)
+    return data.decode('utf-8', errors='replace'), size
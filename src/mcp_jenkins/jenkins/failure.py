@@ -0,0 +1,148 @@
+import re
+from collections import deque
+from dataclasses import dataclass, field
+
+from mcp_jenkins.jenkins.model.build import ConsoleExcerpt
+
+# Default size of the text returned by the failure excerpt of a build
+EXCERPT_MAX_BYTES = 8 * 1024
+
+# Lines opening a failure region by kind, with the weight the kind ranks with
+FAILURE_KINDS = [
+    (
+        'stack_trace',
+        4,
+        re.compile(r'^\s*(Traceback \(most recent call last\)|Caused by: |(?:[\w$]+\.)+[\w$]*(?:Exception|Error)\b)'),
+    ),
+    ('stage', 3, re.compile(r'skipped due to earlier failure|script returned exit code|Stage "[^"]*" failed')),
+    ('error', 2, re.compile(r'\b(?:ERROR|FATAL|SEVERE)\b|\berror:')),
+    ('failed', 2, re.compile(r'\b(?:FAILED|FAILURE)\b|\bTests? failed')),
+]
+# Lines carrying on the region above them: stack frames, chained causes, python source lines
+CONTINUATION = re.compile(r'^\s+(?:at |\.\.\. \d+ more|File "|\^)|^Caused by: ')
+# The last lines of the log, ending with ``Finished: FAILURE``
+TAIL_KIND, TAIL_WEIGHT = 'tail', 3
+
+
+@dataclass
+class _Region:
+    kind: str
+    weight: int
+    start: int
+    end: int
+    lines: list[str] = field(default_factory=list)
+    quiet: int = 0
+
+
+class FailureExtractor:
+    """Pick the regions of a console log explaining why a build failed, in a single pass.
+
+    Lines are pushed one at a time. Stack traces, error and failure lines and pipeline stage
+    failures open a region, which takes ``context`` lines on either side and grows while
+    frames or more failure lines follow, up to ``max_region_lines`` lines. The last ``tail`` lines
+    of the log are a region too.
+    Only ``max_regions`` regions (those ranking highest) are kept while reading, so memory stays
+    bounded on huge logs.
+
+    :meth:`result` ranks the regions by kind, later regions first, and returns as many as fit
+    in ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = EXCERPT_MAX_BYTES,
+        context: int = 3,
+        tail: int = 40,
+        max_regions: int = 20,
+        max_region_lines: int = 100,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.context = context
+        self.max_regions = max_regions
+        self.max_region_lines = max_region_lines
+
+        self.regions: list[_Region] = []
+        self._region: _Region | None = None
+        self._previous: deque[str] = deque(maxlen=context)
+        self._tail: deque[str] = deque(maxlen=tail)
+        self._line_number = 0
+
+    @staticmethod
+    def _classify(line: str) -> tuple[str, int] | None:
+        for kind, weight, pattern in FAILURE_KINDS:
+            if pattern.search(line):
+                return kind, weight
+        return None
+
+    def feed(self, line: str) -> None:
+        self._line_number += 1
+        kind = self._classify(line)
+        region = self._region
+
+        if region is not None:
+            region.end = self._line_number
+            region.lines.append(line)
+            if kind is not None or CONTINUATION.search(line):
+                region.quiet = 0
+                if kind is not None and kind[1] > region.weight:
+                    region.kind, region.weight = kind
+            else:
+                region.quiet += 1
+            # A region stops at its line cap, so its start and end keep matching its text
+            if region.quiet >= self.context or len(region.lines) >= self.max_region_lines:
+                self._close_region()
+        elif kind is not None:
+            self._region = _Region(
+                kind=kind[0],
+                weight=kind[1],
+                start=self._line_number - len(self._previous),
+                end=self._line_number,
+                lines=[*self._previous, line],
+            )
+
+        self._previous.append(line)
+        self._tail.append(line)
+
+    def _close_region(self) -> None:
+        self.regions.append(self._region)
+        self._region = None
+
+        if len(self.regions) > self.max_regions:
+            self.regions.remove(min(self.regions, key=lambda region: (region.weight, region.start)))
+
+    def result(self) -> list[ConsoleExcerpt]:
+        if self._region is not None:
+            self._close_region()
+
+        regions = sorted(self.regions, key=lambda region: (region.weight, region.start), reverse=True)
+        if self._tail:
+            tail = _Region(
+                kind=TAIL_KIND,
+                weight=TAIL_WEIGHT,
+                start=self._line_number - len(self._tail) + 1,
+                end=self._line_number,
+                lines=[*self._tail],
+            )
+            regions.insert(next((i for i, r in enumerate(regions) if r.weight <= TAIL_WEIGHT), len(regions)), tail)
+
+        excerpts, budget = [], self.max_bytes
+        for region in regions:
+            # Regions overlapping a better one (e.g. failures within the tail) would repeat its lines
+            if any(region.start <= excerpt.end and excerpt.start <= region.end for excerpt in excerpts):
+                continue
+
+            text = '\n'.join(region.lines)
+            size = len(text.encode())
+            if size > budget:
+                if excerpts:
+                    continue
+                # Even the best region does not fit, keep its beginning
+                text = text.encode()[:budget].decode('utf-8', errors='ignore')
+                size = len(text.encode())
+                region.end = region.start + text.count('\n')
+
+            excerpts.append(ConsoleExcerpt(kind=region.kind, start=region.start, end=region.end, text=text))
+            budget -= size
+
+        return excerpts
@@ -0,0 +1,237 @@
+import bisect
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from mcp_jenkins.jenkins.model.item import FreeStyleProject, ItemType, Job
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parser
+except ImportError:  # pragma: no cover - private modules of the stdlib, without them no prefix narrows a query
+    sre_constants = sre_parser = None
+
+# Bounds of the seconds between two listings of a folder by the item mirror
+ITEM_SYNC_MIN_INTERVAL = 10
+ITEM_SYNC_MAX_INTERVAL = 300
+
+
+def _anchored_prefix(pattern: str) -> str:
+    """The literal text every fullname matching a ``^``-anchored pattern starts with, empty when there is none."""
+    if sre_parser is None:
+        return ''
+    try:
+        parsed = sre_parser.parse(pattern)
+    except re.error:
+        return ''
+    if parsed.state.flags & re.IGNORECASE:
+        return ''
+
+    items = list(parsed)
+    if not items or items[0] != (sre_constants.AT, sre_constants.AT_BEGINNING):
+        return ''
+
+    prefix = ''
+    for op, av in items[1:]:
+        if op is not sre_constants.LITERAL:
+            break
+        prefix += chr(av)
+    return prefix
+
+
+class ItemIndex:
+    """In-memory index of the item tree answering :meth:`query` without touching Jenkins.
+
+    Items are bucketed by ``_class`` and by ``color`` (only jobs have one) and their fullnames
+    are kept sorted for prefix lookups. There are only a few distinct classes and colors, so a
+    class or color pattern is matched against the bucket keys rather than every item, and a
+    ``^``-anchored fullname pattern narrows the candidates down to a range of fullnames before
+    the regex runs. Results keep the order of the items the index was built from.
+    """
+
+    def __init__(self, items: list[ItemType]) -> None:
+        self.built = time.monotonic()
+
+        # fullname may be None for some items, they never match a query
+        self._items = [item for item in items if item.fullname is not None]
+        self._levels = [item.fullname.count('/') for item in self._items]
+        self._fullnames = sorted((item.fullname, position) for position, item in enumerate(self._items))
+
+        self._by_class: dict[str, list[int]] = defaultdict(list)
+        self._by_color: dict[str, list[int]] = defaultdict(list)
+        for position, item in enumerate(self._items):
+            self._by_class[item.class_].append(position)
+            if isinstance(item, Job | FreeStyleProject):
+                self._by_color[item.color].append(position)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def age(self) -> float:
+        return time.monotonic() - self.built
+
+    @staticmethod
+    def _bucket_positions(buckets: dict[str, list[int]], pattern: str) -> set[int]:
+        compiled = re.compile(pattern)
+        return {position for key, positions in buckets.items() if compiled.search(key) for position in positions}
+
+    def _prefix_positions(self, prefix: str) -> set[int]:
+        start = bisect.bisect_left(self._fullnames, (prefix,))
+        positions = set()
+        for fullname, position in self._fullnames[start:]:
+            if not fullname.startswith(prefix):
+                break
+            positions.add(position)
+        return positions
+
+    def query(
+        self,
+        *,
+        folder_depth: int | None = None,
+        class_pattern: str | None = None,
+        fullname_pattern: str | None = None,
+        color_pattern: str | None = None,
+    ) -> list[ItemType]:
+        """Get the items whose fields match every given pattern, with the semantics of ``query_items``.
+
+        Args:
+            folder_depth: The maximum depth of folders to traverse. If None, traverses all levels.
+            class_pattern: The pattern of the _class.
+            fullname_pattern: The pattern of the fullname.
+            color_pattern: The pattern of the color.
+
+        Returns:
+            A list of ItemType objects matching the specified patterns.
+        """
+        candidates = None
+        if class_pattern:
+            candidates = self._bucket_positions(self._by_class, class_pattern)
+        if color_pattern:
+            colored = self._bucket_positions(self._by_color, color_pattern)
+            candidates = colored if candidates is None else candidates & colored
+        if fullname_pattern and (prefix := _anchored_prefix(fullname_pattern)):
+            prefixed = self._prefix_positions(prefix)
+            candidates = prefixed if candidates is None else candidates & prefixed
+
+        positions = range(len(self._items)) if candidates is None else sorted(candidates)
+        if folder_depth is not None:
+            positions = [position for position in positions if self._levels[position] <= folder_depth]
+        if fullname_pattern:
+            fullname_re = re.compile(fullname_pattern)
+            positions = [position for position in positions if fullname_re.search(self._items[position].fullname)]
+
+        return [self._items[position] for position in positions]
+
+
+@dataclass
+class _MirroredFolder:
+    signature: tuple = ()
+    items: list[ItemType] = field(default_factory=list)
+    folders: list[str] = field(default_factory=list)
+    synced: float | None = None
+    interval: float = ITEM_SYNC_MIN_INTERVAL
+
+
+class ItemMirror:
+    """Local copy of the item tree, kept up to date one folder listing at a time.
+
+    The client lists the folders :meth:`due` for a refresh and hands each listing to :meth:`update`.
+    A folder whose children changed (added, removed, recolored or built since, as told by the
+    signature of the listing) is listed again after ``ITEM_SYNC_MIN_INTERVAL`` seconds, the interval
+    of a quiet folder doubles up to ``ITEM_SYNC_MAX_INTERVAL``, so hot folders stay fresh while the
+    rest of the tree costs a few requests per minute. New sub-folders are due at once, the subtrees
+    of removed ones are dropped.
+
+    Only the folders down to ``folder_depth`` are listed, it starts at the root and is widened by
+    :meth:`widen` to the depth the queries ask for, so a shallow query never lists the whole tree.
+    """
+
+    def __init__(self) -> None:
+        self._folders: dict[str, _MirroredFolder] = {'': _MirroredFolder()}
+        self._lock = threading.Lock()
+        self.folder_depth: int | None = 0
+
+    @staticmethod
+    def _level(fullname: str) -> int:
+        """The folder depth of the items of a folder, 0 for the root of the instance."""
+        return fullname.count('/') + 1 if fullname else 0
+
+    @staticmethod
+    def _within(level: int, folder_depth: int | None) -> bool:
+        return folder_depth is None or level <= folder_depth
+
+    def widen(self, folder_depth: int | None) -> None:
+        """List the folders down to ``folder_depth`` from now on, None for every level."""
+        with self._lock:
+            if self.folder_depth is not None and (folder_depth is None or folder_depth > self.folder_depth):
+                self.folder_depth = folder_depth
+
+    def due(self, *, max_age: float | None = None) -> list[str]:
+        """The fullnames of the folders to list, those never listed, past their interval or older than ``max_age``."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                fullname
+                for fullname, folder in self._folders.items()
+                if self._within(self._level(fullname), self.folder_depth)
+                and (
+                    folder.synced is None
+                    or now - folder.synced >= folder.interval
+                    or (max_age is not None and now - folder.synced > max_age)
+                )
+            ]
+
+    def staleness(self, *, folder_depth: int | None = None) -> float:
+        """Seconds since the oldest listing of the folders down to ``folder_depth`` was made.
+
+        Infinite until every one of these folders was listed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return max(
+                math.inf if folder.synced is None else now - folder.synced
+                for fullname, folder in self._folders.items()
+                if self._within(self._level(fullname), folder_depth)
+            )
+
+    def needs_sync(self, *, folder_depth: int | None = None, max_staleness: float | None = None) -> bool:
+        """Whether a query down to ``folder_depth`` has to wait on a sync, see :meth:`staleness`."""
+        staleness = self.staleness(folder_depth=folder_depth)
+        return staleness == math.inf or (max_staleness is not None and staleness > max_staleness)
+
+    def update(self, fullname: str, *, signature: tuple, items: list[ItemType], folders: list[str]) -> None:
+        """Record a listing of a folder: its signature, items and non empty sub-folders."""
+        with self._lock:
+            folder = self._folders.get(fullname)
+            if folder is None:
+                # Its parent was removed from the mirror meanwhile
+                return
+
+            changed = folder.synced is None or signature != folder.signature
+            folder.interval = ITEM_SYNC_MIN_INTERVAL if changed else min(folder.interval * 2, ITEM_SYNC_MAX_INTERVAL)
+            folder.synced = time.monotonic()
+            folder.signature, folder.items = signature, items
+
+            for removed in set(folder.folders) - set(folders):
+                self._drop(removed)
+            for added in folders:
+                self._folders.setdefault(added, _MirroredFolder())
+            folder.folders = folders
+
+    def _drop(self, fullname: str) -> None:
+        folder = self._folders.pop(fullname, None)
+        for sub_folder in folder.folders if folder is not None else ():
+            self._drop(sub_folder)
+
+    def items(self) -> list[ItemType]:
+        """The items of the mirror, level by level from the root."""
+        items, pending = [], ['']
+        with self._lock:
+            for fullname in pending:
+                folder = self._folders[fullname]
+                items.extend(folder.items)
+                pending.extend(sub_folder for sub_folder in folder.folders if sub_folder in self._folders)
+        return items
@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+# Name of the backend in use, orjson when installed (``mcp-jenkins[fast]``), else the stdlib
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode a JSON document, raw response bodies are decoded without going through ``str`` first."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (NaN, Infinity), let the latter decide
+            pass
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:  # noqa: ANN401
+    """Encode a value as compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # Values orjson refuses (non str keys, integers over 64 bits) are left to the stdlib
+            pass
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode()
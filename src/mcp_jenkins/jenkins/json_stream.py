@@ -0,0 +1,151 @@
+import codecs
+import json
+import re
+from typing import Any
+
+# Size of the blocks a streamed JSON response is read in
+JSON_CHUNK_SIZE = 256 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# What the stream expects next
+_OBJECT, _KEY, _COLON, _VALUE, _ARRAY, _DONE = range(6)
+
+
+class JSONArrayStream:
+    """Decode the elements of one array of a JSON object arriving in chunks, each as soon as it is complete.
+
+    A response like ``{"_class": "...", "jobs": [{...}, {...}]}`` is read as a sequence of events:
+    the keys of the top level object, whose values (other than the array) are skipped, then the
+    elements of the ``key`` array one at a time. Only the element being received is buffered, so
+    memory is bounded by the largest element rather than by the size of the response.
+
+    An incomplete element is decoded again only once the buffer doubled, so a large element costs
+    a number of decoded bytes linear in its size, however small the chunks are.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._state = _OBJECT
+        self._current_key: str | None = None
+        self._retry_size = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Take the next chunk of the response, returning the elements of the array it completed."""
+        return self._read(self._utf8.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """Take the end of the response, returning the last elements of the array.
+
+        Raises:
+            ValueError: If the response ended before the top level object was complete.
+        """
+        self._retry_size = 0
+        elements = self._read(self._utf8.decode(b'', final=True))
+        if self._state != _DONE:
+            raise ValueError(f'Incomplete JSON response, reading the {self.key} array')
+        return elements
+
+    def _read(self, text: str) -> list[Any]:
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+
+        elements = []
+        while self._state != _DONE and self._step(elements):
+            pass
+        return elements
+
+    def _step(self, elements: list[Any]) -> bool:
+        """Consume the next token or value, False when more of the response is needed."""
+        if self._state == _ARRAY:
+            return self._read_array(elements)
+
+        self._position = _WHITESPACE.match(self._buffer, self._position).end()
+        if self._position == len(self._buffer):
+            return False
+        char = self._buffer[self._position]
+
+        if self._state == _OBJECT:
+            if char != '{':
+                raise ValueError(f'Expected a JSON object, reading the {self.key} array')
+            self._position += 1
+            self._state = _KEY
+        elif self._state == _KEY and char in ',}':
+            self._position += 1
+            if char == '}':
+                # The object does not have the array
+                self._state = _DONE
+        elif self._state == _COLON:
+            if char != ':':
+                raise ValueError(f'Expected a colon, reading the {self.key} array')
+            self._position += 1
+            self._state = _VALUE
+        elif self._state == _VALUE and char == '[' and self._current_key == self.key:
+            self._position += 1
+            self._state = _ARRAY
+        else:
+            complete, value = self._decode()
+            if not complete:
+                return False
+
+            if self._state == _KEY:
+                self._current_key, self._state = value, _COLON
+            else:
+                self._state = _KEY
+        return True
+
+    def _read_array(self, elements: list[Any]) -> bool:
+        """Decode the elements of the array up to the end of the buffer, the hot loop of the stream."""
+        buffer, size, position = self._buffer, len(self._buffer), self._position
+        scan, match_whitespace = self._decoder.scan_once, _WHITESPACE.match
+        try:
+            while True:
+                if position < size and buffer[position] in ' \t\n\r':
+                    position = match_whitespace(buffer, position).end()
+                if position == size:
+                    return False
+
+                char = buffer[position]
+                if char == ',':
+                    position += 1
+                elif char == ']':
+                    position += 1
+                    self._state = _DONE
+                    return True
+                else:
+                    if size - position < self._retry_size:
+                        return False
+                    try:
+                        value, end = scan(buffer, position)
+                    except (StopIteration, json.JSONDecodeError):
+                        end = size
+                    if end == size:
+                        self._retry_size = 2 * (size - position)
+                        return False
+                    elements.append(value)
+                    position, self._retry_size = end, 0
+        finally:
+            self._position = position
+
+    def _decode(self) -> tuple[bool, Any]:
+        """Decode the value at the current position, once the buffer holds all of it."""
+        size = len(self._buffer) - self._position
+        if size < self._retry_size:
+            return False, None
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            end = None
+        # A value is always followed by a separator, one ending the buffer (a number) may go on
+        if end is None or end == len(self._buffer):
+            self._retry_size = 2 * size
+            return False, None
+
+        self._position, self._retry_size = end, 0
+        return True, value
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Artifact(BaseModel):
@@ -10,6 +10,8 @@ class Artifact(BaseModel):
 
 
 class Build(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
     number: int
     url: str
 
@@ -26,3 +28,29 @@ class Build(BaseModel):
 
 class BuildReplay(BaseModel):
     scripts: list[str]
+
+
+class ConsoleChunk(BaseModel):
+    text: str
+    cursor: str
+    more_data: bool
+
+
+class ConsoleMatch(BaseModel):
+    line: int
+    text: str
+    before: list[str] = []
+    after: list[str] = []
+
+
+class ConsoleSearchResult(BaseModel):
+    number: int
+    count: int
+    first_match: str | None = None
+
+
+class ConsoleExcerpt(BaseModel):
+    kind: str
+    start: int
+    end: int
+    text: str
@@ -1,6 +1,6 @@
-from typing import Optional, Union
+from typing import Annotated, Any, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
 
 from mcp_jenkins.jenkins.model.build import Build
 
@@ -8,7 +8,7 @@ ItemType = Union['Folder', 'MultiBranchProject', 'FreeStyleProject', 'Job', 'Unk
 
 
 class _ItemBase(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, extra='allow')
 
     class_: str = Field(..., alias='_class')
     name: str
@@ -27,33 +27,59 @@ class FreeStyleProject(_ItemBase):
 
 
 class Folder(_ItemBase):
-    jobs: list['ItemType']
+    # None for the items of the item mirror, their children are listed apart
+    jobs: list['_TaggedItem'] | None = None
 
 
 class MultiBranchProject(_ItemBase):
-    jobs: list['ItemType']
+    jobs: list['_TaggedItem'] | None = None
     lastBuild: Optional['Build'] = None
 
 
 class UnknownItem(_ItemBase):
-    model_config = ConfigDict(extra='allow')
+    pass
 
 
-def serialize_item(item: dict) -> ItemType:
+ITEM_MODELS = (Folder, MultiBranchProject, FreeStyleProject, Job, UnknownItem)
+
+
+class ItemPage(BaseModel):
+    items: list['ItemType']
+    next_cursor: str | None = None
+    total: int
+
+
+def _item_tag(item: Any) -> str:  # noqa: ANN401
+    """The model of an item payload, told by the suffix of its ``_class``."""
+    if not isinstance(item, dict):
+        return type(item).__name__
+
     _class = item.get('_class', '')
+    return next((cls.__name__ for cls in ITEM_MODELS[:-1] if _class.endswith(cls.__name__)), UnknownItem.__name__)
+
+
+# Dispatching on _item_tag lets pydantic validate a whole nested tree of items in one pass
+_TaggedItem = Annotated[
+    Annotated[Folder, Tag('Folder')]
+    | Annotated[MultiBranchProject, Tag('MultiBranchProject')]
+    | Annotated[FreeStyleProject, Tag('FreeStyleProject')]
+    | Annotated[Job, Tag('Job')]
+    | Annotated[UnknownItem, Tag('UnknownItem')],
+    Discriminator(_item_tag),
+]
+_ITEM = TypeAdapter(_TaggedItem)
+_ITEMS = TypeAdapter(list[_TaggedItem])
+
+
+def serialize_item(item: dict) -> ItemType:
+    return _ITEM.validate_python(item)
+
+
+def serialize_items(items: list[dict]) -> list[ItemType]:
+    """Validate a list of item payloads, with their nested ``jobs``, in a single call."""
+    return _ITEMS.validate_python(items)
+
 
-    cls_map = {
-        'Folder': Folder,
-        'MultiBranchProject': MultiBranchProject,
-        'FreeStyleProject': FreeStyleProject,
-        'Job': Job,
-    }
-    target_cls = next((cls for name, cls in cls_map.items() if _class.endswith(name)), UnknownItem)
-
-    if 'jobs' in item and isinstance(item['jobs'], list):
-        item = {
-            **item,
-            'jobs': [serialize_item(job) if isinstance(job, dict) else job for job in item['jobs']],
-        }
-
-    return target_cls.model_validate(item)
+def dump_items(items: list[ItemType]) -> list[dict]:
+    """Dump a list of items like ``model_dump(exclude_none=True)`` on each, in a single call."""
+    return _ITEMS.dump_python(items, exclude_none=True)
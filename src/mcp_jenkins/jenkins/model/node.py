@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class Node(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
     displayName: str
     offline: bool
 
@@ -19,3 +21,16 @@ class NodeExecutorCurrentExecutable(BaseModel):
     timestamp: int = None
     number: int = None
     fullDisplayName: str = None
+
+
+_NODES = TypeAdapter(list[Node])
+
+
+def serialize_nodes(nodes: list[dict]) -> list[Node]:
+    """Validate a list of node payloads in a single call."""
+    return _NODES.validate_python(nodes)
+
+
+def dump_nodes(nodes: list[Node], *, exclude: set[str] | None = None) -> list[dict]:
+    """Dump a list of nodes like ``model_dump(exclude=exclude)`` on each, in a single call."""
+    return _NODES.dump_python(nodes, exclude={'__all__': exclude} if exclude else None)
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class PluginDependency(BaseModel):
+    shortName: str
+    version: str = None
+    optional: bool = None
+
+
+class Plugin(BaseModel):
+    """An installed plugin.
+
+    Declares the fields the plugin tools read, which is the projection requested from the
+    plugin manager. The client still hands plugins out as plain dicts.
+    """
+
+    model_config = ConfigDict(extra='allow')
+
+    shortName: str
+    longName: str = None
+    version: str = None
+    url: str = None
+
+    active: bool = None
+    enabled: bool = None
+    bundled: bool = None
+    pinned: bool = None
+    hasUpdate: bool = None
+    downgradable: bool = None
+    backupVersion: str | None = None
+    requiredCoreVersion: str = None
+
+    dependencies: list['PluginDependency'] = None
@@ -1,12 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Queue(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
     discoverableItems: list
     items: list['QueueItem']
 
 
 class QueueItem(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
     id: int
     inQueueSince: int
     url: str
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict
+
+from mcp_jenkins.jenkins.model.item import ItemType
+
+
+class View(BaseModel):
+    """A Jenkins view.
+
+    Declares the fields requested from the view API. The client still hands views out as plain dicts.
+    """
+
+    model_config = ConfigDict(extra='allow')
+
+    name: str
+    url: str
+    description: str | None = None
+
+    jobs: list[ItemType] = None
+    views: list['View'] | None = None
@@ -1,29 +1,75 @@
 import re
-from functools import reduce
-from typing import Literal
+import secrets
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
+from pathlib import Path
+from typing import Any, Literal
 
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 from requests import Response
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import HTTPError
 
-from mcp_jenkins.jenkins import rest_endpoint
-from mcp_jenkins.jenkins.model.build import Artifact, Build, BuildReplay
-from mcp_jenkins.jenkins.model.item import (
-    FreeStyleProject,
-    ItemType,
-    Job,
-    serialize_item,
+from mcp_jenkins.jenkins import json_codec, rest_endpoint
+from mcp_jenkins.jenkins.base import (
+    CRAWL_CONCURRENCY,
+    ITEM_PAGE_SIZE,
+    ITEM_SNAPSHOTS,
+    SYNC_ITEMS_QUERY,
+    JenkinsBase,
 )
-from mcp_jenkins.jenkins.model.node import Node
+from mcp_jenkins.jenkins.build_store import CONSOLE_CHUNK_SIZE, BuildStore
+from mcp_jenkins.jenkins.cache import (
+    TTL,
+    TTL_BUILD_FINISHED,
+    TTL_BUILD_RUNNING,
+    TTL_ITEM,
+    TTL_ITEM_INDEX,
+    TTL_ITEM_SNAPSHOT,
+    TTL_LAST_BUILD,
+    TTL_NODE,
+    TTL_PLUGIN,
+    TTL_QUEUE,
+    TTL_VIEW,
+    ResponseCache,
+    build_ttl,
+)
+from mcp_jenkins.jenkins.connection import JenkinsHTTPAdapter
+from mcp_jenkins.jenkins.console import (
+    SCAN_CHUNK_SIZE,
+    ConsoleGrep,
+    ConsoleLineSelector,
+    ConsoleLineSplitter,
+    ConsolePrefilter,
+    ConsoleTail,
+    compile_prefilter,
+    console_cut_note,
+    decode_cursor,
+    iter_prefiltered_lines,
+)
+from mcp_jenkins.jenkins.failure import EXCERPT_MAX_BYTES, FailureExtractor
+from mcp_jenkins.jenkins.item_index import ItemIndex, ItemMirror
+from mcp_jenkins.jenkins.json_stream import JSON_CHUNK_SIZE, JSONArrayStream
+from mcp_jenkins.jenkins.model.build import (
+    Artifact,
+    Build,
+    BuildReplay,
+    ConsoleChunk,
+    ConsoleExcerpt,
+    ConsoleMatch,
+    ConsoleSearchResult,
+)
+from mcp_jenkins.jenkins.model.item import ITEM_MODELS, ItemPage, ItemType, serialize_item
+from mcp_jenkins.jenkins.model.node import Node, serialize_nodes
 from mcp_jenkins.jenkins.model.queue import Queue, QueueItem
+from mcp_jenkins.jenkins.model.view import View
+from mcp_jenkins.jenkins.tree import model_tree
 
 
-class Jenkins:
-    DEFAULT_HEADERS = {'Content-Type': 'text/xml; charset=utf-8'}
-
+class Jenkins(JenkinsBase):
     def __init__(
         self,
         *,
@@ -32,26 +78,40 @@ class Jenkins:
         password: str,
         timeout: int = 75,
         verify_ssl: bool = True,
+        max_connections: int = 10,
+        tcp_keepalive: bool = True,
+        cache_size: int = 0,
+        build_store_dir: Path | None = None,
+        crawl_concurrency: int = 0,
     ) -> None:
         self.url = url
         self.timeout = timeout
+        self.crawl_concurrency = crawl_concurrency
 
         self._crumb_header = None
+        self._cache = ResponseCache(max_size=cache_size)
+        self._build_store = BuildStore(build_store_dir, url=url, username=username)
+        self._console_sizes = ResponseCache()
+        # Item lists behind page cursors, shared as is since pages only read them
+        self._item_snapshots = ResponseCache(max_size=ITEM_SNAPSHOTS, copy=False)
+        self._item_mirror = ItemMirror()
+        self._item_index: ItemIndex | None = None
+        self._item_index_refresh: threading.Thread | None = None
+        self._item_index_lock = threading.Lock()
+        # Held while the item mirror is synced, so concurrent queries never list the same folders twice
+        self._item_index_sync_lock = threading.Lock()
 
         self._session = requests.Session()
         self._session.auth = HTTPBasicAuth(username, password)
         self._session.verify = verify_ssl
 
-    def endpoint_url(self, endpoint: str) -> str:
-        """Construct the full URL for a given Jenkins REST endpoint.
-
-        Args:
-            endpoint: The Jenkins REST endpoint path.
+        adapter = JenkinsHTTPAdapter(max_connections=max_connections, tcp_keepalive=tcp_keepalive)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
-        Returns:
-            The full URL as a string. (e.g., https://example.com/crumbIssuer/api/json)
-        """
-        return '/'.join(str(s).strip('/') for s in [self.url, endpoint])
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._session.close()
 
     def request(
         self,
@@ -127,7 +187,7 @@ class Jenkins:
         if self._crumb_header is None:
             try:
                 response = self.request('GET', rest_endpoint.CRUMB, crumb=False)
-                crumb = response.json()
+                crumb = json_codec.loads(response.content)
                 self._crumb_header = {crumb['crumbRequestField']: crumb['crumb']}
             except HTTPError as e:
                 if e.response.status_code == 404:
@@ -137,35 +197,64 @@ class Jenkins:
 
         return self._crumb_header
 
-    def _parse_fullname(self, fullname: str) -> tuple[str, str]:
-        """Parse a fullname into folder URL and short name.
+    def _get_json(self, endpoint: str, *, ttl: TTL) -> Any:  # noqa: ANN401
+        """GET a JSON endpoint through the response cache.
 
         Args:
-            fullname: A string representing the full path (e.g., "folder1/folder2/name").
+            endpoint: The Jenkins REST endpoint path, also the cache key.
+            ttl: Seconds the response stays fresh, or a callable computing them from the payload.
 
         Returns:
-            A tuple containing:
-                - folder: The constructed folder URL (e.g., "job/folder1/job/folder2/").
-                - name: The last component of the path (e.g., "name").
+            The decoded JSON payload.
         """
-        parts = fullname.split('/')
-        name = parts[-1]
-        folder = f'job/{"/job/".join(parts[:-1])}/' if len(parts) > 1 else ''
-        return folder, name
+        # The raw body is cached: decoding it again on a hit is cheaper than copying the payload
+        body = self._cache.get(endpoint)
+        if body is not None:
+            return json_codec.loads(body)
 
-    def _build_view_path(self, view_path: str) -> str:
-        """Build a Jenkins view URL path from a slash-separated view path.
+        body = self.request('GET', endpoint).content
+        data = json_codec.loads(body)
+        self._cache.set(endpoint, body, ttl=ttl(data) if callable(ttl) else ttl)
+        return data
 
-        Args:
-            view_path: Slash-separated view path (e.g. "frontend/nightly").
+    def _iter_json_array(self, endpoint: str, key: str) -> Iterator[list]:
+        """GET a JSON endpoint streaming its body, yielding the elements of its ``key`` array in batches.
 
-        Returns:
-            The Jenkins URL path segment (e.g. "view/frontend/view/nightly").
+        The elements are decoded as they arrive (see :class:`JSONArrayStream`), so neither the body
+        nor the whole payload is held in memory at once. Not cached, the callers keep what they need.
         """
-        from urllib.parse import quote
+        stream = JSONArrayStream(key)
+        with closing(self._stream(endpoint)) as response:
+            for chunk in response.iter_content(chunk_size=JSON_CHUNK_SIZE):
+                yield stream.feed(chunk)
+        yield stream.close()
+
+    def _is_build_finished(self, fullname: str, number: int) -> bool:
+        """Whether a build is finished, asking Jenkins unless the build store already knows."""
+        if self._build_store.is_finished(fullname, number):
+            return True
+
+        folder, name = self._parse_fullname(fullname)
+        data = self._get_json(
+            rest_endpoint.BUILD(folder=folder, name=name, number=number, tree='building'), ttl=build_ttl
+        )
+        if data.get('building') is False:
+            self._build_store.mark_finished(fullname, number)
+            return True
+        return False
 
-        parts = [quote(p.strip(), safe='') for p in view_path.split('/') if p.strip()]
-        return '/'.join(f'view/{p}' for p in parts)
+    def _get_build_json(self, fullname: str, number: int, endpoint: str, *, ttl: TTL) -> Any:  # noqa: ANN401
+        """GET a JSON endpoint of a build, kept in the build store once the build is finished."""
+        if not self._build_store.enabled:
+            return self._get_json(endpoint, ttl=ttl)
+
+        data = self._build_store.get(fullname, number, endpoint)
+        if data is None:
+            finished = self._is_build_finished(fullname, number)
+            data = self._get_json(endpoint, ttl=ttl)
+            if finished:
+                self._build_store.put(fullname, number, endpoint, data)
+        return data
 
     def get_views(self) -> list[dict]:
         """Get all top-level views from Jenkins.
@@ -173,10 +262,10 @@ class Jenkins:
         Returns:
             A list of dictionaries with 'name' and 'url' for each view.
         """
-        response = self.request('GET', rest_endpoint.VIEWS)
-        return response.json().get('views', [])
+        data = self._get_json(rest_endpoint.VIEWS, ttl=TTL_VIEW)
+        return data.get('views', [])
 
-    def get_view(self, *, view_path: str, depth: int = 0) -> dict:
+    def get_view(self, *, view_path: str, depth: int = 0, fields: str | None = None) -> dict:
         """Get a specific view by path.
 
         Supports nested views using slash-separated paths
@@ -185,38 +274,44 @@ class Jenkins:
         Args:
             view_path: Slash-separated view path.
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             A dictionary with the view's name, jobs, and/or nested views.
         """
         url_path = self._build_view_path(view_path)
-        response = self.request('GET', rest_endpoint.VIEW(view_path=url_path, depth=depth))
-        return response.json()
+        tree = model_tree(View, depth=depth, fields=fields)
+        return self._get_json(rest_endpoint.VIEW(view_path=url_path, tree=tree), ttl=TTL_VIEW)
 
-    def get_queue(self, *, depth: int = 1) -> Queue:
+    def get_queue(self, *, depth: int = 1, fields: str | None = None) -> Queue:
         """Get queue.
 
         Args:
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the queue item fields to fetch instead of the model fields.
 
         Returns:
             A list of QueueItem objects.
         """
-        response = self.request('GET', rest_endpoint.QUEUE(depth=depth))
-        return Queue.model_validate(response.json())
+        # Queue items are exported inline, so they sit one level below the queue itself
+        tree = f'discoverableItems,items[{model_tree(QueueItem, depth=depth, fields=fields)}]'
+        data = self._get_json(rest_endpoint.QUEUE(tree=tree), ttl=TTL_QUEUE)
+        return Queue.model_validate(data)
 
-    def get_queue_item(self, *, id: int, depth: int = 0) -> 'QueueItem':
+    def get_queue_item(self, *, id: int, depth: int = 0, fields: str | None = None) -> 'QueueItem':
         """Get a queue item by its ID.
 
         Args:
             id: The ID of the queue item.
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             The QueueItem object.
         """
-        response = self.request('GET', rest_endpoint.QUEUE_ITEM(id=id, depth=depth))
-        return QueueItem.model_validate(response.json())
+        tree = model_tree(QueueItem, depth=depth, fields=fields)
+        data = self._get_json(rest_endpoint.QUEUE_ITEM(id=id, tree=tree), ttl=TTL_QUEUE)
+        return QueueItem.model_validate(data)
 
     def cancel_queue_item(self, *, id: int) -> None:
         """Cancel a queue item by its ID.
@@ -225,32 +320,37 @@ class Jenkins:
             id: The ID of the queue item to cancel.
         """
         self.request('POST', rest_endpoint.QUEUE_CANCEL_ITEM(id=id))
+        self._cache.invalidate('queue/')
 
-    def get_node(self, *, name: str, depth: int = 0) -> Node:
+    def get_node(self, *, name: str, depth: int = 0, fields: str | None = None) -> Node:
         """Get a specific node by name.
 
         Args:
             name: The name of the node.
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             The Node object.
         """
         name = '(master)' if name in ('master', 'Built-In Node') else name
-        response = self.request('GET', rest_endpoint.NODE(name=name, depth=depth))
-        return Node.model_validate(response.json())
+        tree = model_tree(Node, depth=depth, fields=fields)
+        data = self._get_json(rest_endpoint.NODE(name=name, tree=tree), ttl=TTL_NODE)
+        return Node.model_validate(data)
 
-    def get_nodes(self, *, depth: int = 0) -> list[Node]:
+    def get_nodes(self, *, depth: int = 0, fields: str | None = None) -> list[Node]:
         """Get a list of nodes connected to the Master
 
         Args:
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             A list of Node objects.
         """
-        response = self.request('GET', rest_endpoint.NODES(depth=depth))
-        return [Node.model_validate(node) for node in response.json()['computer']]
+        tree = model_tree(Node, depth=depth, fields=fields)
+        data = self._get_json(rest_endpoint.NODES(tree=tree), ttl=TTL_NODE)
+        return serialize_nodes(data['computer'])
 
     def get_node_config(self, *, name: str) -> str:
         """Get the configuration for a node.
@@ -277,24 +377,36 @@ class Jenkins:
             headers=self.DEFAULT_HEADERS,
             data=config_xml,
         )
+        self._cache.invalidate('computer/')
 
-    def get_build(self, *, fullname: str, number: int, depth: int = 0) -> Build:
+    def get_build(self, *, fullname: str, number: int, depth: int = 0, fields: str | None = None) -> Build:
         """Get build by fullname and number.
 
         Args:
             fullname: The fullname of the job.
             number: The build number.
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             The Build object.
         """
         folder, name = self._parse_fullname(fullname)
-        response = self.request(
-            'GET',
-            rest_endpoint.BUILD(folder=folder, name=name, number=number, depth=depth),
-        )
-        return Build.model_validate(response.json())
+        tree = model_tree(Build, depth=depth, fields=fields)
+        endpoint = rest_endpoint.BUILD(folder=folder, name=name, number=number, tree=tree)
+
+        data = self._build_store.get(fullname, number, endpoint)
+        if data is None:
+            data = self._get_json(endpoint, ttl=build_ttl)
+            if data.get('building') is False:
+                self._build_store.put(fullname, number, endpoint, data)
+        return Build.model_validate(data)
+
+    def _stream(self, endpoint: str) -> Response:
+        """GET an endpoint without the crumb, streaming its body."""
+        response = self._session.get(self.endpoint_url(endpoint), timeout=self.timeout, stream=True)
+        response.raise_for_status()
+        return response
 
     def get_build_console_output(
         self,
@@ -304,6 +416,8 @@ class Jenkins:
         pattern: str | None = None,
         offset: int = 0,
         limit: int | None = None,
+        tail: int | None = None,
+        max_bytes: int | None = None,
     ) -> str:
         """Get the console output of a specific build.
 
@@ -313,35 +427,202 @@ class Jenkins:
             pattern: Optional regex pattern to filter lines (only matching lines are returned).
             offset: Number of lines to skip from the beginning (after pattern filtering).
             limit: Maximum number of lines to return (after pattern filtering and offset).
+            tail: Return only the last N lines (after pattern filtering), read from the end of the log.
+                offset and limit are ignored when set.
+            max_bytes: Stop reading once the output reaches this size, ending it with a note telling the
+                offset to continue from (see :func:`console_cut_note`). Ignored with ``tail``.
 
         Returns:
             The console output as a string.
         """
+        if tail is not None:
+            return self._get_build_console_tail(fullname=fullname, number=number, tail=tail, pattern=pattern)
+
+        # Without a pattern, the line index of a stored log skips straight to ``offset``
+        start = 0 if pattern else offset
+        selector = ConsoleLineSelector(pattern=pattern, offset=offset - start, limit=limit, max_bytes=max_bytes)
+
+        # Lines that cannot match are skipped in their raw bytes, only the candidates are decoded
+        prefilter = compile_prefilter(pattern) if pattern else None
+
+        with closing(self._iter_console_lines(fullname, number, start=start, prefilter=prefilter)) as lines:
+            for line in lines:
+                if selector.feed(line):
+                    break
+        if selector.cut:
+            return selector.result() + console_cut_note(offset + len(selector.matched), max_bytes)
+        return selector.result()
+
+    def grep_build_console_output(
+        self,
+        *,
+        fullname: str,
+        number: int,
+        patterns: dict[str, str],
+        before: int = 0,
+        after: int = 0,
+        limit: int | None = None,
+    ) -> dict[str, list[ConsoleMatch]]:
+        """Search the console output of a specific build for several patterns in one pass.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The build number.
+            patterns: The regex patterns to search for, by name (e.g. ``{'errors': 'ERROR'}``).
+            before: Number of lines of context to keep before each match.
+            after: Number of lines of context to keep after each match.
+            limit: Maximum number of matches per pattern, the scan stops once every pattern has them.
+
+        Returns:
+            The matches of each pattern, with their 1-based line number and context.
+        """
+        grep = ConsoleGrep(patterns=patterns, before=before, after=after, limit=limit)
+
+        with closing(self._iter_console_lines(fullname, number)) as lines:
+            for line in lines:
+                if grep.feed(line):
+                    break
+        return grep.result()
+
+    def search_build_console_output(self, *, fullname: str, number: int, pattern: str) -> ConsoleSearchResult | None:
+        """Count the lines of the console output of a build matching a pattern.
+
+        Finished logs are read from the build store, so searching the history of a job again stays local.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The build number.
+            pattern: The regex pattern to search for.
+
+        Returns:
+            The number of matching lines and the first of them, None if the build does not exist.
+        """
+        compiled = re.compile(pattern)
+        result = ConsoleSearchResult(number=number, count=0)
+
+        try:
+            with closing(self._iter_console_lines(fullname, number, prefilter=compile_prefilter(pattern))) as lines:
+                for line in lines:
+                    if compiled.search(line):
+                        result.count += 1
+                        result.first_match = result.first_match or line
+        except HTTPError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        return result
+
+    def get_build_failure_excerpt(
+        self, *, fullname: str, number: int, max_bytes: int = EXCERPT_MAX_BYTES
+    ) -> list[ConsoleExcerpt]:
+        """Extract the regions of the console output of a build explaining its failure, see :class:`FailureExtractor`.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The build number.
+            max_bytes: Maximum size of the text of the excerpts.
+
+        Returns:
+            The failure regions, most relevant first.
+        """
+        extractor = FailureExtractor(max_bytes=max_bytes)
+
+        with closing(self._iter_console_lines(fullname, number)) as lines:
+            for line in lines:
+                extractor.feed(line)
+        return extractor.result()
+
+    def _iter_console_lines(
+        self, fullname: str, number: int, *, start: int = 0, prefilter: re.Pattern[bytes] | None = None
+    ) -> Iterator[str]:
+        """Iterate the lines of a console log from line ``start``, read from the build store once finished.
+
+        With a ``prefilter`` (see :func:`compile_prefilter`), only the lines it finds are decoded and
+        yielded, ``start`` is then ignored.
+        """
+        if self._build_store.has_console_log(fullname, number):
+            if prefilter is not None:
+                with self._build_store.map_console_log(fullname, number) as log:
+                    yield from iter_prefiltered_lines(log, prefilter)
+            else:
+                yield from self._build_store.iter_console_log(fullname, number, start=start)
+            return
+
+        # A finished log read to its end is written to the build store on the way, a read stopped
+        # early (e.g. by a limit) drops what it wrote, so the store never costs more than the read
+        store = self._build_store.enabled and self._is_build_finished(fullname, number)
+        lines = ConsolePrefilter(prefilter) if prefilter is not None else ConsoleLineSplitter(start=start)
+
         folder, name = self._parse_fullname(fullname)
-        compiled = re.compile(pattern) if pattern else None
+        response = self._stream(rest_endpoint.BUILD_CONSOLE_OUTPUT(folder=folder, name=name, number=number))
+        try:
+            with self._build_store.write_console_log(fullname, number) if store else nullcontext() as log:
+                for chunk in response.iter_content(chunk_size=SCAN_CHUNK_SIZE if prefilter else CONSOLE_CHUNK_SIZE):
+                    if log is not None:
+                        log.write(chunk)
+                    yield from lines.feed(chunk)
+            yield from lines.close()
+        finally:
+            response.close()
+
+    def _get_build_console_tail(self, *, fullname: str, number: int, tail: int, pattern: str | None) -> str:
+        """Read the last lines of a console log from its end, see :class:`ConsoleTail`."""
+        selector = ConsoleTail(tail=tail, pattern=pattern)
+
+        if self._build_store.has_console_log(fullname, number):
+            with self._build_store.map_console_log(fullname, number) as log:
+                while (start := selector.next_start(len(log))) is not None:
+                    selector.feed(start, log[start:])
+            return selector.result()
 
-        response = self._session.get(
-            self.endpoint_url(rest_endpoint.BUILD_CONSOLE_OUTPUT(folder=folder, name=name, number=number)),
-            timeout=self.timeout,
-            stream=True,
-        )
-        response.raise_for_status()
+        folder, name = self._parse_fullname(fullname)
+        key = f'{fullname}#{number}'
+        size = self._console_sizes.get(key)
+
+        if size is None:
+            # Only the X-Text-Size header of a read from the start is needed, the body is never read
+            response = self._stream(
+                rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=0)
+            )
+            response.close()
+            size = int(response.headers.get('X-Text-Size', 0))
+
+        while (start := selector.next_start(size)) is not None:
+            response = self._stream(
+                rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=start)
+            )
+            selector.feed(start, response.content)
+            size = int(response.headers.get('X-Text-Size', size))
 
-        matched: list[str] = []
-        skipped = 0
+        # A log only grows, so a remembered size is always a valid start
+        self._console_sizes.set(key, size, ttl=TTL_BUILD_FINISHED)
+        return selector.result()
 
-        for raw_line in response.iter_lines(decode_unicode=True):
-            if compiled is not None and not compiled.search(raw_line):
-                continue
-            if skipped < offset:
-                skipped += 1
-                continue
-            matched.append(raw_line)
-            if limit is not None and len(matched) >= limit:
-                break
+    def get_build_console_progress(self, *, fullname: str, number: int, cursor: str | None = None) -> ConsoleChunk:
+        """Get the console output a build wrote since a previous read.
 
-        response.close()
-        return '\n'.join(matched)
+        Each chunk carries the cursor to resume from, so polling a running build only transfers
+        the bytes written in between. While the build runs the chunk stops at its last complete line.
+
+        Args:
+            fullname: The fullname of the job.
+            number: The number of the build.
+            cursor: The cursor of the previous chunk, None to read from the start of the log.
+
+        Returns:
+            The new output, the cursor of the next read and whether the build is still writing.
+        """
+        start = decode_cursor(cursor, number) if cursor is not None else 0
+
+        folder, name = self._parse_fullname(fullname)
+        response = self._stream(
+            rest_endpoint.BUILD_PROGRESSIVE_TEXT(folder=folder, name=name, number=number, start=start)
+        )
+        self._console_sizes.set(
+            f'{fullname}#{number}', int(response.headers.get('X-Text-Size', start)), ttl=TTL_BUILD_FINISHED
+        )
+        return self._parse_console_chunk(number, start, response.content, response.headers)
 
     def stop_build(self, *, fullname: str, number: int) -> None:
         """Stop a running Jenkins build.
@@ -352,6 +633,7 @@ class Jenkins:
         """
         folder, name = self._parse_fullname(fullname)
         self.request('POST', rest_endpoint.BUILD_STOP(folder=folder, name=name, number=number))
+        self._cache.invalidate(self._item_cache_prefix(fullname), 'computer/', 'queue/')
 
     def get_build_replay(self, *, fullname: str, number: int) -> BuildReplay:
         """Get the build replay of a specific build.
@@ -366,13 +648,17 @@ class Jenkins:
             The build replay object containing the pipeline scripts.
         """
 
+        data = self._build_store.get(fullname, number, 'replay')
+        if data is not None:
+            return BuildReplay.model_validate(data)
+
+        finished = self._build_store.enabled and self._is_build_finished(fullname, number)
         folder, name = self._parse_fullname(fullname)
         response = self.request('GET', rest_endpoint.BUILD_REPLAY(folder=folder, name=name, number=number))
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        scripts = [textarea.text for textarea in soup.find_all('textarea', {'name': re.compile(r'_\..*Script.*')})]
-        return BuildReplay(scripts=scripts)
+        replay = self._parse_build_replay(response.text)
+        if finished:
+            self._build_store.put(fullname, number, 'replay', replay.model_dump())
+        return replay
 
     def get_build_parameters(self, *, fullname: str, number: int) -> dict:
         """Get the build parameters of a specific build.
@@ -385,15 +671,13 @@ class Jenkins:
             A dictionary representing the build parameters.
         """
         folder, name = self._parse_fullname(fullname)
-        response = self.request(
-            'GET',
+        data = self._get_build_json(
+            fullname,
+            number,
             rest_endpoint.BUILD_PARAMETERS(folder=folder, name=name, number=number),
+            ttl=TTL_BUILD_RUNNING,
         )
-
-        for action in response.json().get('actions', []):
-            if 'parameters' in action:
-                return {p['name']: p.get('value') for p in action['parameters']}
-        return {}
+        return self._parse_build_parameters(data)
 
     def get_build_test_report(self, *, fullname: str, number: int, depth: int = 0) -> dict:
         """Get the test report of a specific build.
@@ -407,11 +691,12 @@ class Jenkins:
             A dictionary representing the test report.
         """
         folder, name = self._parse_fullname(fullname)
-        response = self.request(
-            'GET',
+        return self._get_build_json(
+            fullname,
+            number,
             rest_endpoint.BUILD_TEST_REPORT(folder=folder, name=name, number=number, depth=depth),
+            ttl=TTL_BUILD_RUNNING,
         )
-        return response.json()
 
     def get_build_artifacts(self, *, fullname: str, number: int) -> list[Artifact]:
         """Get the list of artifacts from a specific build.
@@ -424,11 +709,10 @@ class Jenkins:
             A list of Artifact objects.
         """
         folder, name = self._parse_fullname(fullname)
-        response = self.request(
-            'GET',
-            rest_endpoint.BUILD_ARTIFACTS(folder=folder, name=name, number=number),
+        data = self._get_json(
+            rest_endpoint.BUILD_ARTIFACTS(folder=folder, name=name, number=number), ttl=TTL_BUILD_RUNNING
         )
-        return [Artifact.model_validate(a) for a in response.json().get('artifacts', [])]
+        return [Artifact.model_validate(a) for a in data.get('artifacts', [])]
 
     def get_build_artifact(self, *, fullname: str, number: int, relative_path: str) -> bytes:
         """Download the content of a specific artifact from a build.
@@ -465,69 +749,47 @@ class Jenkins:
         )
 
     def get_running_builds(self) -> list[Build]:
-        """Get all running builds across all nodes.
+        """Get all running builds across all nodes, including the one-off executors of pipelines.
 
         The build obtained through this method only includes the number, url and timestamp.
 
         Returns:
             A list of Build objects representing the running builds.
         """
-        builds = []
-
-        for node in self.get_nodes(depth=2):
-            for executor in node.executors:
-                if executor.currentExecutable and executor.currentExecutable.number:
-                    builds.append(Build.model_validate(executor.currentExecutable.model_dump(mode='json')))
+        data = self._get_json(rest_endpoint.RUNNING_BUILDS, ttl=TTL_NODE)
+        return self._parse_running_builds(data.get('computer', []))
 
-        return builds
-
-    def get_items(self, *, folder_depth: int | None = None, folder_depth_per_request: int = 10) -> list[ItemType]:
-        """Get items in the Jenkins instance up to a specified folder depth.
+    def get_item(self, *, fullname: str, depth: int = 0, fields: str | None = None) -> ItemType:
+        """Get item by its fullname.
 
         Args:
-            folder_depth: The maximum depth of folders to traverse. If None, traverses all levels.
-            folder_depth_per_request: The depth of folders to request per API call.
+            fullname: The full name of the item (e.g., "folder1/folder2/item").
+            depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
-            A list of ItemType objects representing the items.
+            The ItemType object representing the item.
         """
-        query = reduce(
-            lambda q, _: f'jobs[url,color,name,{q}]',
-            range(folder_depth_per_request),
-            'jobs',
-        )
-        response = self.request('GET', rest_endpoint.ITEMS(folder='', query=query))
-
-        items = []
-
-        item_stack = [(0, [], response.json()['jobs'])]
-        for level, path, level_items in item_stack:
-            current_items = level_items if isinstance(level_items, list) else [level_items]
-
-            for item in current_items:
-                job_path = path + [item['name']]
-                item.setdefault('fullname', '/'.join(job_path))
-                items.append(serialize_item(item))
-
-                children = item.get('jobs')
-                if isinstance(children, list) and (folder_depth is None or level < folder_depth):
-                    item_stack.append((level + 1, job_path, children))
+        folder, name = self._parse_fullname(fullname)
+        tree = model_tree(*ITEM_MODELS, depth=depth, fields=fields)
+        data = self._get_json(rest_endpoint.ITEM(folder=folder, name=name, tree=tree), ttl=TTL_ITEM)
+        return serialize_item(data)
 
-        return items
+    def get_last_build_number(self, *, fullname: str) -> int | None:
+        """Get the number of the last build of a job.
 
-    def get_item(self, *, fullname: str, depth: int = 0) -> ItemType:
-        """Get item by its fullname.
+        Only requests ``lastBuild[number]`` and keeps it for a few seconds, triggering a build
+        drops it, so resolving "the last build" stays cheap for every build tool.
 
         Args:
-            fullname: The full name of the item (e.g., "folder1/folder2/item").
-            depth: The depth of the information to retrieve.
+            fullname: The full name of the job (e.g., "folder1/folder2/job").
 
         Returns:
-            The ItemType object representing the item.
+            The last build number, or None if the job never ran.
         """
         folder, name = self._parse_fullname(fullname)
-        response = self.request('GET', rest_endpoint.ITEM(folder=folder, name=name, depth=depth))
-        return serialize_item(response.json())
+        data = self._get_json(rest_endpoint.ITEM_LAST_BUILD(folder=folder, name=name), ttl=TTL_LAST_BUILD)
+        return (data.get('lastBuild') or {}).get('number')
 
     def get_item_config(self, *, fullname: str) -> str:
         """Get item configuration by its fullname.
@@ -556,49 +818,148 @@ class Jenkins:
             headers=self.DEFAULT_HEADERS,
             data=config_xml,
         )
+        self._cache.invalidate(self._item_cache_prefix(fullname))
 
     def query_items(
         self,
         *,
         folder_depth: int | None = None,
-        folder_depth_per_request: int = 10,
         class_pattern: str | None = None,
         fullname_pattern: str | None = None,
         color_pattern: str | None = None,
+        max_staleness: float | None = None,
     ) -> list['ItemType']:
         """Query items by specific field patterns.
 
+        Items are looked up in an in-memory :class:`ItemIndex` of an :class:`ItemMirror` of the tree.
+        The mirror is listed folder by folder, down to ``folder_depth``, on the first query reaching
+        that deep, then synced in the background once the index is older than ``TTL_ITEM_INDEX``
+        seconds, listing only the folders due for it, so queries only wait on Jenkins the first time
+        or when the mirror is older than ``max_staleness``.
+
         Args:
             folder_depth: The maximum depth of folders to traverse. If None, traverses all levels.
-            folder_depth_per_request: The depth of folders to request per API call.
             class_pattern: The pattern of the _class.
             fullname_pattern: The pattern of the fullname.
             color_pattern: The pattern of the color.
+            max_staleness: The maximum age in seconds of the folder listings the items come from.
+                If None, the items may be as old as ``ITEM_SYNC_MAX_INTERVAL`` seconds.
 
         Returns:
             A list of ItemType objects matching the specified patterns.
         """
-        class_re, fullname_re, color_re = (
-            re.compile(pattern) if pattern else None for pattern in (class_pattern, fullname_pattern, color_pattern)
+        return self._get_item_index(max_staleness, folder_depth).query(
+            folder_depth=folder_depth,
+            class_pattern=class_pattern,
+            fullname_pattern=fullname_pattern,
+            color_pattern=color_pattern,
         )
 
-        items = self.get_items(folder_depth=folder_depth, folder_depth_per_request=folder_depth_per_request)
+    def _get_item_index(self, max_staleness: float | None, folder_depth: int | None) -> ItemIndex:
+        index = self._item_index
+        if index is None or self._item_mirror.needs_sync(folder_depth=folder_depth, max_staleness=max_staleness):
+            with self._item_index_sync_lock:
+                # Another query may have synced the mirror while this one waited
+                if self._item_index is None or self._item_mirror.needs_sync(
+                    folder_depth=folder_depth, max_staleness=max_staleness
+                ):
+                    self._item_mirror.widen(folder_depth)
+                    return self._sync_item_index(max_age=max_staleness)
+                return self._item_index
+
+        if index.age() >= TTL_ITEM_INDEX:
+            with self._item_index_lock:
+                if self._item_index_refresh is None or not self._item_index_refresh.is_alive():
+                    self._item_index_refresh = threading.Thread(
+                        target=self._sync_item_index_quietly, name='jenkins-item-index', daemon=True
+                    )
+                    self._item_index_refresh.start()
+        return index
+
+    def _sync_item_index(self, *, max_age: float | None = None) -> ItemIndex:
+        """List the folders of the item mirror that are due, and the new sub-folders they reveal, then reindex."""
+        listed = set()
+        with ThreadPoolExecutor(
+            max_workers=self.crawl_concurrency or CRAWL_CONCURRENCY, thread_name_prefix='jenkins-sync'
+        ) as executor:
+            while due := [fullname for fullname in self._item_mirror.due(max_age=max_age) if fullname not in listed]:
+                listed.update(due)
+                for fullname, (signature, items, folders) in zip(
+                    due, executor.map(self._list_synced_folder, due), strict=True
+                ):
+                    self._item_mirror.update(fullname, signature=signature, items=items, folders=folders)
+
+        self._item_index = ItemIndex(self._item_mirror.items())
+        return self._item_index
+
+    def _sync_item_index_quietly(self) -> None:
+        try:
+            with self._item_index_sync_lock:
+                self._sync_item_index()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f'Failed to sync the item index, keeping the previous one: {e}')
+
+    def _list_synced_folder(self, fullname: str) -> tuple[tuple, list[ItemType], list[str]]:
+        # Not cached: the mirror decides when a folder is listed again
+        endpoint = rest_endpoint.ITEMS(folder=self._crawl_folder_url(fullname), query=SYNC_ITEMS_QUERY)
+        # Streamed and parsed batch by batch, the listing of a large folder is never held as JSON
+        return self._merge_synced_items(
+            [self._parse_synced_items(jobs, fullname=fullname) for jobs in self._iter_json_array(endpoint, 'jobs')]
+        )
 
-        result = []
+    def get_items_page(
+        self,
+        *,
+        folder_depth: int | None = None,
+        class_pattern: str | None = None,
+        fullname_pattern: str | None = None,
+        color_pattern: str | None = None,
+        page_size: int = ITEM_PAGE_SIZE,
+        cursor: str | None = None,
+        max_staleness: float | None = None,
+    ) -> ItemPage:
+        """Page through the items of the Jenkins instance, optionally filtered by patterns.
 
-        for item in items:
-            if class_re and not class_re.search(item.class_):
-                continue
-            # fullname may be None for some items
-            if item.fullname is None or (fullname_re and not fullname_re.search(item.fullname)):
-                continue
-            if color_re:
-                # Only Job has color attribute
-                if not isinstance(item, Job | FreeStyleProject) or not color_re.search(item.color):
-                    continue
-            result.append(item)
+        The first call lists the items once and keeps the (filtered) list as a snapshot for a few
+        minutes, the following pages are sliced out of it with the returned cursor, so paging stays
+        consistent and Jenkins is not crawled again for every page.
 
-        return result
+        Args:
+            folder_depth: The maximum depth of folders to traverse. If None, traverses all levels.
+            class_pattern: The pattern of the _class.
+            fullname_pattern: The pattern of the fullname.
+            color_pattern: The pattern of the color.
+            page_size: The number of items per page.
+            cursor: The cursor of the previous page, the other arguments are ignored when set.
+            max_staleness: The maximum age in seconds of the items of the first page, see :meth:`query_items`.
+
+        Returns:
+            The items of the page, the cursor of the next page (None on the last one) and the total.
+
+        Raises:
+            ValueError: If the page size is below 1, or the cursor is malformed or its snapshot expired.
+        """
+        if page_size < 1:
+            raise ValueError(f'Invalid page size: {page_size}, it must be 1 or more')
+
+        if cursor is not None:
+            snapshot, offset = self._parse_page_cursor(cursor)
+            items = self._item_snapshots.get(snapshot)
+            if items is None:
+                raise ValueError(f'Expired page cursor: {cursor}, request the first page again')
+            return self._item_page(snapshot, items, offset, page_size)
+
+        items = self.query_items(
+            folder_depth=folder_depth,
+            class_pattern=class_pattern,
+            fullname_pattern=fullname_pattern,
+            color_pattern=color_pattern,
+            max_staleness=max_staleness,
+        )
+
+        snapshot = secrets.token_urlsafe(8)
+        self._item_snapshots.set(snapshot, items, ttl=TTL_ITEM_SNAPSHOT)
+        return self._item_page(snapshot, items, 0, page_size)
 
     def build_item(
         self,
@@ -626,32 +987,35 @@ class Jenkins:
             rest_endpoint.ITEM_BUILD(folder=folder, name=name, build_type=build_type),
             data=data,
         )
+        self._cache.invalidate(self._item_cache_prefix(fullname), 'queue/')
 
-        return int(response.headers.get('Location', None).strip('/').split('/')[-1])
+        return self._parse_queue_item_number(response.headers.get('Location', None))
 
-    def get_plugins(self, *, depth: int = 0) -> list[dict]:
+    def get_plugins(self, *, depth: int = 0, fields: str | None = None) -> list[dict]:
         """Get a list of all installed plugins.
 
         Args:
             depth: The depth of the information to retrieve.
+            fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
             A list of plugin dictionaries.
         """
-        response = self.request('GET', rest_endpoint.PLUGIN_LIST(depth=depth))
-        return response.json().get('plugins', [])
+        data = self._get_json(self._plugin_list_endpoint(depth=depth, fields=fields), ttl=TTL_PLUGIN)
+        return data.get('plugins', [])
 
-    def get_plugin(self, *, short_name: str, depth: int = 2) -> dict | None:
+    def get_plugin(self, *, short_name: str, depth: int = 2, fields: str | None = None) -> dict | None:
         """Get a specific plugin by short name.
 
                 Args:
                     short_name: The short name of the plugin.
                     depth: The depth of the information to retrieve. Default is 2 (includes dependencies).
+                    fields: Optional tree expression of the fields to fetch instead of the model fields.
 
         Returns:
                     A list of plugins that can be downgraded.
         """
-        plugins = self.get_plugins(depth=depth)
+        plugins = self.get_plugins(depth=depth, fields=fields)
         for plugin in plugins:
             if plugin.get('shortName') == short_name:
                 return plugin
@@ -669,108 +1033,7 @@ class Jenkins:
         jenkins_version = self._get_jenkins_version()
         plugins = self.get_plugins(depth=2)
 
-        installed = {p['shortName']: p for p in plugins}
-
-        problems = []
-        for plugin in plugins:
-            short_name = plugin.get('shortName', '')
-            version = plugin.get('version', '')
-            required_core = plugin.get('requiredCoreVersion', '')
-
-            if required_core and jenkins_version:
-                if not self._is_core_compatible(jenkins_version, required_core):
-                    problems.append(
-                        {
-                            'shortName': short_name,
-                            'problem': 'incompatible_core_version',
-                            'pluginVersion': version,
-                            'requiredCoreVersion': required_core,
-                            'jenkinsVersion': jenkins_version,
-                            'severity': 'error',
-                            'message': (
-                                f'Plugin requires Jenkins {required_core}, but current version is {jenkins_version}'
-                            ),
-                        }
-                    )
-
-            if not plugin.get('enabled'):
-                problems.append(
-                    {
-                        'shortName': short_name,
-                        'problem': 'plugin_disabled',
-                        'pluginVersion': version,
-                        'severity': 'warning',
-                        'message': 'Plugin is currently disabled',
-                    }
-                )
-
-            deps = plugin.get('dependencies', [])
-            for dep in deps:
-                dep_name = dep.get('shortName', '')
-                dep_version = dep.get('version', '')
-                is_optional = dep.get('optional', False)
-                is_bundled = dep.get('bundled', False)
-
-                if dep_name not in installed:
-                    if is_optional:
-                        problems.append(
-                            {
-                                'shortName': short_name,
-                                'problem': 'missing_optional_dependency',
-                                'dependency': dep_name,
-                                'requiredVersion': dep_version,
-                                'severity': 'info',
-                                'message': f'Missing optional dependency: {dep_name}',
-                            }
-                        )
-                    elif not is_bundled:
-                        problems.append(
-                            {
-                                'shortName': short_name,
-                                'problem': 'missing_dependency',
-                                'dependency': dep_name,
-                                'requiredVersion': dep_version,
-                                'severity': 'error',
-                                'message': f'Missing required dependency: {dep_name}',
-                            }
-                        )
-                else:
-                    installed_ver = installed[dep_name].get('version', '')
-                    if dep_version and installed_ver and installed_ver != dep_version:
-                        if self._is_version_greater(installed_ver, dep_version):
-                            continue
-                        if is_optional:
-                            problems.append(
-                                {
-                                    'shortName': short_name,
-                                    'problem': 'version_mismatch_optional',
-                                    'dependency': dep_name,
-                                    'requiredVersion': dep_version,
-                                    'installedVersion': installed_ver,
-                                    'severity': 'info',
-                                    'message': (
-                                        f'Optional dependency {dep_name} version mismatch: '
-                                        f'required {dep_version}, installed {installed_ver}'
-                                    ),
-                                }
-                            )
-                        else:
-                            problems.append(
-                                {
-                                    'shortName': short_name,
-                                    'problem': 'version_mismatch',
-                                    'dependency': dep_name,
-                                    'requiredVersion': dep_version,
-                                    'installedVersion': installed_ver,
-                                    'severity': 'error',
-                                    'message': (
-                                        f'Dependency {dep_name} version mismatch: '
-                                        f'required {dep_version}, installed {installed_ver}'
-                                    ),
-                                }
-                            )
-
-        return problems
+        return self._find_plugin_problems(plugins, jenkins_version)
 
     def get_plugins_with_updates(self, depth: int = 0) -> list[dict]:
         """Get plugins that have available updates.
@@ -781,16 +1044,7 @@ class Jenkins:
         Returns:
             A list of plugins with available updates.
         """
-        plugins = self.get_plugins(depth=depth)
-        return [
-            {
-                'shortName': p.get('shortName'),
-                'longName': p.get('longName'),
-                'version': p.get('version'),
-            }
-            for p in plugins
-            if p.get('hasUpdate')
-        ]
+        return self._filter_plugins_with_updates(self.get_plugins(depth=depth))
 
     def get_plugins_with_backup(self, depth: int = 0) -> list[dict]:
         """Get plugins that can be downgraded.
@@ -803,51 +1057,14 @@ class Jenkins:
         Returns:
             A list of plugins that can be downgraded.
         """
-        response = self.request('GET', rest_endpoint.PLUGIN_LIST(depth=depth))
-        plugins = response.json().get('plugins', [])
-        return [
-            {
-                'shortName': p.get('shortName'),
-                'longName': p.get('longName'),
-                'version': p.get('version'),
-                'backupVersion': p.get('backupVersion'),
-                'downgradable': p.get('downgradable'),
-            }
-            for p in plugins
-            if p.get('backupVersion') and p.get('downgradable')
-        ]
+        data = self._get_json(self._plugin_list_endpoint(depth=depth), ttl=TTL_PLUGIN)
+        return self._filter_plugins_with_backup(data.get('plugins', []))
 
     def _get_jenkins_version(self) -> str:
         """Get the Jenkins core version from response header."""
         response = self.request('GET', '', crumb=False)
         return response.headers.get('X-Jenkins', '')
 
-    def _is_core_compatible(self, jenkins_ver: str, required_ver: str) -> bool:
-        """Check if Jenkins version is compatible with required core version."""
-        if not isinstance(jenkins_ver, str) or not isinstance(required_ver, str):
-            return True
-
-        def normalize_version(v: str) -> tuple:
-            parts = v.split('.')
-            return tuple(int(p) if p.isdigit() else 0 for p in parts[:3])
-
-        core = normalize_version(jenkins_ver)
-        required = normalize_version(required_ver)
-        return core >= required
-
-    def _is_version_greater(self, installed_ver: str, required_ver: str) -> bool:
-        """Check if installed version is greater than required version."""
-        if not isinstance(installed_ver, str) or not isinstance(required_ver, str):
-            return False
-
-        def normalize_version(v: str) -> tuple:
-            parts = v.split('.')
-            return tuple(int(p) if p.isdigit() else 0 for p in parts[:3])
-
-        installed = normalize_version(installed_ver)
-        required = normalize_version(required_ver)
-        return installed > required
-
     def get_plugin_dependency_graph(self, short_name: str) -> dict:
         """Get dependency graph for a specific plugin in Graphviz format.
 
@@ -859,43 +1076,7 @@ class Jenkins:
         Returns:
             A dictionary containing 'nodes' and 'edges' for Graphviz rendering.
         """
-        plugins = self.get_plugins(depth=2)
-        installed = {p['shortName']: p for p in plugins}
-
-        if short_name not in installed:
-            return {'nodes': [], 'edges': [], 'error': f'Plugin not found: {short_name}'}
-
-        nodes = []
-        edges = []
-        visited = set()
-
-        def traverse(name: str) -> None:
-            if name in visited:
-                return
-            visited.add(name)
-
-            if name not in installed:
-                nodes.append({'id': name, 'label': name, 'status': 'missing'})
-                return
-
-            plugin = installed[name]
-            nodes.append(
-                {
-                    'id': name,
-                    'label': f'{name}\n({plugin.get("version", "?")})',
-                    'status': 'installed',
-                }
-            )
-
-            deps = plugin.get('dependencies', [])
-            for dep in deps:
-                dep_name = dep.get('shortName', '')
-                edges.append({'from': name, 'to': dep_name})
-                traverse(dep_name)
-
-        traverse(short_name)
-
-        return {'nodes': nodes, 'edges': edges}
+        return self._build_plugin_dependency_graph(self.get_plugins(depth=2), short_name)
 
     def run_script(self, script: str) -> str:  # noqa: N802
         """Execute a Groovy script on Jenkins.
@@ -907,9 +1088,7 @@ class Jenkins:
             The result of the script execution.
         """
         response = self.request('POST', rest_endpoint.SCRIPT_TEXT, data={'script': script.encode('utf-8')})
+        # A script can change anything
+        self._cache.clear()
 
-        result = response.text
-        result_prefix = 'Result: '
-        if result.startswith(result_prefix):
-            return result[len(result_prefix) :].rstrip('\n')
-        return result
+        return self._parse_script_result(response.text)
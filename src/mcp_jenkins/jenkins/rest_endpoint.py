@@ -16,24 +16,31 @@ class RestEndpoint(str):
 
 CRUMB = RestEndpoint('crumbIssuer/api/json')
 
-ITEM = RestEndpoint('{folder}job/{name}/api/json?depth={depth}')
+ITEM = RestEndpoint('{folder}job/{name}/api/json?tree={tree}')
 ITEMS = RestEndpoint('{folder}/api/json?tree={query}')
+ITEM_LAST_BUILD = RestEndpoint('{folder}job/{name}/api/json?tree=lastBuild[number]')
 ITEM_CONFIG = RestEndpoint('{folder}job/{name}/config.xml')
 ITEM_BUILD = RestEndpoint('{folder}job/{name}/{build_type}')
 
-QUEUE = RestEndpoint('queue/api/json?depth={depth}')
-QUEUE_ITEM = RestEndpoint('queue/item/{id}/api/json?depth={depth}')
+QUEUE = RestEndpoint('queue/api/json?tree={tree}')
+QUEUE_ITEM = RestEndpoint('queue/item/{id}/api/json?tree={tree}')
 QUEUE_CANCEL_ITEM = RestEndpoint('queue/cancelItem?id={id}')
 
-NODE = RestEndpoint('computer/{name}/api/json?depth={depth}')
-NODES = RestEndpoint('computer/api/json?depth={depth}')
+NODE = RestEndpoint('computer/{name}/api/json?tree={tree}')
+NODES = RestEndpoint('computer/api/json?tree=computer[{tree}]')
 NODE_CONFIG = RestEndpoint('computer/{name}/config.xml')
+RUNNING_BUILDS = RestEndpoint(
+    'computer/api/json?tree=computer[displayName,'
+    'executors[currentExecutable[number,url,timestamp]],'
+    'oneOffExecutors[currentExecutable[number,url,timestamp]]]'
+)
 
-VIEW = RestEndpoint('{view_path}/api/json?depth={depth}')
+VIEW = RestEndpoint('{view_path}/api/json?tree={tree}')
 VIEWS = RestEndpoint('api/json?tree=views[name,url]')
 
-BUILD = RestEndpoint('{folder}job/{name}/{number}/api/json?depth={depth}')
+BUILD = RestEndpoint('{folder}job/{name}/{number}/api/json?tree={tree}')
 BUILD_CONSOLE_OUTPUT = RestEndpoint('{folder}job/{name}/{number}/consoleText')
+BUILD_PROGRESSIVE_TEXT = RestEndpoint('{folder}job/{name}/{number}/logText/progressiveText?start={start}')
 BUILD_STOP = RestEndpoint('{folder}job/{name}/{number}/stop')
 BUILD_REPLAY = RestEndpoint('{folder}job/{name}/{number}/replay')
 BUILD_PARAMETERS = RestEndpoint('{folder}job/{name}/{number}/api/json?tree=actions[parameters[name,value]]')
@@ -41,7 +48,6 @@ BUILD_TEST_REPORT = RestEndpoint('{folder}job/{name}/{number}/testReport/api/jso
 BUILD_ARTIFACT = RestEndpoint('{folder}job/{name}/{number}/artifact/{relative_path}')
 BUILD_ARTIFACTS = RestEndpoint('{folder}job/{name}/{number}/api/json?tree=artifacts[fileName,relativePath,displayPath]')
 
-PLUGIN_LIST = RestEndpoint('pluginManager/api/json?depth={depth}')
 PLUGIN_LIST_TREE = RestEndpoint('pluginManager/api/json?tree=plugins[{tree}]')
 
 SCRIPT_TEXT = RestEndpoint('scriptText')
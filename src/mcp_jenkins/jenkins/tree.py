@@ -0,0 +1,135 @@
+import functools
+import inspect
+import sys
+import typing
+from typing import Any, ForwardRef
+
+from pydantic import BaseModel
+
+
+def _lookup(name: str, namespace: dict) -> Any:  # noqa: ANN401
+    """Resolve a forward reference in the declaring module, then in the other model modules.
+
+    Aliases such as ``ItemType`` carry forward references that only resolve in the module
+    that defined them, not in the module that imported the alias.
+    """
+    if name in namespace:
+        return namespace[name]
+
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith('mcp_jenkins.jenkins.model.') and name in vars(module):
+            return vars(module)[name]
+    return None
+
+
+def _resolve_models(annotation: Any, namespace: dict) -> list[type[BaseModel]]:  # noqa: ANN401
+    """Find the pydantic models referenced by a field annotation (through Optional, list, Union, ForwardRef)."""
+    if isinstance(annotation, str):
+        annotation = ForwardRef(annotation)
+    if isinstance(annotation, ForwardRef):
+        annotation = _lookup(annotation.__forward_arg__, namespace)
+        if annotation is None:
+            return []
+
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return [annotation]
+
+    models = []
+    for arg in typing.get_args(annotation):
+        for model in _resolve_models(arg, namespace):
+            if model not in models:
+                models.append(model)
+    return models
+
+
+def _collect_fields(models: tuple[type[BaseModel], ...]) -> dict[str, tuple[bool, list[type[BaseModel]]]]:
+    """Merge the fields of several models into ``{key: (required, nested models)}``, keyed by alias."""
+    fields: dict[str, tuple[bool, list[type[BaseModel]]]] = {}
+
+    for model in models:
+        namespace = vars(sys.modules[model.__module__])
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            required, nested = fields.get(key, (False, []))
+            for nested_model in _resolve_models(field.annotation, namespace):
+                if nested_model not in nested:
+                    nested.append(nested_model)
+            fields[key] = (required or field.is_required(), nested)
+
+    return fields
+
+
+def _split_top_level(tree: str) -> list[str]:
+    """Split a tree expression on the commas that are not nested inside brackets."""
+    parts, depth, current = [], 0, ''
+    for char in tree:
+        if char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        depth += {'[': 1, ']': -1}.get(char, 0)
+        current += char
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+def _required_tree(models: tuple[type[BaseModel], ...]) -> list[str]:
+    """The parts of a tree expression asking for the required fields of the models, nested ones included."""
+    parts = []
+    for key, (required, nested) in _collect_fields(models).items():
+        if not required:
+            continue
+        subtree = ','.join(_required_tree(tuple(nested))) if nested else ''
+        parts.append(f'{key}[{subtree}]' if subtree else key)
+    return parts
+
+
+@functools.lru_cache(maxsize=256)
+def model_tree(*models: type[BaseModel], depth: int = 0, fields: str | None = None) -> str:
+    """Build a Jenkins ``tree=`` projection from the fields the given models declare.
+
+    Mirrors the Jenkins ``depth`` semantics: nested objects below ``depth`` only carry the
+    required scalar fields of their model (like the ``_class``/``url`` references Jenkins returns),
+    so a projection never asks for more than the equivalent ``depth=N`` request returned.
+
+    Args:
+        models: The models the response is validated into, several for a union (e.g. item types).
+        depth: How many levels of nested models are expanded with all their fields.
+        fields: Optional tree expression overriding the projection. The required fields of the
+            models, nested ones with their own required fields, are always kept so the response
+            still validates.
+
+    Returns:
+        The tree expression, e.g. ``number,url,nextBuild[number,url]``.
+    """
+    collected = _collect_fields(models)
+
+    if fields is not None:
+        parts = {part.partition('[')[0]: part for part in _required_tree(models)}
+        for part in _split_top_level(fields):
+            key, _, subtree = part.partition('[')
+            nested = collected.get(key, (False, []))[1]
+            if subtree and nested:
+                # The required fields of the nested models are merged into the requested subtree
+                parts[key] = f'{key}[{model_tree(*nested, fields=subtree[:-1])}]'
+            elif key not in parts:
+                parts[key] = part
+        return ','.join(parts.values())
+
+    parts = []
+    for key, (_, nested) in collected.items():
+        if not nested:
+            parts.append(key)
+            continue
+
+        if depth > 0:
+            subtree = model_tree(*nested, depth=depth - 1)
+        else:
+            subtree = ','.join(
+                nested_key
+                for nested_key, (required, nested_models) in _collect_fields(tuple(nested)).items()
+                if required and not nested_models
+            )
+        parts.append(f'{key}[{subtree}]' if subtree else key)
+
+    return ','.join(parts)
@@ -6,7 +6,7 @@ from starlette.middleware import Middleware as ASGIMiddleware
 from starlette.requests import Request
 from starlette.responses import PlainTextResponse
 
-from mcp_jenkins.core import AuthMiddleware, LifespanContext, lifespan
+from mcp_jenkins.core import AuthMiddleware, ClientLeaseMiddleware, LifespanContext, ResponseBudgetMiddleware, lifespan
 
 __all__ = ['mcp']
 
@@ -29,7 +29,7 @@ class JenkinsMCP(FastMCP[LifespanContext]):
         return super().http_app(path=path, middleware=final_middleware_list, transport=transport, **kwargs)
 
 
-mcp = JenkinsMCP('mcp-jenkins', lifespan=lifespan)
+mcp = JenkinsMCP('mcp-jenkins', lifespan=lifespan, middleware=[ClientLeaseMiddleware(), ResponseBudgetMiddleware()])
 
 
 @mcp.custom_route('/healthz', methods=['GET'])
@@ -40,4 +40,4 @@ async def healthz(_request: Request) -> PlainTextResponse:
 
 # Import tool modules to register them with the MCP server
 # This must happen after mcp is created so the @mcp.tool() decorators can reference it
-from mcp_jenkins.server import build, item, node, plugin, queue, view, script  # noqa: F401, E402
+from mcp_jenkins.server import build, item, node, plugin, queue, view, script, response  # noqa: F401, E402
@@ -1,10 +1,28 @@
+import asyncio
 import base64
 
 from fastmcp import Context
 
 from mcp_jenkins.core.lifespan import jenkins
+from mcp_jenkins.core.middleware import MARKER_SIZE
+from mcp_jenkins.jenkins import AsyncJenkins, AsyncJenkinsAdapter
+from mcp_jenkins.jenkins.failure import EXCERPT_MAX_BYTES
 from mcp_jenkins.server import mcp
 
+# Console logs searched at the same time by search_builds_console_output
+SEARCH_CONCURRENCY = 8
+# Builds searched by one search_builds_console_output call at most, larger counts are clamped to it
+SEARCH_MAX_BUILDS = 100
+
+
+async def _resolve_build_number(client: AsyncJenkins | AsyncJenkinsAdapter, fullname: str, number: int | None) -> int:
+    """Resolve ``number=None`` to the number of the last build of the job."""
+    if number is None:
+        number = await client.get_last_build_number(fullname=fullname)
+    if number is None:
+        raise ValueError(f'No build found for job: {fullname}')
+    return number
+
 
 @mcp.tool(tags=['read'])
 async def get_running_builds(ctx: Context) -> list[dict]:
@@ -15,25 +33,28 @@ async def get_running_builds(ctx: Context) -> list[dict]:
     """
     return [
         item.model_dump(include={'number', 'url', 'building', 'timestamp'})
-        for item in jenkins(ctx).get_running_builds()
+        for item in await jenkins(ctx).get_running_builds()
     ]
 
 
 @mcp.tool(tags=['read'])
-async def get_build(ctx: Context, fullname: str, number: int | None = None) -> dict:
+async def get_build(ctx: Context, fullname: str, number: int | None = None, fields: str | None = None) -> dict:
     """Get specific build info from Jenkins
 
     Args:
         fullname: The fullname of the job
         number: The number of the build, if None, get the last build
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "result,duration").
+                Defaults to the standard fields.
 
     Returns:
         The build info
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    return jenkins(ctx).get_build(fullname=fullname, number=number).model_dump(exclude_none=True)
+    build = await client.get_build(fullname=fullname, number=number, fields=fields)
+    return build.model_dump(exclude_none=True)
 
 
 @mcp.tool(tags=['read'])
@@ -47,10 +68,10 @@ async def get_build_scripts(ctx: Context, fullname: str, number: int | None = No
     Returns:
         A list of scripts used in the build
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    return jenkins(ctx).get_build_replay(fullname=fullname, number=number).scripts
+    return (await client.get_build_replay(fullname=fullname, number=number)).scripts
 
 
 @mcp.tool(tags=['read'])
@@ -61,6 +82,7 @@ async def get_build_console_output(
     pattern: str | None = None,
     offset: int = 0,
     limit: int | None = None,
+    tail: int | None = None,
 ) -> str:
     """Get the console output of a specific build in Jenkins
 
@@ -70,18 +92,155 @@ async def get_build_console_output(
         pattern: Optional regex pattern to filter lines (only matching lines are returned)
         offset: Number of lines to skip from the beginning after filtering, default 0
         limit: Maximum number of lines to return after filtering and offset
+        tail: Return only the last N lines after filtering, read from the end of the log. Ignores offset and limit
 
     Returns:
-        The console output of the build
+        The console output of the build. Output over the response size limit is cut, ending with the offset to
+        continue from
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
-    if number is None:
-        raise ValueError(f'No build found for job: {fullname}')
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
+
+    # Stop reading the log at the response budget rather than truncating the whole output afterwards
+    response_max_bytes = ctx.request_context.lifespan_context.response_max_bytes
+    return await client.get_build_console_output(
+        fullname=fullname,
+        number=number,
+        pattern=pattern,
+        offset=offset,
+        limit=limit,
+        tail=tail,
+        max_bytes=response_max_bytes - MARKER_SIZE if response_max_bytes else None,
+    )
+
 
-    return jenkins(ctx).get_build_console_output(
-        fullname=fullname, number=number, pattern=pattern, offset=offset, limit=limit
+@mcp.tool(tags=['read'])
+async def grep_build_console_output(
+    ctx: Context,
+    fullname: str,
+    patterns: dict[str, str],
+    number: int | None = None,
+    before: int = 0,
+    after: int = 0,
+    limit: int | None = None,
+) -> dict:
+    """Search the console output of a specific build in Jenkins for several patterns at once, reading the log once
+
+    Args:
+        fullname: The fullname of the job
+        patterns: The regex patterns to search for, by name (e.g. {"errors": "ERROR", "failed_tests": "FAILED"})
+        number: The number of the build, if None, get the last build
+        before: Number of context lines to return before each match, default 0
+        after: Number of context lines to return after each match, default 0
+        limit: Maximum number of matches to return per pattern
+
+    Returns:
+        The matches of each pattern, with their line number (starting at 1) and context lines
+    """
+    for name, value in (('before', before), ('after', after)):
+        if value < 0:
+            raise ValueError(f'Invalid {name}: {value}, it must be 0 or more')
+
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
+
+    matches = await client.grep_build_console_output(
+        fullname=fullname, number=number, patterns=patterns, before=before, after=after, limit=limit
     )
+    return {name: [match.model_dump() for match in pattern_matches] for name, pattern_matches in matches.items()}
+
+
+@mcp.tool(tags=['read'])
+async def get_build_failure_excerpt(
+    ctx: Context, fullname: str, number: int | None = None, max_bytes: int = EXCERPT_MAX_BYTES
+) -> list[dict]:
+    """Get the parts of the console output of a build in Jenkins explaining why it failed, instead of the whole log
+
+    Picks stack traces, error and failure lines, pipeline stage failures and the last lines of the log.
+
+    Args:
+        fullname: The fullname of the job
+        number: The number of the build, if None, get the last build
+        max_bytes: Maximum size of the returned text, default 8192
+
+    Returns:
+        The failure regions, most relevant first, with their kind, first and last line numbers and text
+    """
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
+
+    excerpts = await client.get_build_failure_excerpt(fullname=fullname, number=number, max_bytes=max_bytes)
+    return [excerpt.model_dump() for excerpt in excerpts]
+
+
+@mcp.tool(tags=['read'])
+async def search_builds_console_output(
+    ctx: Context, fullname: str, pattern: str, to_number: int | None = None, count: int = 20
+) -> list[dict]:
+    """Search the console output of the recent builds of a job in Jenkins for a pattern, several builds at a time
+
+    Args:
+        fullname: The fullname of the job
+        pattern: The regex pattern to search for
+        to_number: The number of the newest build to search, if None, start from the last build
+        count: How many builds to search, going back from to_number, default 20, at most 100
+
+    Returns:
+        For each build, newest first, the number of matching lines and the first of them.
+        Builds that no longer exist are left out, builds that could not be searched have an error instead
+    """
+    if count < 1:
+        raise ValueError(f'Invalid count: {count}, it must be 1 or more')
+    count = min(count, SEARCH_MAX_BUILDS)
+
+    client = jenkins(ctx)
+    to_number = await _resolve_build_number(client, fullname, to_number)
+    numbers = range(to_number, max(to_number - count, 0), -1)
+
+    semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+    done = 0
+
+    async def search(number: int) -> dict | None:
+        nonlocal done
+        try:
+            async with semaphore:
+                result = await client.search_build_console_output(fullname=fullname, number=number, pattern=pattern)
+        finally:
+            done += 1
+            await ctx.report_progress(done, len(numbers))
+        return result.model_dump() if result is not None else None
+
+    # One build failing to be searched does not lose the results of the others
+    results = await asyncio.gather(*(search(number) for number in numbers), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return [
+        {'number': number, 'error': f'{type(result).__name__}: {result}'} if isinstance(result, Exception) else result
+        for number, result in zip(numbers, results, strict=True)
+        if result is not None
+    ]
+
+
+@mcp.tool(tags=['read'])
+async def follow_build_console_output(
+    ctx: Context, fullname: str, number: int | None = None, cursor: str | None = None
+) -> dict:
+    """Follow the console output of a running build in Jenkins, only returning what was written since the last call
+
+    Args:
+        fullname: The fullname of the job
+        number: The number of the build, if None, get the last build. Pass the returned number when resuming
+        cursor: The cursor returned by the previous call, None to start from the beginning of the log
+
+    Returns:
+        The build number, the new output, the cursor to resume from and whether the build is still writing
+    """
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
+
+    chunk = await client.get_build_console_progress(fullname=fullname, number=number, cursor=cursor)
+    return {'number': number, **chunk.model_dump()}
 
 
 @mcp.tool(tags=['read'])
@@ -95,10 +254,10 @@ async def get_build_test_report(ctx: Context, fullname: str, number: int | None
     Returns:
         The test report of the build
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    return jenkins(ctx).get_build_test_report(fullname=fullname, number=number)
+    return await client.get_build_test_report(fullname=fullname, number=number)
 
 
 @mcp.tool(tags=['read'])
@@ -112,10 +271,10 @@ async def get_build_parameters(ctx: Context, fullname: str, number: int | None =
     Returns:
         A dictionary of build parameter names and their values
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    return jenkins(ctx).get_build_parameters(fullname=fullname, number=number)
+    return await client.get_build_parameters(fullname=fullname, number=number)
 
 
 @mcp.tool(tags=['write'])
@@ -126,7 +285,7 @@ async def stop_build(ctx: Context, fullname: str, number: int) -> None:
         fullname: The fullname of the job
         number: The number of the build to stop
     """
-    return jenkins(ctx).stop_build(fullname=fullname, number=number)
+    return await jenkins(ctx).stop_build(fullname=fullname, number=number)
 
 
 @mcp.tool(tags=['read'])
@@ -140,12 +299,12 @@ async def get_all_build_artifacts(ctx: Context, fullname: str, number: int | Non
     Returns:
         A list of artifact metadata dicts with fileName, relativePath, and displayPath
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
     return [
         artifact.model_dump(exclude_none=True)
-        for artifact in jenkins(ctx).get_build_artifacts(fullname=fullname, number=number)
+        for artifact in await client.get_build_artifacts(fullname=fullname, number=number)
     ]
 
 
@@ -163,10 +322,10 @@ async def get_build_artifact(ctx: Context, fullname: str, relative_path: str, nu
     Returns:
         A dict with 'content' (str) and 'encoding' ('utf-8' or 'base64')
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    content = jenkins(ctx).get_build_artifact(fullname=fullname, number=number, relative_path=relative_path)
+    content = await client.get_build_artifact(fullname=fullname, number=number, relative_path=relative_path)
 
     try:
         return {'content': content.decode('utf-8'), 'encoding': 'utf-8'}
@@ -186,7 +345,7 @@ async def get_build_artifact_url(ctx: Context, fullname: str, relative_path: str
     Returns:
         The direct Jenkins URL of the artifact
     """
-    if number is None:
-        number = jenkins(ctx).get_item(fullname=fullname, depth=1).lastBuild.number
+    client = jenkins(ctx)
+    number = await _resolve_build_number(client, fullname, number)
 
-    return jenkins(ctx).get_build_artifact_url(fullname=fullname, number=number, relative_path=relative_path)
+    return await client.get_build_artifact_url(fullname=fullname, number=number, relative_path=relative_path)
@@ -4,30 +4,61 @@ from typing import Literal
 from fastmcp import Context
 
 from mcp_jenkins.core.lifespan import jenkins
+from mcp_jenkins.jenkins.base import ITEM_PAGE_SIZE
+from mcp_jenkins.jenkins.model.item import ItemPage, dump_items
 from mcp_jenkins.server import mcp
 
 
+def _dump_page(page: ItemPage) -> dict:
+    return {
+        'items': dump_items(page.items),
+        'next_cursor': page.next_cursor,
+        'total': page.total,
+    }
+
+
 @mcp.tool(tags=['read'])
-async def get_all_items(ctx: Context) -> list[dict]:
+async def get_all_items(
+    ctx: Context,
+    page_size: int | None = None,
+    cursor: str | None = None,
+    max_staleness: int | None = None,
+) -> list[dict] | dict:
     """Get all items from Jenkins
 
+    Args:
+        page_size: Optional number of items per page, 1 or more. When set, a page of items is returned instead of
+                   the full list.
+        cursor: The next_cursor of the previous page, to get the following page.
+        max_staleness: Optional maximum age in seconds of the listings the items come from.
+                       Defaults to the background sync, which may lag a few minutes behind on quiet folders.
+
     Returns:
-        A list of items
+        A list of items, or with page_size / cursor the items of the page, the next_cursor
+        (null on the last page) and the total number of items
     """
-    return [item.model_dump(exclude_none=True) for item in jenkins(ctx).get_items()]
+    if page_size is None and cursor is None:
+        return dump_items(await jenkins(ctx).query_items(max_staleness=max_staleness))
+
+    page = await jenkins(ctx).get_items_page(
+        page_size=ITEM_PAGE_SIZE if page_size is None else page_size, cursor=cursor, max_staleness=max_staleness
+    )
+    return _dump_page(page)
 
 
 @mcp.tool(tags=['read'])
-async def get_item(ctx: Context, fullname: str) -> dict:
+async def get_item(ctx: Context, fullname: str, fields: str | None = None) -> dict:
     """Get specific item from Jenkins
 
     Args:
         fullname: The fullname of the item
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "color,lastSuccessfulBuild[number,url]").
+                Defaults to the standard fields.
 
     Returns:
         The item
     """
-    return jenkins(ctx).get_item(fullname=fullname).model_dump(exclude_none=True)
+    return (await jenkins(ctx).get_item(fullname=fullname, fields=fields)).model_dump(exclude_none=True)
 
 
 @mcp.tool(tags=['read'])
@@ -40,7 +71,7 @@ async def get_item_config(ctx: Context, fullname: str) -> str:
     Returns:
         The config of the item
     """
-    return jenkins(ctx).get_item_config(fullname=fullname)
+    return await jenkins(ctx).get_item_config(fullname=fullname)
 
 
 @mcp.tool(tags=['write'])
@@ -51,7 +82,7 @@ async def set_item_config(ctx: Context, fullname: str, config_xml: str) -> None:
         fullname: The fullname of the item
         config_xml: The config XML of the item
     """
-    jenkins(ctx).set_item_config(fullname=fullname, config_xml=config_xml)
+    await jenkins(ctx).set_item_config(fullname=fullname, config_xml=config_xml)
 
 
 @mcp.tool(tags=['read'])
@@ -61,7 +92,10 @@ async def query_items(
     fullname_pattern: str = None,
     color_pattern: str = None,
     folder_depth: int | None = None,
-) -> list[dict]:
+    page_size: int | None = None,
+    cursor: str | None = None,
+    max_staleness: int | None = None,
+) -> list[dict] | dict:
     """Query items from Jenkins
 
     Args:
@@ -69,19 +103,37 @@ async def query_items(
         fullname_pattern: The pattern of the fullname
         color_pattern: The pattern of the color
         folder_depth: The maximum depth of folders to traverse. If None, traverses all levels.
+        page_size: Optional number of items per page, 1 or more. When set, a page of items is returned instead of
+                   the full list.
+        cursor: The next_cursor of the previous page, to get the following page. The patterns and folder_depth
+                of the first page still apply.
+        max_staleness: Optional maximum age in seconds of the listings the items come from.
+                       Defaults to the background sync, which may lag a few minutes behind on quiet folders.
 
     Returns:
-        A list of items
+        A list of items, or with page_size / cursor the items of the page, the next_cursor
+        (null on the last page) and the total number of matching items
     """
-    return [
-        item.model_dump(exclude_none=True)
-        for item in jenkins(ctx).query_items(
+    if page_size is not None or cursor is not None:
+        page = await jenkins(ctx).get_items_page(
             class_pattern=class_pattern,
             fullname_pattern=fullname_pattern,
             color_pattern=color_pattern,
             folder_depth=folder_depth,
+            page_size=ITEM_PAGE_SIZE if page_size is None else page_size,
+            cursor=cursor,
+            max_staleness=max_staleness,
         )
-    ]
+        return _dump_page(page)
+
+    items = await jenkins(ctx).query_items(
+        class_pattern=class_pattern,
+        fullname_pattern=fullname_pattern,
+        color_pattern=color_pattern,
+        folder_depth=folder_depth,
+        max_staleness=max_staleness,
+    )
+    return dump_items(items)
 
 
 @mcp.tool(tags=['write'])
@@ -101,7 +153,7 @@ async def build_item(
     Returns:
         The queue item number of the item.
     """
-    return jenkins(ctx).build_item(fullname=fullname, build_type=build_type, data=data)
+    return await jenkins(ctx).build_item(fullname=fullname, build_type=build_type, data=data)
 
 
 @mcp.tool(tags=['read'])
@@ -114,7 +166,7 @@ async def get_item_parameters(ctx: Context, fullname: str) -> list[dict]:
     Returns:
         A list of parameter definitions, each containing name, type, defaultValue, and description
     """
-    config_xml = jenkins(ctx).get_item_config(fullname=fullname)
+    config_xml = await jenkins(ctx).get_item_config(fullname=fullname)
     root = ET.fromstring(config_xml)
 
     params = []
@@ -1,6 +1,7 @@
 from fastmcp import Context
 
 from mcp_jenkins.core.lifespan import jenkins
+from mcp_jenkins.jenkins.model.node import dump_nodes
 from mcp_jenkins.server import mcp
 
 
@@ -11,22 +12,24 @@ async def get_all_nodes(ctx: Context) -> list[dict]:
     Returns:
         A list of all nodes
     """
-    return [node.model_dump(exclude={'executors'}) for node in jenkins(ctx).get_nodes(depth=0)]
+    return dump_nodes(await jenkins(ctx).get_nodes(depth=0), exclude={'executors'})
 
 
 @mcp.tool(tags=['read'])
-async def get_node(ctx: Context, name: str) -> dict:
+async def get_node(ctx: Context, name: str, fields: str | None = None) -> dict:
     """Get a specific node from Jenkins
 
     Contains executor about the node.
 
     Args:
         name: The name of the node
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "offline,monitorData[*]").
+                Defaults to the standard fields.
 
     Returns:
         The node
     """
-    return jenkins(ctx).get_node(name=name, depth=2).model_dump(exclude_none=True)
+    return (await jenkins(ctx).get_node(name=name, depth=2, fields=fields)).model_dump(exclude_none=True)
 
 
 @mcp.tool(tags=['read'])
@@ -39,7 +42,7 @@ async def get_node_config(ctx: Context, name: str) -> str:
     Returns:
         The config of the node
     """
-    return jenkins(ctx).get_node_config(name=name)
+    return await jenkins(ctx).get_node_config(name=name)
 
 
 @mcp.tool(tags=['write'])
@@ -50,4 +53,4 @@ async def set_node_config(ctx: Context, name: str, config_xml: str) -> None:
         name: The name of the node
         config_xml: The config XML of the node
     """
-    jenkins(ctx).set_node_config(name=name, config_xml=config_xml)
+    await jenkins(ctx).set_node_config(name=name, config_xml=config_xml)
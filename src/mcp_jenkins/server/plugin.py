@@ -5,20 +5,22 @@ from mcp_jenkins.server import mcp
 
 
 @mcp.tool(tags={'read'})
-async def get_all_plugins(ctx: Context, depth: int = 2) -> list[dict]:
+async def get_all_plugins(ctx: Context, depth: int = 2, fields: str | None = None) -> list[dict]:
     """Get all installed plugins from Jenkins
 
     Args:
         depth: The depth of the information to retrieve. Default is 2 (includes dependencies).
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "shortName,version,hasUpdate").
+                Defaults to the standard fields.
 
     Returns:
         A list of all installed plugins
     """
-    return jenkins(ctx).get_plugins(depth=depth)
+    return await jenkins(ctx).get_plugins(depth=depth, fields=fields)
 
 
 @mcp.tool(tags={'read'})
-async def get_plugin(ctx: Context, short_name: str, depth: int = 2) -> dict | None:
+async def get_plugin(ctx: Context, short_name: str, depth: int = 2, fields: str | None = None) -> dict | None:
     """Get a specific plugin from Jenkins
 
     Contains detailed information about the plugin, including dependencies when depth >= 2.
@@ -26,11 +28,13 @@ async def get_plugin(ctx: Context, short_name: str, depth: int = 2) -> dict | No
     Args:
         short_name: The short name of the plugin
         depth: The depth of the information to retrieve. Default is 2 (includes dependencies).
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "shortName,version,hasUpdate").
+                Defaults to the standard fields.
 
     Returns:
         The plugin details, or None if not found
     """
-    return jenkins(ctx).get_plugin(short_name=short_name, depth=depth)
+    return await jenkins(ctx).get_plugin(short_name=short_name, depth=depth, fields=fields)
 
 
 @mcp.tool(tags={'read'})
@@ -43,7 +47,7 @@ async def get_plugins_with_problems(ctx: Context) -> list[dict]:
     Returns:
         A list of plugins with problems
     """
-    return jenkins(ctx).get_plugins_with_problems()
+    return await jenkins(ctx).get_plugins_with_problems()
 
 
 @mcp.tool(tags={'read'})
@@ -58,7 +62,7 @@ async def get_plugins_with_backup(ctx: Context, depth: int = 0) -> list[dict]:
     Returns:
         A list of plugins that can be downgraded
     """
-    return jenkins(ctx).get_plugins_with_backup(depth=depth)
+    return await jenkins(ctx).get_plugins_with_backup(depth=depth)
 
 
 @mcp.tool(tags={'read'})
@@ -71,7 +75,7 @@ async def get_plugins_with_updates(ctx: Context, depth: int = 0) -> list[dict]:
     Returns:
         A list of plugins with available updates
     """
-    return jenkins(ctx).get_plugins_with_updates(depth=depth)
+    return await jenkins(ctx).get_plugins_with_updates(depth=depth)
 
 
 @mcp.tool(tags={'read'})
@@ -87,4 +91,4 @@ async def get_plugin_dependency_graph(ctx: Context, short_name: str) -> dict:
     Returns:
         A dictionary with 'nodes' and 'edges' for Graphviz rendering
     """
-    return jenkins(ctx).get_plugin_dependency_graph(short_name=short_name)
+    return await jenkins(ctx).get_plugin_dependency_graph(short_name=short_name)
@@ -11,20 +11,22 @@ async def get_all_queue_items(ctx: Context) -> list[dict]:
     Returns:
         A list of all items in the Jenkins queue
     """
-    return [item.model_dump(exclude_none=True, exclude={'task'}) for item in jenkins(ctx).get_queue().items]
+    return [item.model_dump(exclude_none=True, exclude={'task'}) for item in (await jenkins(ctx).get_queue()).items]
 
 
 @mcp.tool(tags=['read'])
-async def get_queue_item(ctx: Context, id: int) -> dict:
+async def get_queue_item(ctx: Context, id: int, fields: str | None = None) -> dict:
     """Get a specific item in Jenkins queue by id
 
     Args:
         id: The id of the queue item
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "blocked,stuck,executable[number,url]").
+                Defaults to the standard fields.
 
     Returns:
         The queue item
     """
-    item = jenkins(ctx).get_queue_item(id=id, depth=1)
+    item = await jenkins(ctx).get_queue_item(id=id, depth=1, fields=fields)
     return item.model_dump(exclude_none=True)
 
 
@@ -35,4 +37,4 @@ async def cancel_queue_item(ctx: Context, id: int) -> None:
     Args:
         id: The id of the queue item
     """
-    jenkins(ctx).cancel_queue_item(id=id)
+    await jenkins(ctx).cancel_queue_item(id=id)
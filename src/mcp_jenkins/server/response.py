@@ -0,0 +1,32 @@
+from fastmcp import Context
+
+from mcp_jenkins.core.middleware import CONTINUATION_TOOL, char_boundary, continuation_key
+from mcp_jenkins.server import mcp
+
+
+@mcp.tool(name=CONTINUATION_TOOL, tags=['read'])
+async def get_response_continuation(ctx: Context, token: str, offset: int = 0) -> dict:
+    """Get a part that was cut out of a truncated tool response, page by page
+
+    Args:
+        token: The continuation token found in the marker of the truncated part
+        offset: Number of bytes of the part to skip, default 0.
+                Call again with the next_offset returned until it is null
+
+    Returns:
+        The text of the page (JSON or plain text) and the next_offset, null on the last page
+    """
+    if offset < 0:
+        raise ValueError(f'Invalid offset: {offset}, it must be 0 or more')
+
+    lifespan_context = ctx.request_context.lifespan_context
+    data = lifespan_context.response_continuations.get(continuation_key(ctx.session_id, token))
+    if data is None:
+        raise ValueError(f'Unknown or expired continuation token: {token}')
+
+    # Pages are as large as the response budget, cut at a character boundary
+    end = char_boundary(data, offset + (lifespan_context.response_max_bytes or len(data)))
+    return {
+        'text': data[offset:end].decode(errors='replace'),
+        'next_offset': end if end < len(data) else None,
+    }
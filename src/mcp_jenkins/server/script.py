@@ -29,4 +29,4 @@ async def run_groovy_script(ctx: Context, script: str) -> str:
             '''
         )
     """
-    return jenkins(ctx).run_script(script=script)
+    return await jenkins(ctx).run_script(script=script)
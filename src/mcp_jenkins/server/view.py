@@ -11,11 +11,11 @@ async def get_all_views(ctx: Context) -> list[dict]:
     Returns:
         A list of views with their name and URL.
     """
-    return jenkins(ctx).get_views()
+    return await jenkins(ctx).get_views()
 
 
 @mcp.tool(tags=['read'])
-async def get_view(ctx: Context, view_path: str, depth: int = 0) -> dict:
+async def get_view(ctx: Context, view_path: str, depth: int = 0, fields: str | None = None) -> dict:
     """Get a Jenkins view by path, returning its jobs and/or nested sub-views.
 
     Views can be nested up to multiple levels deep. Use "/" to separate levels
@@ -27,8 +27,10 @@ async def get_view(ctx: Context, view_path: str, depth: int = 0) -> dict:
                    Examples: "All", "frontend", "frontend/nightly".
                    Spaces and special characters in view names are handled automatically.
         depth: Depth of detail to retrieve for each job. Default is 0.
+        fields: Optional Jenkins tree expression of the fields to return (e.g. "jobs[name,color]").
+                Defaults to the standard fields.
 
     Returns:
         A dict with the view's name, jobs list, and/or nested views.
     """
-    return jenkins(ctx).get_view(view_path=view_path, depth=depth)
+    return await jenkins(ctx).get_view(view_path=view_path, depth=depth, fields=fields)
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from mcp_jenkins.core import JenkinsClientPool
+from mcp_jenkins.core.client_pool import lease_scope
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch('mcp_jenkins.core.client_pool.time.monotonic', return_value=0)
+
+
+def test_key_hashes_password():
+    key = JenkinsClientPool.key(url='https://example.com/', username='username', password='password')
+
+    assert key[:2] == ('https://example.com', 'username')
+    assert 'password' not in key[2]
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_client(mocker, monotonic):
+    pool = JenkinsClientPool()
+    factory = mocker.Mock(return_value=mocker.AsyncMock())
+
+    first = pool.get(url='https://example.com', username='username', password='password', factory=factory)
+    second = pool.get(url='https://example.com/', username='username', password='password', factory=factory)
+
+    assert first is second
+    factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_separates_credentials(mocker, monotonic):
+    pool = JenkinsClientPool()
+
+    first = pool.get(url='https://example.com', username='username', password='a', factory=mocker.AsyncMock)
+    second = pool.get(url='https://example.com', username='username', password='b', factory=mocker.AsyncMock)
+
+    assert first is not second
+    assert len(pool) == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(mocker, monotonic):
+    pool = JenkinsClientPool(max_size=2)
+
+    a = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+    b = pool.get(url='https://b.com', username='u', password='p', factory=mocker.AsyncMock)
+    # Touch a so b becomes the least recently used
+    pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+    pool.get(url='https://c.com', username='u', password='p', factory=mocker.AsyncMock)
+    await asyncio.gather(*pool._closing)
+
+    assert len(pool) == 2
+    b.aclose.assert_awaited_once()
+    a.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_idle_eviction(mocker, monotonic):
+    pool = JenkinsClientPool(idle_timeout=60)
+
+    stale = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+    monotonic.return_value = 61
+    fresh = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+    await asyncio.gather(*pool._closing)
+
+    assert stale is not fresh
+    stale.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_aclose(mocker, monotonic):
+    pool = JenkinsClientPool()
+    client = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+
+    await pool.aclose()
+
+    assert len(pool) == 0
+    client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_leased_client_is_not_idle(mocker, monotonic):
+    pool = JenkinsClientPool(idle_timeout=60)
+
+    async with lease_scope():
+        leased = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+        monotonic.return_value = 61
+        assert pool.get(url='https://b.com', username='u', password='p', factory=mocker.AsyncMock) is not leased
+
+        assert len(pool) == 2
+        leased.aclose.assert_not_awaited()
+
+    # Idle from the end of its lease on
+    monotonic.return_value = 120
+    pool.get(url='https://b.com', username='u', password='p', factory=mocker.AsyncMock)
+    assert len(pool) == 2
+
+
+@pytest.mark.asyncio
+async def test_evicted_client_is_closed_on_release(mocker, monotonic):
+    pool = JenkinsClientPool(max_size=1)
+
+    async with lease_scope():
+        leased = pool.get(url='https://a.com', username='u', password='p', factory=mocker.AsyncMock)
+        pool.get(url='https://b.com', username='u', password='p', factory=mocker.AsyncMock)
+        await asyncio.gather(*pool._closing)
+
+        assert len(pool) == 1
+        leased.aclose.assert_not_awaited()
+
+    leased.aclose.assert_awaited_once()
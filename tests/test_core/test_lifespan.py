@@ -1,7 +1,9 @@
 import pytest
 
+from mcp_jenkins.core import JenkinsClientPool
+from mcp_jenkins.core.client_pool import lease_scope
 from mcp_jenkins.core.lifespan import jenkins, lifespan
-from mcp_jenkins.jenkins import Jenkins
+from mcp_jenkins.jenkins import AsyncJenkinsAdapter, Jenkins
 
 
 class TestLifespan:
@@ -27,6 +29,7 @@ class TestLifespan:
                 'jenkins_password': None,
                 'jenkins_timeout': '5',
                 'jenkins_verify_ssl': 'true',
+                'jenkins_async': 'true',
                 'jenkins_session_singleton': 'true',
             }
             return env.get(key, default)
@@ -38,7 +41,34 @@ class TestLifespan:
             assert context.jenkins_password is None
             assert context.jenkins_timeout == 5
             assert context.jenkins_verify_ssl is True
+            assert context.jenkins_async is True
             assert context.jenkins_session_singleton is True
+            assert context.jenkins_executor is None
+            assert context.jenkins_client_pool_size == 32
+            assert context.jenkins_client_idle_timeout == 300
+            assert len(context.jenkins_client_pool) == 0
+            assert context.jenkins_max_connections == 10
+            assert context.jenkins_keepalive_expiry == 15
+            assert context.jenkins_tcp_keepalive is True
+            assert context.jenkins_cache_size == 256
+            assert context.jenkins_build_cache is True
+            assert context.jenkins_crawl_concurrency == 0
+            assert context.response_max_bytes == 256 * 1024
+            assert len(context.response_continuations) == 0
+
+    @pytest.mark.asyncio
+    async def test_lifespan_worker_threads(self, mocker):
+        env = {'jenkins_worker_threads': '4'}
+        mocker.patch(
+            'mcp_jenkins.core.lifespan.os', mocker.Mock(getenv=lambda key, default=None: env.get(key, default))
+        )
+
+        async with lifespan(mocker.Mock) as context:
+            executor = context.jenkins_executor
+            assert context.jenkins_worker_threads == 4
+            assert executor._max_workers == 4
+
+        assert executor._shutdown is True
 
 
 class TestJenkins:
@@ -60,7 +90,16 @@ class TestJenkins:
                     jenkins_password='password',
                     jenkins_timeout=5,
                     jenkins_verify_ssl=True,
+                    jenkins_async=False,
+                    jenkins_max_connections=10,
+                    jenkins_keepalive_expiry=15,
+                    jenkins_tcp_keepalive=True,
+                    jenkins_cache_size=256,
+                    jenkins_build_cache=False,
+                    jenkins_crawl_concurrency=0,
                     jenkins_session_singleton=False,
+                    jenkins_executor=None,
+                    jenkins_client_pool=JenkinsClientPool(),
                 )
             )
         )
@@ -76,6 +115,11 @@ class TestJenkins:
             password='password',
             timeout=5,
             verify_ssl=True,
+            max_connections=10,
+            tcp_keepalive=True,
+            cache_size=256,
+            build_store_dir=None,
+            crawl_concurrency=0,
         )
 
     def test_exception(self, mock_jenkins, mock_get_http_request, mock_ctx):
@@ -89,6 +133,11 @@ class TestJenkins:
             password='password',
             timeout=5,
             verify_ssl=True,
+            max_connections=10,
+            tcp_keepalive=True,
+            cache_size=256,
+            build_store_dir=None,
+            crawl_concurrency=0,
         )
 
     def test_retrieves_from_request_state(self, mock_jenkins, mock_get_http_request, mock_ctx, mocker):
@@ -108,8 +157,43 @@ class TestJenkins:
             password='state-password',
             timeout=5,
             verify_ssl=True,
+            max_connections=10,
+            tcp_keepalive=True,
+            cache_size=256,
+            build_store_dir=None,
+            crawl_concurrency=0,
+        )
+
+    def test_async_client(self, mock_jenkins, mock_get_http_request, mock_ctx, mocker):
+        mock_async_jenkins = mocker.patch('mcp_jenkins.core.lifespan.AsyncJenkins')
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
+        mock_ctx.request_context.lifespan_context.jenkins_async = True
+
+        assert jenkins(mock_ctx) == mock_async_jenkins.return_value
+        mock_jenkins.assert_not_called()
+        mock_async_jenkins.assert_called_once_with(
+            url='https://jenkins.example.com',
+            username='username',
+            password='password',
+            timeout=5,
+            verify_ssl=True,
+            max_connections=10,
+            tcp_keepalive=True,
+            cache_size=256,
+            build_store_dir=None,
+            crawl_concurrency=0,
+            keepalive_expiry=15,
         )
 
+    def test_sync_client_is_adapted(self, mock_jenkins, mock_get_http_request, mock_ctx):
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
+
+        client = jenkins(mock_ctx)
+
+        assert isinstance(client, AsyncJenkinsAdapter)
+        assert client.jenkins == mock_jenkins.return_value
+        assert client.executor is None
+
     def test_missing_auth(self, mock_get_http_request, mock_ctx):
         mock_get_http_request.side_effect = RuntimeError('Not available http request')
         mock_ctx.request_context.lifespan_context.jenkins_username = None
@@ -117,11 +201,41 @@ class TestJenkins:
         with pytest.raises(ValueError):
             jenkins(mock_ctx)
 
-    def test_ctx_jenkins_exists(self, mock_jenkins, mock_get_http_request, mock_ctx, mocker):
-        existing_jenkins = mocker.Mock()
+    def test_new_client_without_singleton(self, mock_jenkins, mock_get_http_request, mock_ctx):
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
+
+        jenkins(mock_ctx)
+        jenkins(mock_ctx)
+
+        assert mock_jenkins.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_new_client_closed_after_call(self, mock_jenkins, mock_get_http_request, mock_ctx):
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
+
+        async with lease_scope():
+            jenkins(mock_ctx)
+            mock_jenkins.return_value.close.assert_not_called()
 
+        mock_jenkins.return_value.close.assert_called_once()
+
+    def test_pooled_client_shared_across_sessions(self, mock_jenkins, mock_get_http_request, mock_ctx, mocker):
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
         mock_ctx.request_context.lifespan_context.jenkins_session_singleton = True
-        mock_ctx.session.jenkins = existing_jenkins
+        other_session_ctx = mocker.Mock(request_context=mock_ctx.request_context)
 
-        assert jenkins(mock_ctx) == existing_jenkins
-        mock_jenkins.assert_not_called()
+        assert jenkins(mock_ctx) is jenkins(other_session_ctx)
+        mock_jenkins.assert_called_once()
+
+    def test_pooled_client_keyed_by_credentials(self, mock_jenkins, mock_get_http_request, mock_ctx, mocker):
+        mock_ctx.request_context.lifespan_context.jenkins_session_singleton = True
+        mock_get_http_request.return_value = mocker.Mock(
+            state=mocker.Mock(jenkins_url=None, jenkins_username='other-username', jenkins_password=None)
+        )
+
+        from_header = jenkins(mock_ctx)
+        mock_get_http_request.side_effect = RuntimeError('Not available http request')
+        from_env = jenkins(mock_ctx)
+
+        assert from_header is not from_env
+        assert mock_jenkins.call_count == 2
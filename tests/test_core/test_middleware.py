@@ -1,6 +1,15 @@
+import json
+from contextlib import asynccontextmanager
+
 import pytest
+from fastmcp import Client, Context, FastMCP
+from fastmcp.exceptions import ToolError
 
-from mcp_jenkins.core import AuthMiddleware
+from mcp_jenkins.core import AuthMiddleware, ClientLeaseMiddleware, LifespanContext, ResponseBudgetMiddleware
+from mcp_jenkins.core.client_pool import defer_release
+from mcp_jenkins.core.middleware import CONTINUATION_TOOL, truncate_json
+from mcp_jenkins.jenkins.cache import ResponseCache
+from mcp_jenkins.server import response
 
 
 class TestAuthMiddleware:
@@ -104,3 +113,155 @@ class TestAuthMiddleware:
         await middleware(scope, mock_receive, mock_send)
 
         mock_app.assert_called_once_with(scope, mock_receive, mock_send)
+
+
+class TestTruncateJson:
+    def test_fits(self):
+        assert truncate_json({'a': [1, 2]}, 100, lambda part: 'token') == {'a': [1, 2]}
+
+    def test_list_keeps_head_and_tail(self):
+        omitted = []
+        result = truncate_json([{'number': i} for i in range(100)], 300, lambda part: omitted.append(part) or 'token')
+
+        assert result[0] == {'number': 0}
+        assert result[-1] == {'number': 99}
+        marker = next(item for item in result if 'truncated_items' in item)
+        assert marker['continuation'] == 'token'
+        assert len(result) - 1 + marker['truncated_items'] == 100
+        # The removed items are handed over as they were, in order
+        index = result.index(marker)
+        assert [*result[:index], *omitted[0], *result[index + 1 :]] == [{'number': i} for i in range(100)]
+
+    def test_string_keeps_head_and_tail(self):
+        omitted = []
+        result = truncate_json('a' * 500 + 'b' * 500, 300, lambda part: omitted.append(part) or 'token')
+
+        assert result.startswith('a') and result.endswith('b')
+        assert 'bytes truncated, continuation: token' in result
+        assert len(result.encode()) <= 300
+        assert result.replace(result[result.index('\n') : result.rindex('\n') + 1], omitted[0]) == 'a' * 500 + 'b' * 500
+
+    def test_string_is_cut_at_character_boundaries(self):
+        omitted = []
+        result = truncate_json('é' * 500, 300, lambda part: omitted.append(part) or 'token')
+
+        assert '\ufffd' not in result
+        assert set(omitted[0]) == {'é'}
+
+    def test_dict_shrinks_largest_value(self):
+        result = truncate_json({'lines': [f'line {i}' for i in range(200)], 'name': 'job'}, 300, lambda part: 'token')
+
+        assert result['name'] == 'job'
+        assert any('items truncated, continuation: token' in line for line in result['lines'])
+
+
+class TestClientLeaseMiddleware:
+    @pytest.mark.asyncio
+    async def test_releases_after_call(self, mocker):
+        release = mocker.AsyncMock()
+        server = FastMCP('test', middleware=[ClientLeaseMiddleware()])
+
+        @server.tool
+        def lease() -> bool:
+            return defer_release(release)
+
+        async with Client(server) as client:
+            result = await client.call_tool('lease', {})
+
+        assert result.data is True
+        release.assert_awaited_once()
+
+
+class TestResponseBudgetMiddleware:
+    @pytest.fixture
+    def store(self):
+        # Shared by every session, like the store of the real lifespan
+        return ResponseCache(copy=False)
+
+    @pytest.fixture
+    def server(self, store):
+
+        @asynccontextmanager
+        async def lifespan(_app):
+            yield LifespanContext(
+                jenkins_url=None,
+                jenkins_username=None,
+                jenkins_password=None,
+                response_max_bytes=300,
+                response_continuations=store,
+            )
+
+        server = FastMCP('test', lifespan=lifespan, middleware=[ResponseBudgetMiddleware()])
+
+        @server.tool
+        def builds(count: int) -> list[dict]:
+            return [{'number': i} for i in range(count)]
+
+        @server.tool
+        def report(count: int) -> dict:
+            return {'result': [f'line {i}' for i in range(count)]}
+
+        @server.tool(name=CONTINUATION_TOOL)
+        async def get_response_continuation(ctx: Context, token: str, offset: int = 0) -> dict:
+            return await response.get_response_continuation(ctx, token, offset)
+
+        return server
+
+    @pytest.mark.asyncio
+    async def test_small_response_is_untouched(self, server):
+        async with Client(server) as client:
+            result = await client.call_tool('builds', {'count': 2})
+
+        assert result.data == [{'number': 0}, {'number': 1}]
+        assert 'truncated' not in (result.meta or {})
+
+    @pytest.mark.asyncio
+    async def test_large_response_is_truncated(self, server):
+        async with Client(server) as client:
+            result = await client.call_tool_mcp('builds', {'count': 1000})
+
+        assert len(result.content[0].text) <= 300
+        assert result.meta['truncated'] is True
+        assert result.structuredContent['result'][0] == {'number': 0}
+        marker = next(item for item in result.structuredContent['result'] if 'truncated_items' in item)
+        assert result.meta['continuations'] == [marker['continuation']]
+        assert result.structuredContent['result'][-1] == {'number': 999}
+
+    @pytest.mark.asyncio
+    async def test_only_removed_part_is_kept_by_session(self, server):
+        async with Client(server) as client:
+            result = await client.call_tool_mcp('builds', {'count': 1000})
+            pages, offset = [], 0
+            while offset is not None:
+                page = await client.call_tool(
+                    'get_response_continuation', {'token': result.meta['continuations'][0], 'offset': offset}
+                )
+                pages.append(page.data['text'])
+                offset = page.data['next_offset']
+
+        marker = next(item for item in result.structuredContent['result'] if 'truncated_items' in item)
+        assert len(json.loads(''.join(pages))) == marker['truncated_items']
+        assert all(len(page.encode()) <= 300 for page in pages)
+
+        async with Client(server) as client:
+            with pytest.raises(ToolError, match='Unknown or expired continuation token'):
+                await client.call_tool('get_response_continuation', {'token': result.meta['continuations'][0]})
+
+    @pytest.mark.asyncio
+    async def test_dict_with_result_key_is_not_unwrapped(self, server):
+        async with Client(server) as client:
+            result = await client.call_tool_mcp('report', {'count': 1000})
+
+        assert result.meta['truncated'] is True
+        assert set(result.structuredContent) == {'result'}
+        assert result.structuredContent['result'][0] == 'line 0'
+
+    @pytest.mark.asyncio
+    async def test_part_over_store_limit_reads_as_expired(self, server, store):
+        store.max_bytes = 1000
+        async with Client(server) as client:
+            result = await client.call_tool_mcp('builds', {'count': 1000})
+
+            assert result.meta['truncated'] is True
+            with pytest.raises(ToolError, match='Unknown or expired continuation token'):
+                await client.call_tool('get_response_continuation', {'token': result.meta['continuations'][0]})
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_jenkins.jenkins import AsyncJenkinsAdapter
+
+
+@pytest.mark.asyncio
+async def test_methods_are_awaitable(mocker):
+    jenkins = mocker.Mock()
+    jenkins.get_item_config.return_value = '<project/>'
+
+    adapter = AsyncJenkinsAdapter(jenkins)
+
+    assert await adapter.get_item_config(fullname='job') == '<project/>'
+    jenkins.get_item_config.assert_called_once_with(fullname='job')
+
+
+def test_attributes_pass_through(mocker):
+    jenkins = mocker.Mock(url='https://example.com')
+
+    assert AsyncJenkinsAdapter(jenkins).url == 'https://example.com'
+
+
+@pytest.mark.asyncio
+async def test_methods_run_on_executor(mocker):
+    jenkins = mocker.Mock()
+    jenkins.query_items.side_effect = lambda: threading.current_thread().name
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='jenkins') as executor:
+        adapter = AsyncJenkinsAdapter(jenkins, executor=executor)
+
+        assert (await adapter.query_items()).startswith('jenkins')
+
+
+@pytest.mark.asyncio
+async def test_executor_keeps_event_loop_responsive(mocker):
+    jenkins = mocker.Mock()
+    jenkins.query_items.side_effect = lambda: time.sleep(0.2)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        adapter = AsyncJenkinsAdapter(jenkins, executor=executor)
+
+        slow_call = asyncio.create_task(adapter.query_items())
+        started = time.monotonic()
+        await asyncio.sleep(0)
+
+        assert time.monotonic() - started < 0.1
+        await slow_call
+
+
+@pytest.mark.asyncio
+async def test_aclose(mocker):
+    jenkins = mocker.Mock()
+
+    await AsyncJenkinsAdapter(jenkins).aclose()
+
+    jenkins.close.assert_called_once_with()
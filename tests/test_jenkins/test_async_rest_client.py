@@ -0,0 +1,325 @@
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mcp_jenkins.jenkins import AsyncJenkins, rest_endpoint
+from mcp_jenkins.jenkins.build_store import BuildStore
+from mcp_jenkins.jenkins.cache import TTL_ITEM_INDEX
+from mcp_jenkins.jenkins.model.build import Build, ConsoleMatch, ConsoleSearchResult
+from mcp_jenkins.jenkins.tree import model_tree
+
+
+@pytest.fixture
+def routes():
+    return {
+        'https://example.com/crumbIssuer/api/json': httpx.Response(
+            200, json={'crumbRequestField': 'Jenkins-Crumb', 'crumb': 'crumb-value'}
+        ),
+    }
+
+
+@pytest.fixture
+def requests_seen():
+    return []
+
+
+@pytest.fixture
+def jenkins(routes, requests_seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        response = routes[str(request.url)]
+        return response(request) if callable(response) else response
+
+    jenkins = AsyncJenkins(url='https://example.com/', username='username', password='password')
+    jenkins._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return jenkins
+
+
+@pytest.mark.asyncio
+async def test_request_with_crumb(jenkins, routes, requests_seen):
+    routes['https://example.com/api/json'] = httpx.Response(200, json={})
+
+    await jenkins.request('GET', 'api/json')
+
+    assert [str(r.url) for r in requests_seen] == [
+        'https://example.com/crumbIssuer/api/json',
+        'https://example.com/api/json',
+    ]
+    assert requests_seen[-1].headers['Jenkins-Crumb'] == 'crumb-value'
+
+
+@pytest.mark.asyncio
+async def test_crumb_header_404(jenkins, routes):
+    routes['https://example.com/crumbIssuer/api/json'] = httpx.Response(404)
+
+    assert await jenkins.get_crumb_header() == {}
+
+
+@pytest.mark.asyncio
+async def test_retry_on_403_refreshes_crumb(jenkins, routes, requests_seen):
+    jenkins._crumb_header = {'Jenkins-Crumb': 'stale-crumb'}
+    responses = iter([httpx.Response(403), httpx.Response(201)])
+    routes['https://example.com/job/test/build'] = lambda _: next(responses)
+
+    response = await jenkins.request('POST', 'job/test/build')
+
+    assert response.status_code == 201
+    assert requests_seen[-1].headers['Jenkins-Crumb'] == 'crumb-value'
+
+
+@pytest.mark.asyncio
+async def test_request_raises_on_error(jenkins, routes):
+    routes['https://example.com/api/json'] = httpx.Response(500)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await jenkins.request('GET', 'api/json')
+
+
+@pytest.mark.asyncio
+async def test_get_build(jenkins, routes):
+    routes[f'https://example.com/job/folder/job/example-job/1/api/json?tree={model_tree(Build)}'] = httpx.Response(
+        200, json={'number': 1, 'url': 'https://example.com/job/folder/job/example-job/1/', 'building': False}
+    )
+
+    assert await jenkins.get_build(fullname='folder/example-job', number=1) == Build(
+        number=1, url='https://example.com/job/folder/job/example-job/1/', building=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_running_builds(jenkins, routes):
+    routes[f'https://example.com/{rest_endpoint.RUNNING_BUILDS}'] = httpx.Response(
+        200,
+        json={
+            'computer': [
+                {
+                    'displayName': 'Built-In Node',
+                    'executors': [],
+                    'oneOffExecutors': [
+                        {'currentExecutable': {'number': 7, 'url': 'https://example.com/job/pipeline/7/'}},
+                    ],
+                }
+            ]
+        },
+    )
+
+    assert await jenkins.get_running_builds() == [Build(number=7, url='https://example.com/job/pipeline/7/')]
+
+
+@pytest.mark.asyncio
+async def test_get_build_console_output(jenkins, routes, requests_seen):
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(
+        200, text='ERROR: a\r\nINFO: b\nERROR: c\nERROR: d\n'
+    )
+
+    result = await jenkins.get_build_console_output(fullname='example-job', number=1, pattern='ERROR', offset=1)
+
+    assert result == 'ERROR: c\nERROR: d'
+    assert 'Jenkins-Crumb' not in requests_seen[-1].headers
+
+
+@pytest.mark.asyncio
+async def test_get_build_console_output_of_finished_build(jenkins, routes, requests_seen, tmp_path):
+    jenkins._build_store = BuildStore(tmp_path, url=jenkins.url, username='username')
+    routes['https://example.com/job/example-job/1/api/json?tree=building'] = httpx.Response(
+        200, json={'building': False}
+    )
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(200, text='ERROR: a\nINFO: b\n')
+
+    assert await jenkins.get_build_console_output(fullname='example-job', number=1, pattern='ERROR') == 'ERROR: a'
+    assert await jenkins.get_build_console_output(fullname='example-job', number=1, pattern='INFO') == 'INFO: b'
+    assert [request.url.path for request in requests_seen].count('/job/example-job/1/consoleText') == 1
+
+
+@pytest.mark.asyncio
+async def test_build_store_is_used_off_the_event_loop(jenkins, routes, tmp_path, mocker):
+    jenkins._build_store = BuildStore(tmp_path, url=jenkins.url, username='username')
+    routes['https://example.com/job/example-job/1/api/json?tree=building'] = httpx.Response(
+        200, json={'building': False}
+    )
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(200, text='a\nb\nc\n')
+    threads = set()
+    for method in (
+        'is_finished',
+        'has_console_log',
+        'mark_finished',
+        '_atomic_write',
+        'iter_console_log',
+        'map_console_log',
+    ):
+        original = getattr(jenkins._build_store, method)
+
+        def record(*args: object, original: object = original, **kwargs: object) -> object:
+            threads.add(threading.current_thread())
+            return original(*args, **kwargs)
+
+        mocker.patch.object(jenkins._build_store, method, side_effect=record)
+
+    assert await jenkins.get_build_console_output(fullname='example-job', number=1) == 'a\nb\nc'
+    assert await jenkins.get_build_console_output(fullname='example-job', number=1, offset=1) == 'b\nc'
+    assert await jenkins.get_build_console_output(fullname='example-job', number=1, tail=1) == 'c'
+
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_interrupted_console_log_is_dropped_off_the_event_loop(jenkins, routes, tmp_path, mocker):
+    jenkins._build_store = BuildStore(tmp_path, url=jenkins.url, username='username')
+    routes['https://example.com/job/example-job/1/api/json?tree=building'] = httpx.Response(
+        200, json={'building': False}
+    )
+
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            yield b'a\nb\n'
+            msg = 'connection reset'
+            raise httpx.ReadError(msg)
+
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(200, stream=BrokenStream())
+    threads = set()
+    unlink = Path.unlink
+
+    def record(path: Path, **kwargs: object) -> None:
+        threads.add(threading.current_thread())
+        unlink(path, **kwargs)
+
+    mocker.patch.object(Path, 'unlink', autospec=True, side_effect=record)
+
+    with pytest.raises(httpx.ReadError):
+        await jenkins.get_build_console_output(fullname='example-job', number=1)
+
+    assert threads
+    assert threading.main_thread() not in threads
+    assert not jenkins._build_store.has_console_log('example-job', 1)
+    assert not [path for path in tmp_path.rglob('*') if path.name.startswith('.console')]
+
+
+@pytest.mark.asyncio
+async def test_grep_build_console_output(jenkins, routes):
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(
+        200, text='ERROR: a\r\nINFO: b\nERROR: c\n'
+    )
+
+    result = await jenkins.grep_build_console_output(
+        fullname='example-job', number=1, patterns={'errors': 'ERROR'}, after=1
+    )
+
+    assert result == {
+        'errors': [
+            ConsoleMatch(line=1, text='ERROR: a', after=['INFO: b']),
+            ConsoleMatch(line=3, text='ERROR: c'),
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_build_console_output(jenkins, routes):
+    routes['https://example.com/job/example-job/1/consoleText'] = httpx.Response(200, text='ERROR: a\nERROR: b\n')
+    routes['https://example.com/job/example-job/2/consoleText'] = httpx.Response(404)
+
+    assert await jenkins.search_build_console_output(fullname='example-job', number=1, pattern='ERROR') == (
+        ConsoleSearchResult(number=1, count=2, first_match='ERROR: a')
+    )
+    assert await jenkins.search_build_console_output(fullname='example-job', number=2, pattern='ERROR') is None
+
+
+@pytest.mark.asyncio
+async def test_get_build_console_progress(jenkins, routes, requests_seen):
+    routes['https://example.com/job/example-job/1/logText/progressiveText?start=0'] = httpx.Response(
+        200, content=b'line1\npart', headers={'X-Text-Size': '10', 'X-More-Data': 'true'}
+    )
+    routes['https://example.com/job/example-job/1/logText/progressiveText?start=6'] = httpx.Response(
+        200, content=b'partial\n', headers={'X-Text-Size': '14'}
+    )
+
+    first = await jenkins.get_build_console_progress(fullname='example-job', number=1)
+    second = await jenkins.get_build_console_progress(fullname='example-job', number=1, cursor=first.cursor)
+
+    assert (first.text, first.more_data) == ('line1\n', True)
+    assert (second.text, second.more_data) == ('partial\n', False)
+    assert 'Jenkins-Crumb' not in requests_seen[-1].headers
+
+
+@pytest.mark.asyncio
+async def test_get_build_console_output_tail(jenkins, routes, requests_seen):
+    routes['https://example.com/job/example-job/1/logText/progressiveText?start=0'] = httpx.Response(
+        200, content=b'whole log', headers={'X-Text-Size': '100000'}
+    )
+    routes['https://example.com/job/example-job/1/logText/progressiveText?start=34464'] = httpx.Response(
+        200, content=b'xx\nERROR: a\nINFO: b\nERROR: c\n', headers={'X-Text-Size': '100000'}
+    )
+
+    result = await jenkins.get_build_console_output(fullname='example-job', number=1, tail=1, pattern='ERROR')
+
+    assert result == 'ERROR: c'
+    assert [request.url.params['start'] for request in requests_seen] == ['0', '34464']
+
+
+@pytest.mark.asyncio
+async def test_query_items_uses_index(jenkins, routes, requests_seen, mocker):
+    routes['https://example.com/api/json?tree=jobs[url,color,name,lastBuild[number],jobs[name]]'] = httpx.Response(
+        200, json={'jobs': [{'_class': 'Job', 'name': 'a', 'url': 'https://example.com/job/a/', 'color': 'red'}]}
+    )
+    monotonic = mocker.patch('mcp_jenkins.jenkins.item_index.time.monotonic', return_value=0)
+
+    assert [item.fullname for item in await jenkins.query_items()] == ['a']
+    assert await jenkins.query_items(color_pattern='blue') == []
+    assert [request.url.path for request in requests_seen].count('/api/json') == 1
+
+    monotonic.return_value = TTL_ITEM_INDEX
+    assert [item.fullname for item in await jenkins.query_items()] == ['a']
+    await jenkins._item_index_refresh
+    assert [request.url.path for request in requests_seen].count('/api/json') == 2
+
+
+@pytest.mark.asyncio
+async def test_get_items_page(jenkins, routes, requests_seen):
+    routes['https://example.com/api/json?tree=jobs[url,color,name,lastBuild[number],jobs[name]]'] = httpx.Response(
+        200,
+        json={
+            'jobs': [
+                {'_class': 'Job', 'name': f'job-{i}', 'url': f'https://example.com/job/job-{i}/', 'color': 'blue'}
+                for i in range(3)
+            ]
+        },
+    )
+
+    first = await jenkins.get_items_page(page_size=2)
+    last = await jenkins.get_items_page(page_size=2, cursor=first.next_cursor)
+
+    assert [item.fullname for item in first.items] == ['job-0', 'job-1']
+    assert [item.fullname for item in last.items] == ['job-2']
+    assert (last.total, last.next_cursor) == (3, None)
+    assert [request.url.path for request in requests_seen].count('/api/json') == 1
+
+
+@pytest.mark.asyncio
+async def test_set_item_config_sends_raw_body(jenkins, routes, requests_seen):
+    routes['https://example.com/job/example-job/config.xml'] = httpx.Response(200)
+
+    await jenkins.set_item_config(fullname='example-job', config_xml='<project/>')
+
+    assert requests_seen[-1].content == b'<project/>'
+    assert requests_seen[-1].headers['Content-Type'] == 'text/xml; charset=utf-8'
+    assert 'Jenkins-Crumb' not in jenkins.DEFAULT_HEADERS
+
+
+@pytest.mark.asyncio
+async def test_build_item(jenkins, routes):
+    routes['https://example.com/job/example-job/build'] = httpx.Response(
+        201, headers={'Location': 'https://example.com/queue/item/42/'}
+    )
+
+    assert await jenkins.build_item(fullname='example-job', build_type='build') == 42
+
+
+@pytest.mark.asyncio
+async def test_run_script(jenkins, routes, requests_seen):
+    routes['https://example.com/scriptText'] = httpx.Response(200, text='Result: 2.479\n')
+
+    assert await jenkins.run_script('println Jenkins.instance.version') == '2.479'
+    assert requests_seen[-1].content == b'script=println+Jenkins.instance.version'
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from mcp_jenkins.jenkins.build_store import CONSOLE_INDEX, CONSOLE_INDEX_STRIDE, BuildStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BuildStore(tmp_path, url='https://example.com/', username='username')
+
+
+def test_get_put(store):
+    assert store.get('folder/job', 1, 'job/folder/job/job/1/api/json') is None
+
+    store.put('folder/job', 1, 'job/folder/job/job/1/api/json', {'number': 1, 'building': False})
+
+    assert store.get('folder/job', 1, 'job/folder/job/job/1/api/json') == {'number': 1, 'building': False}
+    assert store.is_finished('folder/job', 1)
+    assert not store.is_finished('folder/job', 2)
+
+
+def test_survives_new_instance(store, tmp_path):
+    store.put('job', 1, 'replay', {'scripts': []})
+
+    assert BuildStore(tmp_path, url='https://example.com', username='username').get('job', 1, 'replay') == {
+        'scripts': []
+    }
+    assert BuildStore(tmp_path, url='https://example.com', username='other').get('job', 1, 'replay') is None
+
+
+def test_console_log(store):
+    assert not store.has_console_log('job', 1)
+
+    with store.write_console_log('job', 1) as f:
+        f.write(b'first\r\nsecond\n')
+        f.write(b'third')
+
+    assert store.has_console_log('job', 1)
+    assert list(store.iter_console_log('job', 1)) == ['first', 'second', 'third']
+
+
+@pytest.mark.parametrize('content', [b'', b'first\nsecond\n'])
+def test_map_console_log(store, content):
+    with store.write_console_log('job', 1) as f:
+        f.write(content)
+
+    with store.map_console_log('job', 1) as log:
+        assert log[:] == content
+    assert list(store.iter_console_log('job', 1)) == content.decode().splitlines()
+
+
+def test_console_log_from_line(store):
+    lines = [f'line {i}\r\n'.encode() for i in range(2500)]
+    with store.write_console_log('job', 1) as f:
+        f.write(b''.join(lines))
+
+    assert list(store.iter_console_log('job', 1, start=2498)) == ['line 2498', 'line 2499']
+    assert list(store.iter_console_log('job', 1, start=5)) == [f'line {i}' for i in range(5, 2500)]
+    assert list(store.iter_console_log('job', 1, start=3000)) == []
+    assert store.get('job', 1, CONSOLE_INDEX) == [
+        len(b''.join(lines[:n])) for n in range(0, 2500, CONSOLE_INDEX_STRIDE)
+    ]
+
+
+def test_console_log_is_not_kept_on_error(store):
+    with pytest.raises(ConnectionError), store.write_console_log('job', 1) as f:
+        f.write(b'partial')
+        raise ConnectionError
+
+    assert not store.has_console_log('job', 1)
+
+
+def test_unreadable_entry_is_a_miss(store, tmp_path):
+    store.put('job', 1, 'replay', {'scripts': []})
+    for path in tmp_path.rglob('*.json'):
+        path.write_text('{')
+
+    assert store.get('job', 1, 'replay') is None
+
+
+def test_disabled():
+    store = BuildStore(None, url='https://example.com', username='username')
+    store.put('job', 1, 'replay', {'scripts': []})
+
+    assert not store.enabled
+    assert store.get('job', 1, 'replay') is None
+    assert not store.is_finished('job', 1)
+
+
+def test_evicts_least_recently_used_builds(tmp_path):
+    store = BuildStore(tmp_path, url='https://example.com', username='username', max_bytes=2500)
+    for number in (1, 2):
+        with store.write_console_log('job', number) as f:
+            f.write(b'x' * 1000)
+        os.utime(store.console_log_path('job', number).parent, (number, number))
+    # Reading the first build makes the second the least recently used
+    assert list(store.iter_console_log('job', 1)) == ['x' * 1000]
+
+    with store.write_console_log('other', 1) as f:
+        f.write(b'x' * 1000)
+
+    assert store.has_console_log('job', 1)
+    assert not store.has_console_log('job', 2)
+    assert not store.is_finished('job', 2)
+    assert store.has_console_log('other', 1)
+
+
+def test_keeps_build_being_written(tmp_path):
+    store = BuildStore(tmp_path, url='https://example.com', username='username', max_bytes=100)
+    store.put('job', 1, 'replay', {'scripts': []})
+
+    with store.write_console_log('job', 2) as f:
+        f.write(b'x' * 1000)
+
+    assert store.has_console_log('job', 2)
+    assert store.get('job', 1, 'replay') is None
@@ -0,0 +1,126 @@
+import pytest
+
+from mcp_jenkins.jenkins.cache import TTL_BUILD_FINISHED, TTL_BUILD_RUNNING, ResponseCache, build_ttl
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = mocker.patch('mcp_jenkins.jenkins.cache.time.monotonic', return_value=100.0)
+    yield clock
+
+
+def test_get_set(clock):
+    cache = ResponseCache()
+    cache.set('job/a/api/json', {'name': 'a'}, ttl=10)
+
+    assert cache.get('job/a/api/json') == {'name': 'a'}
+    assert cache.get('job/b/api/json') is None
+
+
+def test_expired_entry_is_dropped(clock):
+    cache = ResponseCache()
+    cache.set('queue/api/json', {'items': []}, ttl=2)
+
+    clock.return_value = 102.0
+
+    assert cache.get('queue/api/json') is None
+    assert len(cache) == 0
+
+
+def test_ttl_callable(clock):
+    cache = ResponseCache()
+    cache.set('job/a/1/api/json', {'building': False}, ttl=build_ttl)
+    cache.set('job/a/2/api/json', {'building': True}, ttl=build_ttl)
+
+    clock.return_value = 100.0 + TTL_BUILD_RUNNING
+
+    assert cache.get('job/a/1/api/json') == {'building': False}
+    assert cache.get('job/a/2/api/json') is None
+
+
+def test_build_ttl():
+    assert build_ttl({'building': False}) == TTL_BUILD_FINISHED
+    assert build_ttl({'building': True}) == TTL_BUILD_RUNNING
+    assert build_ttl({'number': 1}) == TTL_BUILD_RUNNING
+
+
+def test_lru_eviction(clock):
+    cache = ResponseCache(max_size=2)
+    cache.set('a', 1, ttl=10)
+    cache.set('b', 2, ttl=10)
+    cache.get('a')
+    cache.set('c', 3, ttl=10)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_values_are_copied(clock):
+    cache = ResponseCache()
+    value = {'jobs': [{'name': 'a'}]}
+    cache.set('api/json', value, ttl=10)
+
+    value['jobs'].append({'name': 'b'})
+    cache.get('api/json')['jobs'].clear()
+
+    assert cache.get('api/json') == {'jobs': [{'name': 'a'}]}
+
+
+def test_values_are_shared_without_copy(clock):
+    cache = ResponseCache(copy=False)
+    value = [{'name': 'a'}]
+    cache.set('snapshot', value, ttl=10)
+
+    assert cache.get('snapshot') is value
+
+
+def test_invalidate(clock):
+    cache = ResponseCache()
+    for key in ('job/a/api/json', 'job/a/1/api/json', 'job/ab/api/json', 'queue/api/json'):
+        cache.set(key, {}, ttl=10)
+
+    cache.invalidate('job/a/', 'queue/')
+
+    assert cache.get('job/a/api/json') is None
+    assert cache.get('job/a/1/api/json') is None
+    assert cache.get('queue/api/json') is None
+    assert cache.get('job/ab/api/json') == {}
+
+
+def test_disabled():
+    cache = ResponseCache(max_size=0)
+    cache.set('api/json', {}, ttl=10)
+
+    assert cache.get('api/json') is None
+
+
+def test_max_bytes_evicts_least_recently_used(clock):
+    cache = ResponseCache(max_bytes=10, copy=False)
+    cache.set('a', b'1234', ttl=10)
+    cache.set('b', b'1234', ttl=10)
+    cache.get('a')
+    cache.set('c', b'1234', ttl=10)
+
+    assert cache.get('a') == b'1234'
+    assert cache.get('b') is None
+    assert cache.get('c') == b'1234'
+
+
+def test_max_bytes_counts_replaced_and_dropped_values(clock):
+    cache = ResponseCache(max_bytes=10, copy=False)
+    cache.set('a', b'123456', ttl=10)
+    cache.set('a', b'1234', ttl=10)
+    cache.invalidate('a')
+    cache.set('b', b'12345678', ttl=10)
+
+    assert cache.get('b') == b'12345678'
+
+
+def test_value_over_max_bytes_is_not_cached(clock):
+    cache = ResponseCache(max_bytes=10, copy=False)
+    cache.set('a', b'1234', ttl=10)
+    cache.set('b', b'12345678901', ttl=10)
+
+    assert cache.get('a') == b'1234'
+    assert cache.get('b') is None
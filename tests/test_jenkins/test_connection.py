@@ -0,0 +1,46 @@
+import socket
+
+from mcp_jenkins.jenkins.connection import JenkinsHTTPAdapter, PoolUsage, socket_options
+
+
+def test_socket_options_tcp_keepalive():
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options(tcp_keepalive=True)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in socket_options(tcp_keepalive=False)
+
+
+def test_pool_usage_warns_when_saturated(mocker):
+    warning = mocker.patch('mcp_jenkins.jenkins.connection.logger.warning')
+    usage = PoolUsage(max_connections=1)
+
+    with usage.track():
+        assert usage.in_flight == 1
+        warning.assert_not_called()
+
+        with usage.track(), usage.track():
+            assert usage.in_flight == 3
+
+    assert usage.in_flight == 0
+    # Rate limited to a single warning per interval
+    warning.assert_called_once()
+
+
+def test_http_adapter():
+    adapter = JenkinsHTTPAdapter(max_connections=32, tcp_keepalive=True)
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+    assert adapter.poolmanager.connection_pool_kw['socket_options'] == socket_options(tcp_keepalive=True)
+
+
+def test_http_adapter_tracks_requests(mocker):
+    adapter = JenkinsHTTPAdapter(max_connections=1, tcp_keepalive=False)
+    in_flight = []
+    mocker.patch(
+        'mcp_jenkins.jenkins.connection.HTTPAdapter.send',
+        side_effect=lambda *args, **kwargs: in_flight.append(adapter.usage.in_flight),
+    )
+
+    adapter.send(mocker.Mock())
+
+    assert in_flight == [1]
+    assert adapter.usage.in_flight == 0
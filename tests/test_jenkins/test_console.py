@@ -0,0 +1,171 @@
+import re
+
+import pytest
+
+from mcp_jenkins.jenkins.console import (
+    ConsoleGrep,
+    ConsoleLineSelector,
+    ConsoleLineSplitter,
+    ConsolePrefilter,
+    ConsoleTail,
+    compile_prefilter,
+    decode_cursor,
+    encode_cursor,
+    iter_prefiltered_lines,
+    split_console_chunk,
+)
+
+
+def read_tail(log: bytes, selector: ConsoleTail) -> tuple[str, int]:
+    read = 0
+    while (start := selector.next_start(len(log))) is not None:
+        selector.feed(start, log[start:])
+        read += len(log) - start
+    return selector.result(), read
+
+
+def test_line_selector():
+    selector = ConsoleLineSelector(pattern='ERROR', offset=1, limit=1)
+
+    assert [selector.feed(line) for line in ['ERROR: a', 'INFO: b', 'ERROR: c']] == [False, False, True]
+    assert selector.result() == 'ERROR: c'
+
+
+def test_line_selector_cut_at_max_bytes():
+    selector = ConsoleLineSelector(max_bytes=9)
+
+    assert [selector.feed(line) for line in ['abcd', 'é', 'x', 'y']] == [False, False, True, True]
+    assert selector.result() == 'abcd\né'
+    assert selector.cut is True
+
+
+def test_line_selector_keeps_one_line_over_max_bytes():
+    selector = ConsoleLineSelector(max_bytes=2)
+
+    assert selector.feed('abcd') is False
+    assert selector.result() == 'abcd'
+    assert selector.cut is False
+
+
+def test_grep_groups_matches_with_context():
+    grep = ConsoleGrep(patterns={'errors': 'ERROR', 'tests': 'FAILED'}, before=1, after=1)
+
+    for line in ['start', 'ERROR: a', 'test x FAILED', 'ERROR: b', 'end']:
+        grep.feed(line)
+
+    assert {name: [match.model_dump() for match in matches] for name, matches in grep.result().items()} == {
+        'errors': [
+            {'line': 2, 'text': 'ERROR: a', 'before': ['start'], 'after': ['test x FAILED']},
+            {'line': 4, 'text': 'ERROR: b', 'before': ['test x FAILED'], 'after': ['end']},
+        ],
+        'tests': [{'line': 3, 'text': 'test x FAILED', 'before': ['ERROR: a'], 'after': ['ERROR: b']}],
+    }
+
+
+def test_grep_stops_once_every_pattern_is_full():
+    grep = ConsoleGrep(patterns={'errors': 'ERROR'}, after=1, limit=1)
+
+    assert [grep.feed(line) for line in ['ERROR: a', 'next']] == [False, True]
+
+
+def test_tail_reads_only_the_end():
+    log = b''.join(f'line {i}\n'.encode() for i in range(100_000))
+
+    result, read = read_tail(log, ConsoleTail(tail=3, window=64))
+
+    assert result == 'line 99997\nline 99998\nline 99999'
+    assert read < 100
+
+
+def test_tail_grows_the_window():
+    log = b''.join(f'{"ERROR" if i % 1000 == 0 else "INFO"} {i}\n'.encode() for i in range(10_000))
+
+    result, read = read_tail(log, ConsoleTail(tail=2, pattern='ERROR', window=64))
+
+    assert result == 'ERROR 8000\nERROR 9000'
+    assert read < len(log)
+
+
+def test_tail_of_short_log():
+    result, _ = read_tail(b'a\nb', ConsoleTail(tail=10, window=1))
+
+    assert result == 'a\nb'
+
+
+def test_tail_feed_line():
+    selector = ConsoleTail(tail=2)
+    for line in ['a', 'b', 'c']:
+        selector.feed_line(line)
+
+    assert selector.result() == 'b\nc'
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(12, 3456), 12) == 3456
+
+
+@pytest.mark.parametrize('cursor', [encode_cursor(11, 3456), 'not a cursor', encode_cursor(12, -1)])
+def test_cursor_rejects_invalid(cursor):
+    with pytest.raises(ValueError, match='Invalid console cursor for build #12'):
+        decode_cursor(cursor, 12)
+
+
+def test_split_console_chunk_keeps_partial_line_while_running():
+    assert split_console_chunk(100, b'a\nb\npart', size=108, more_data=True) == ('a\nb\n', 104)
+    assert split_console_chunk(100, b'part', size=104, more_data=True) == ('', 100)
+    assert split_console_chunk(100, b'a\nb\npart', size=108, more_data=False) == ('a\nb\npart', 108)
+
+
+def test_split_console_chunk_with_stripped_annotations_ends_at_size():
+    assert split_console_chunk(0, b'a\npart', size=50, more_data=True) == ('a\npart', 50)
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'prefilter'),
+    [
+        ('ERROR', b'ERROR'),
+        ('ERROR|FAILED', b'ERROR|FAILED'),
+        (r'\[ERROR\] .*failed', b'\\[ERROR\\]\\ '),
+        ('BUILD (SUCCESS|FAILURE)', b'SUCCESS|FAILURE'),
+        ('(?i)error', None),
+        (r'\d+', None),
+        (r'(ERROR|\d)', None),
+        ('ERROR\nFAILED', None),
+    ],
+)
+def test_compile_prefilter(pattern, prefilter):
+    compiled = compile_prefilter(pattern)
+    assert (compiled.pattern if compiled else None) == prefilter
+
+
+@pytest.mark.parametrize('pattern', ['ERROR', 'ERROR: [ab]', '^WARN|FAILED$', 'x(ERROR|é)'])
+def test_prefiltered_lines_match_like_line_by_line(pattern):
+    log = 'ERROR: a\r\nWARN: b\nFAILED\nlater ERROR: b\nxé\nWARN FAILED x\nERROR'.encode()
+    compiled = re.compile(pattern)
+
+    scanner = ConsolePrefilter(compile_prefilter(pattern))
+    chunked = [line for i in range(0, len(log), 7) for line in scanner.feed(log[i : i + 7])] + list(scanner.close())
+
+    expected = [line for line in log.decode().splitlines() if compiled.search(line)]
+    assert [line for line in iter_prefiltered_lines(log, compile_prefilter(pattern)) if compiled.search(line)] == (
+        expected
+    )
+    assert [line for line in chunked if compiled.search(line)] == expected
+
+
+def test_prefilter_carries_a_long_line_over_many_chunks():
+    scanner = ConsolePrefilter(compile_prefilter('ERROR'))
+
+    assert [line for _ in range(1000) for line in scanner.feed(b'x' * 10)] == []
+    assert list(scanner.feed(b'ERROR\nnext')) == ['x' * 10_000 + 'ERROR']
+    assert list(scanner.close()) == []
+
+
+def test_reads_split_lines_alike():
+    log = b'a\rb\r\nc\x0bd\n\ne'
+    expected = ['a\rb', 'c\x0bd', '', 'e']
+
+    splitter = ConsoleLineSplitter()
+    assert [*splitter.feed(log), *splitter.close()] == expected
+    assert read_tail(log, ConsoleTail(tail=10))[0] == '\n'.join(expected)
+    assert list(iter_prefiltered_lines(log, compile_prefilter('b', 'd'))) == ['a\rb', 'c\x0bd']
@@ -0,0 +1,70 @@
+from mcp_jenkins.jenkins.failure import FailureExtractor
+
+LOG = [
+    'Started by user admin',
+    *[f'[INFO] step {i}' for i in range(50)],
+    '[ERROR] Tests run: 3, Failures: 1',
+    'java.lang.IllegalStateException: boom',
+    '\tat com.example.Foo.bar(Foo.java:12)',
+    'Caused by: java.io.IOException: disk',
+    '\tat com.example.Io.read(Io.java:1)',
+    *[f'[INFO] cleanup {i}' for i in range(50)],
+    'ERROR: script returned exit code 1',
+    'Finished: FAILURE',
+]
+
+
+def extract(lines: list[str], **kwargs: int) -> FailureExtractor:
+    extractor = FailureExtractor(**kwargs)
+    for line in lines:
+        extractor.feed(line)
+    return extractor
+
+
+def test_ranks_stack_trace_then_tail():
+    excerpts = extract(LOG, tail=3).result()
+
+    assert [(excerpt.kind, excerpt.start, excerpt.end) for excerpt in excerpts] == [
+        ('stack_trace', 49, 59),
+        ('tail', 106, 108),
+    ]
+    assert excerpts[0].text.splitlines()[3:8] == LOG[51:56]
+    assert excerpts[1].text == '[INFO] cleanup 49\nERROR: script returned exit code 1\nFinished: FAILURE'
+
+
+def test_respects_byte_budget():
+    excerpts = extract(LOG, tail=3, max_bytes=100).result()
+
+    assert [excerpt.kind for excerpt in excerpts] == ['stack_trace']
+    assert len(excerpts[0].text.encode()) <= 100
+
+
+def test_region_stops_at_max_region_lines():
+    log = [
+        'Started',
+        'java.lang.IllegalStateException: boom',
+        *[f'\tat com.example.Foo.f{i}(Foo.java:{i})' for i in range(50)],
+    ]
+
+    excerpts = extract([*log, 'Finished: FAILURE'], tail=1, max_region_lines=10).result()
+
+    region = next(excerpt for excerpt in excerpts if excerpt.kind == 'stack_trace')
+    assert (region.start, region.end) == (1, 10)
+    assert region.text.splitlines() == log[:10]
+
+
+def test_cut_region_ends_at_its_last_line():
+    excerpts = extract(LOG, tail=3, max_bytes=100).result()
+
+    assert excerpts[0].end - excerpts[0].start + 1 == len(excerpts[0].text.splitlines())
+
+
+def test_keeps_only_the_best_regions():
+    lines = [line for i in range(100) for line in (f'ERROR: {i}', 'ok', 'ok', 'ok')]
+    extractor = extract(lines, tail=1, max_regions=5)
+
+    assert [region.start for region in extractor.regions] == [378, 382, 386, 390, 394]
+
+
+def test_successful_build_only_has_tail():
+    assert [excerpt.kind for excerpt in extract(['building', 'Finished: SUCCESS']).result()] == ['tail']
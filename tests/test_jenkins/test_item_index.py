@@ -0,0 +1,127 @@
+import math
+
+import pytest
+
+from mcp_jenkins.jenkins.item_index import ITEM_SYNC_MIN_INTERVAL, ItemIndex, ItemMirror, _anchored_prefix
+from mcp_jenkins.jenkins.model.item import Folder, FreeStyleProject, Job, UnknownItem
+
+
+@pytest.fixture
+def index():
+    return ItemIndex(
+        [
+            Folder(class_='com.cloudbees.hudson.plugins.folder.Folder', name='team', url='1', fullname='team', jobs=[]),
+            Job(class_='WorkflowJob', name='api', url='2', fullname='team/api', color='blue'),
+            FreeStyleProject(
+                class_='hudson.model.FreeStyleProject', name='web', url='3', fullname='team/web', color='red'
+            ),
+            Job(class_='WorkflowJob', name='deploy', url='4', fullname='deploy', color='red_anime'),
+            UnknownItem(class_='Unknown', name='none', url='5'),
+        ]
+    )
+
+
+def fullnames(items):
+    return [item.fullname for item in items]
+
+
+def test_anchored_prefix():
+    assert _anchored_prefix('^team/a') == 'team/a'
+    assert _anchored_prefix('^team/.*') == 'team/'
+    assert _anchored_prefix('team') == ''
+    assert _anchored_prefix('(?i)^team') == ''
+    assert _anchored_prefix('^(') == ''
+
+
+def test_query_all(index):
+    # Items without fullname never match, the order of the items is kept
+    assert fullnames(index.query()) == ['team', 'team/api', 'team/web', 'deploy']
+    assert len(index) == 4
+
+
+def test_query_class_and_color(index):
+    assert fullnames(index.query(class_pattern='WorkflowJob')) == ['team/api', 'deploy']
+    assert fullnames(index.query(color_pattern='^red')) == ['team/web', 'deploy']
+    assert fullnames(index.query(class_pattern='WorkflowJob', color_pattern='red')) == ['deploy']
+    # Only jobs have a color
+    assert fullnames(index.query(color_pattern='.*')) == ['team/api', 'team/web', 'deploy']
+
+
+def test_query_fullname(index):
+    assert fullnames(index.query(fullname_pattern='^team/')) == ['team/api', 'team/web']
+    assert fullnames(index.query(fullname_pattern='^team/w')) == ['team/web']
+    assert fullnames(index.query(fullname_pattern='oy$')) == ['deploy']
+    assert fullnames(index.query(fullname_pattern='^te', color_pattern='blue')) == ['team/api']
+
+
+def test_query_folder_depth(index):
+    assert fullnames(index.query(folder_depth=0)) == ['team', 'deploy']
+    assert fullnames(index.query(folder_depth=1, color_pattern='red')) == ['team/web', 'deploy']
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.patch('mcp_jenkins.jenkins.item_index.time.monotonic', return_value=0)
+
+
+def test_mirror_intervals(clock):
+    mirror = ItemMirror()
+    assert mirror.due() == ['']
+    assert mirror.staleness() == math.inf
+
+    mirror.update('', signature=(1,), items=[], folders=[])
+    assert mirror.due() == []
+
+    # A quiet folder is listed less and less often, a changed one soon again
+    clock.return_value = ITEM_SYNC_MIN_INTERVAL
+    assert mirror.due() == ['']
+    mirror.update('', signature=(1,), items=[], folders=[])
+    clock.return_value += ITEM_SYNC_MIN_INTERVAL
+    assert mirror.due() == []
+    assert mirror.due(max_age=ITEM_SYNC_MIN_INTERVAL - 1) == ['']
+
+    clock.return_value += ITEM_SYNC_MIN_INTERVAL
+    mirror.update('', signature=(2,), items=[], folders=[])
+    clock.return_value += ITEM_SYNC_MIN_INTERVAL
+    assert mirror.due() == ['']
+    assert mirror.staleness() == ITEM_SYNC_MIN_INTERVAL
+
+
+def test_mirror_folders(clock):
+    job = Job(class_='Job', name='job', url='1', fullname='a/b/job', color='blue')
+    mirror = ItemMirror()
+    mirror.widen(None)
+
+    mirror.update('', signature=(), items=['a'], folders=['a'])
+    assert mirror.due() == ['a']
+    mirror.update('a', signature=(), items=['a/b'], folders=['a/b'])
+    mirror.update('a/b', signature=(), items=[job], folders=[])
+    assert mirror.items() == ['a', 'a/b', job]
+
+    # Dropping a folder drops its whole subtree
+    mirror.update('', signature=(), items=[], folders=[])
+    mirror.update('a/b', signature=(), items=[job], folders=[])
+    assert mirror.items() == []
+    assert mirror.due(max_age=-1) == ['']
+
+
+def test_mirror_folder_depth(clock):
+    mirror = ItemMirror()
+
+    mirror.update('', signature=(), items=['a'], folders=['a'])
+    # The sub-folders are only listed once a query reaches that deep
+    assert mirror.due() == []
+    assert not mirror.needs_sync(folder_depth=0)
+    assert mirror.needs_sync(folder_depth=1)
+
+    mirror.widen(1)
+    assert mirror.due() == ['a']
+    mirror.update('a', signature=(), items=['a/b'], folders=['a/b'])
+    assert not mirror.needs_sync(folder_depth=1)
+    assert mirror.needs_sync()
+
+    # A narrower query never narrows the mirror back
+    mirror.widen(0)
+    assert mirror.folder_depth == 1
+    mirror.widen(None)
+    assert mirror.due() == ['a/b']
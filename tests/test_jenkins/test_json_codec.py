@@ -0,0 +1,30 @@
+import pytest
+
+from mcp_jenkins.jenkins import json_codec
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, mocker):
+    if request.param == 'json':
+        mocker.patch.object(json_codec, 'orjson', None)
+    return request.param
+
+
+def test_loads(backend):
+    assert json_codec.loads(b'{"name":"caf\xc3\xa9","jobs":[1,2.5,null,true]}') == {
+        'name': 'café',
+        'jobs': [1, 2.5, None, True],
+    }
+    assert json_codec.loads('[]') == []
+
+
+def test_loads_stdlib_extensions(backend):
+    assert json_codec.loads(b'{"duration": NaN}')['duration'] != 0
+
+
+def test_dumps(backend):
+    assert json_codec.dumps({'name': 'café', 'jobs': [1, None]}) == '{"name":"café","jobs":[1,null]}'.encode()
+
+
+def test_dumps_stdlib_fallback(backend):
+    assert json_codec.dumps({1: 2**70}) == b'{"1":1180591620717411303424}'
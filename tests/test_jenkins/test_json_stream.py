@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from mcp_jenkins.jenkins.json_stream import JSONArrayStream
+
+PAYLOAD = {
+    '_class': 'hudson.model.Hudson',
+    'description': 'brackets ] } and "quotes" in strings',
+    'views': [{'name': 'all', 'jobs': [1, 2.5, None]}],
+    'jobs': [
+        {'name': 'café', 'url': 'https://example.com/job/caf%C3%A9/', 'color': 'blue'},
+        {'name': 'folder', 'jobs': [{'name': 'nested', 'jobs': []}]},
+        {'name': 'numbers', 'lastBuild': {'number': 12345, 'duration': 1.25e3}},
+    ],
+    'primaryView': {'name': 'all'},
+}
+
+
+def read(stream, body, size):
+    elements = []
+    for start in range(0, len(body), size):
+        elements.extend(stream.feed(body[start : start + size]))
+    return elements + stream.close()
+
+
+@pytest.mark.parametrize('size', [1, 3, 64, 1 << 20])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_elements(size, indent):
+    body = json.dumps(PAYLOAD, indent=indent, ensure_ascii=False).encode()
+
+    assert read(JSONArrayStream('jobs'), body, size) == PAYLOAD['jobs']
+
+
+def test_elements_as_they_arrive():
+    stream = JSONArrayStream('jobs')
+
+    assert stream.feed(b'{"_class": "x", "jobs": [{"name": "a"}, {"na') == [{'name': 'a'}]
+    assert stream.feed(b'me": "b"}, 12') == [{'name': 'b'}]
+    # The number may go on in the next chunk
+    assert stream.feed(b'3]}') == [123]
+    assert stream.close() == []
+
+
+def test_missing_array():
+    assert read(JSONArrayStream('plugins'), json.dumps(PAYLOAD).encode(), 16) == []
+
+
+@pytest.mark.parametrize('body', [b'{"jobs": [{"name": "a"}, {"name"', b'{"jobs": [1, }', b'[{"jobs": []}]'])
+def test_invalid(body):
+    with pytest.raises(ValueError):
+        read(JSONArrayStream('jobs'), body, 4)
@@ -1,13 +1,29 @@
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from requests import HTTPError
 
 from mcp_jenkins.jenkins import Jenkins
-from mcp_jenkins.jenkins.model.build import Artifact, Build, BuildReplay
+from mcp_jenkins.jenkins.cache import TTL_ITEM_INDEX
+from mcp_jenkins.jenkins.console import encode_cursor
+from mcp_jenkins.jenkins.item_index import ITEM_SYNC_MIN_INTERVAL
+from mcp_jenkins.jenkins.model.build import (
+    Artifact,
+    Build,
+    BuildReplay,
+    ConsoleChunk,
+    ConsoleExcerpt,
+    ConsoleMatch,
+    ConsoleSearchResult,
+)
 from mcp_jenkins.jenkins.model.item import (
     Folder,
     FreeStyleProject,
     Job,
-    MultiBranchProject,
+    dump_items,
 )
 from mcp_jenkins.jenkins.model.node import (
     Node,
@@ -15,6 +31,8 @@ from mcp_jenkins.jenkins.model.node import (
     NodeExecutorCurrentExecutable,
 )
 from mcp_jenkins.jenkins.model.queue import Queue, QueueItem, QueueItemTask
+from mcp_jenkins.jenkins.model.view import View
+from mcp_jenkins.jenkins.tree import model_tree
 
 
 @pytest.fixture(autouse=True)
@@ -40,6 +58,19 @@ def jenkins(mocker):
     return jenkins
 
 
+def json_response(mocker, data, **attributes: object):
+    body = json.dumps(data).encode()
+    return mocker.Mock(**{'content': body, 'iter_content': lambda chunk_size: [body], **attributes})
+
+
+def test_mounts_pooled_adapter(mock_session):
+    Jenkins(url='https://example.com/', username='username', password='password', max_connections=32)
+
+    adapter = mock_session.mount.call_args_list[0].args[1]
+    assert [call.args[0] for call in mock_session.mount.call_args_list] == ['http://', 'https://']
+    assert adapter.usage.max_connections == 32
+
+
 def test_endpoint_url(jenkins):
     assert jenkins.endpoint_url('/api/json') == jenkins.endpoint_url('api/json') == 'https://example.com/api/json'
 
@@ -80,11 +111,12 @@ class TestCrumbHeader:
         mocker.patch.object(
             jenkins,
             'request',
-            return_value=mocker.Mock(
-                json=lambda: {
+            return_value=json_response(
+                mocker,
+                {
                     'crumbRequestField': 'Jenkins-Crumb',
                     'crumb': 'crumb-value',
-                }
+                },
             ),
         )
         assert jenkins.crumb_header == {'Jenkins-Crumb': 'crumb-value'}
@@ -123,9 +155,8 @@ class TestCrumbRetry:
         success_resp = mocker.Mock(status_code=201)
         success_resp.raise_for_status.return_value = None
 
-        crumb_resp = mocker.Mock(
-            status_code=200,
-            json=lambda: {'crumbRequestField': 'Jenkins-Crumb', 'crumb': 'fresh-crumb'},
+        crumb_resp = json_response(
+            mocker, {'crumbRequestField': 'Jenkins-Crumb', 'crumb': 'fresh-crumb'}, status_code=200
         )
         crumb_resp.raise_for_status.return_value = None
 
@@ -191,9 +222,8 @@ class TestCrumbRetry:
         forbidden_resp = mocker.Mock(status_code=403)
         forbidden_resp.raise_for_status.side_effect = HTTPError(response=forbidden_resp)
 
-        crumb_resp = mocker.Mock(
-            status_code=200,
-            json=lambda: {'crumbRequestField': 'Jenkins-Crumb', 'crumb': 'fresh-crumb'},
+        crumb_resp = json_response(
+            mocker, {'crumbRequestField': 'Jenkins-Crumb', 'crumb': 'fresh-crumb'}, status_code=200
         )
         crumb_resp.raise_for_status.return_value = None
 
@@ -219,6 +249,218 @@ def test_parse_fullname(jenkins):
     )
 
 
+class TestResponseCache:
+    @pytest.fixture
+    def jenkins(self, mocker):
+        jenkins = Jenkins(url='https://example.com/', username='username', password='password', cache_size=16)
+        mocker.patch.object(
+            Jenkins,
+            'crumb_header',
+            new_callable=mocker.PropertyMock,
+            return_value={'Jenkins-Crumb': 'crumb-value'},
+        )
+        return jenkins
+
+    @pytest.fixture(autouse=True)
+    def item_response(self, mock_session, mocker):
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
+                '_class': 'hudson.model.FreeStyleProject',
+                'name': 'example-job',
+                'url': 'https://example.com/job/folder/job/example-job/',
+                'fullName': 'folder/example-job',
+                'color': 'blue',
+            },
+            text='Result: 1',
+            headers={'Location': 'https://example.com/queue/item/7/'},
+        )
+
+    def test_repeated_read_is_cached(self, jenkins, mock_session):
+        assert jenkins.get_item(fullname='folder/example-job') == jenkins.get_item(fullname='folder/example-job')
+
+        assert mock_session.request.call_count == 1
+
+    def test_hits_are_decoded_apart(self, jenkins, mock_session):
+        # The parsing helpers mutate the payloads, a hit must not see the changes of a previous one
+        jenkins._get_json('job/folder/job/example-job/api/json', ttl=60)['name'] = 'changed'
+
+        assert jenkins._get_json('job/folder/job/example-job/api/json', ttl=60)['name'] == 'example-job'
+        assert mock_session.request.call_count == 1
+
+    @pytest.mark.parametrize(
+        'write',
+        [
+            lambda jenkins: jenkins.set_item_config(fullname='folder/example-job', config_xml='<project/>'),
+            lambda jenkins: jenkins.build_item(fullname='folder/example-job', build_type='build'),
+            lambda jenkins: jenkins.stop_build(fullname='folder/example-job', number=1),
+            lambda jenkins: jenkins.run_script('println 1'),
+        ],
+    )
+    def test_write_invalidates(self, jenkins, mock_session, write):
+        jenkins.get_item(fullname='folder/example-job')
+        write(jenkins)
+        jenkins.get_item(fullname='folder/example-job')
+
+        assert mock_session.request.call_count == 3
+
+    def test_unrelated_write_keeps_entry(self, jenkins, mock_session):
+        jenkins.get_item(fullname='folder/example-job')
+        jenkins.cancel_queue_item(id=7)
+        jenkins.get_item(fullname='folder/example-job')
+
+        assert mock_session.request.call_count == 2
+
+
+class TestBuildStore:
+    @pytest.fixture
+    def jenkins(self, mocker, tmp_path):
+        jenkins = Jenkins(
+            url='https://example.com/', username='username', password='password', build_store_dir=tmp_path
+        )
+        mocker.patch.object(
+            Jenkins,
+            'crumb_header',
+            new_callable=mocker.PropertyMock,
+            return_value={'Jenkins-Crumb': 'crumb-value'},
+        )
+        return jenkins
+
+    def test_finished_build_is_stored(self, jenkins, mock_session, mocker, tmp_path):
+        mock_session.request.return_value = json_response(
+            mocker, {'number': 1, 'url': 'https://example.com/job/example-job/1/', 'building': False}
+        )
+
+        build = jenkins.get_build(fullname='example-job', number=1)
+        restarted = Jenkins(
+            url='https://example.com/', username='username', password='password', build_store_dir=tmp_path
+        )
+
+        assert restarted.get_build(fullname='example-job', number=1) == build
+        assert mock_session.request.call_count == 1
+
+    def test_running_build_is_not_stored(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(
+            mocker, {'number': 1, 'url': 'https://example.com/job/example-job/1/', 'building': True}
+        )
+
+        jenkins.get_build(fullname='example-job', number=1)
+        jenkins.get_build(fullname='example-job', number=1)
+
+        assert mock_session.request.call_count == 2
+
+    def test_console_output_of_finished_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(
+            iter_content=lambda chunk_size: [b'ERROR: a\nINFO: b\n', b'ERROR: c']
+        )
+
+        first = jenkins.get_build_console_output(fullname='example-job', number=1, pattern='ERROR')
+        second = jenkins.get_build_console_output(fullname='example-job', number=1, limit=1)
+
+        assert first == 'ERROR: a\nERROR: c'
+        assert second == 'ERROR: a'
+        assert mock_session.request.call_count == 1
+        assert mock_session.get.call_count == 1
+
+    def test_console_output_page_of_finished_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(
+            iter_content=lambda chunk_size: [b''.join(f'line {i}\n'.encode() for i in range(5000))]
+        )
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, offset=4321, limit=2) == (
+            'line 4321\nline 4322'
+        )
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, pattern='9$', offset=2, limit=1) == (
+            'line 29'
+        )
+
+    def test_search_console_output_of_finished_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(iter_content=lambda chunk_size: [b'ERROR: a\nINFO: b\nERROR: c\n'])
+
+        for _ in range(2):
+            assert jenkins.search_build_console_output(fullname='example-job', number=1, pattern='ERROR') == (
+                ConsoleSearchResult(number=1, count=2, first_match='ERROR: a')
+            )
+        assert mock_session.get.call_count == 1
+
+    def test_search_console_output_of_missing_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value.raise_for_status.side_effect = HTTPError(
+            response=mocker.Mock(status_code=404)
+        )
+
+        assert jenkins.search_build_console_output(fullname='example-job', number=1, pattern='ERROR') is None
+
+    def test_console_tail_of_finished_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(
+            iter_content=lambda chunk_size: [b'ERROR: a\nINFO: b\n', b'ERROR: c\nINFO: d\n']
+        )
+
+        jenkins.get_build_console_output(fullname='example-job', number=1)
+
+        # The log stored by the full read is tailed from the disk
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, tail=2) == 'ERROR: c\nINFO: d'
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, tail=1, pattern='INFO') == 'INFO: d'
+        assert mock_session.get.call_count == 1
+
+    def test_console_tail_does_not_store(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(content=b'a\nb\n', headers={'X-Text-Size': '4'})
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, tail=1) == 'b'
+        assert not jenkins._build_store.has_console_log('example-job', 1)
+
+    def test_console_output_of_running_build(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': True})
+        mock_session.get.return_value = mocker.Mock(iter_content=lambda chunk_size: [b'a\r\nb'])
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1) == 'a\nb'
+        assert jenkins.get_build_console_output(fullname='example-job', number=1) == 'a\nb'
+        assert mock_session.get.call_count == 2
+
+    def test_console_output_limit_stops_reading(self, jenkins, mock_session, mocker, tmp_path):
+        chunks = iter([b'line\n' * 10] * 1000)
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(iter_content=lambda chunk_size: chunks)
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, limit=3) == 'line\nline\nline'
+        # The read stopped at the first chunk, and the partial log was not stored
+        assert len(list(chunks)) == 999
+        assert not jenkins._build_store.has_console_log('example-job', 1)
+        assert not list(tmp_path.rglob('*console.log*'))
+
+    def test_console_output_full_read_is_stored(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(iter_content=lambda chunk_size: [b'a\nb', b'\nc\n'])
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, offset=1) == 'b\nc'
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, limit=1) == 'a'
+        assert mock_session.get.call_count == 1
+
+    def test_console_output_cut_at_max_bytes(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'building': False})
+        mock_session.get.return_value = mocker.Mock(
+            iter_content=lambda chunk_size: [b''.join(f'line {i}\n'.encode() for i in range(100))]
+        )
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, offset=5, max_bytes=20) == (
+            'line 5\nline 6\n... [output cut at 20 bytes, continue with offset=7] ...'
+        )
+
+    def test_parameters_of_finished_build(self, jenkins, mock_session, mocker):
+        mock_session.request.side_effect = [
+            json_response(mocker, {'building': False}),
+            json_response(mocker, {'actions': [{'parameters': [{'name': 'env', 'value': 'prod'}]}]}),
+        ]
+
+        assert jenkins.get_build_parameters(fullname='example-job', number=1) == {'env': 'prod'}
+        assert jenkins.get_build_parameters(fullname='example-job', number=1) == {'env': 'prod'}
+        assert mock_session.request.call_count == 2
+
+
 class TestView:
     def test_build_view_path(self, jenkins):
         assert jenkins._build_view_path('All') == 'view/All'
@@ -228,13 +470,14 @@ class TestView:
         )
 
     def test_get_views(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'views': [
                     {'name': 'All', 'url': 'https://example.com/view/All/'},
                     {'name': 'frontend', 'url': 'https://example.com/view/frontend/'},
                 ]
-            }
+            },
         )
 
         assert jenkins.get_views() == [
@@ -252,8 +495,9 @@ class TestView:
         )
 
     def test_get_view(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'name': 'frontend',
                 'jobs': [
                     {
@@ -262,7 +506,7 @@ class TestView:
                         'color': 'blue',
                     }
                 ],
-            }
+            },
         )
 
         result = jenkins.get_view(view_path='frontend')
@@ -280,7 +524,7 @@ class TestView:
 
         mock_session.request.assert_called_once_with(
             method='GET',
-            url='https://example.com/view/frontend/api/json?depth=0',
+            url=f'https://example.com/view/frontend/api/json?tree={model_tree(View)}',
             headers={'Jenkins-Crumb': 'crumb-value'},
             params=None,
             data=None,
@@ -288,8 +532,9 @@ class TestView:
         )
 
     def test_get_view_nested(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'name': 'nightly linux',
                 'jobs': [
                     {
@@ -298,7 +543,7 @@ class TestView:
                         'color': 'blue',
                     }
                 ],
-            }
+            },
         )
 
         result = jenkins.get_view(view_path='frontend/nightly/nightly linux')
@@ -308,7 +553,7 @@ class TestView:
 
         mock_session.request.assert_called_once_with(
             method='GET',
-            url='https://example.com/view/frontend/view/nightly/view/nightly%20linux/api/json?depth=0',
+            url=f'https://example.com/view/frontend/view/nightly/view/nightly%20linux/api/json?tree={model_tree(View)}',
             headers={'Jenkins-Crumb': 'crumb-value'},
             params=None,
             data=None,
@@ -318,8 +563,9 @@ class TestView:
 
 class TestQueue:
     def test_get_queue(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'items': [
                     {
                         'id': 1,
@@ -334,7 +580,7 @@ class TestQueue:
                     }
                 ],
                 'discoverableItems': [],
-            }
+            },
         )
 
         assert jenkins.get_queue() == Queue(
@@ -355,8 +601,9 @@ class TestQueue:
         )
 
     def test_get_queue_item(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'id': 1,
                 'inQueueSince': 1767975558000,
                 'url': 'https://example.com/queue/item/1/',
@@ -366,7 +613,7 @@ class TestQueue:
                     'name': 'example-job',
                     'url': 'https://example.com/job/example-job/',
                 },
-            }
+            },
         )
 
         assert jenkins.get_queue_item(id=1) == QueueItem(
@@ -381,6 +628,31 @@ class TestQueue:
             ),
         )
 
+    def test_get_queue_item_fields(self, jenkins, mock_session, mocker):
+        # What Jenkins answers to the projection: task carries only its _class
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
+                'id': 1,
+                'inQueueSince': 1767975558000,
+                'url': 'https://example.com/queue/item/1/',
+                'why': None,
+                'task': {'_class': 'hudson.model.FreeStyleProject'},
+                'blocked': False,
+                'stuck': False,
+                'executable': {'number': 3, 'url': 'https://example.com/job/example-job/3/'},
+            },
+        )
+
+        item = jenkins.get_queue_item(id=1, depth=1, fields='blocked,stuck,executable[number,url]')
+
+        assert item.task == QueueItemTask()
+        assert item.executable == {'number': 3, 'url': 'https://example.com/job/example-job/3/'}
+        assert mock_session.request.call_args.kwargs['url'] == (
+            'https://example.com/queue/item/1/api/json'
+            '?tree=id,inQueueSince,url,why,task,blocked,stuck,executable[number,url]'
+        )
+
     def test_cancel_queue_item(self, jenkins, mock_session):
         assert jenkins.cancel_queue_item(id=42) is None
         mock_session.request.assert_called_once_with(
@@ -395,8 +667,9 @@ class TestQueue:
 
 class TestNode:
     def test_get_node(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'displayName': 'node-1',
                 'offline': False,
                 'executors': [
@@ -409,7 +682,7 @@ class TestNode:
                         }
                     }
                 ],
-            }
+            },
         )
 
         assert jenkins.get_node(name='node-1') == Node(
@@ -429,16 +702,36 @@ class TestNode:
 
         mock_session.request.assert_called_once_with(
             method='GET',
-            url='https://example.com/computer/node-1/api/json?depth=0',
+            url=f'https://example.com/computer/node-1/api/json?tree={model_tree(Node)}',
             headers={'Jenkins-Crumb': 'crumb-value'},
             params=None,
             data=None,
             timeout=75,
         )
 
+    def test_get_node_fields(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
+                'displayName': 'node-1',
+                'offline': True,
+                'executors': [{'_class': 'hudson.model.Executor'}],
+                'monitorData': {'hudson.node_monitors.ArchitectureMonitor': 'Linux (amd64)'},
+            },
+        )
+
+        node = jenkins.get_node(name='node-1', depth=2, fields='offline,monitorData[*]')
+
+        assert node.executors == [NodeExecutor()]
+        assert node.monitorData == {'hudson.node_monitors.ArchitectureMonitor': 'Linux (amd64)'}
+        assert mock_session.request.call_args.kwargs['url'] == (
+            'https://example.com/computer/node-1/api/json?tree=displayName,offline,executors,monitorData[*]'
+        )
+
     def test_get_node_master(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'displayName': 'Built-In Node',
                 'offline': False,
                 'executors': [
@@ -451,7 +744,7 @@ class TestNode:
                         }
                     }
                 ],
-            }
+            },
         )
 
         assert jenkins.get_node(name='Built-In Node') == Node(
@@ -471,7 +764,7 @@ class TestNode:
 
         mock_session.request.assert_called_once_with(
             method='GET',
-            url='https://example.com/computer/(master)/api/json?depth=0',
+            url=f'https://example.com/computer/(master)/api/json?tree={model_tree(Node)}',
             headers={'Jenkins-Crumb': 'crumb-value'},
             params=None,
             data=None,
@@ -479,8 +772,9 @@ class TestNode:
         )
 
     def test_get_nodes(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'computer': [
                     {
                         'displayName': 'node-1',
@@ -493,7 +787,7 @@ class TestNode:
                         'executors': [],
                     },
                 ]
-            }
+            },
         )
 
         assert jenkins.get_nodes() == [
@@ -526,8 +820,9 @@ class TestNode:
 
 class TestBuild:
     def test_get_build(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'number': 2,
                 'url': 'https://example.com/job/example-job/2/',
                 'timestamp': 1767975558000,
@@ -540,7 +835,7 @@ class TestBuild:
                     'number': 1,
                     'url': 'https://example.com/job/example-job/1/',
                 },
-            }
+            },
         )
 
         assert jenkins.get_build(fullname='example-job', number=1) == Build(
@@ -560,7 +855,7 @@ class TestBuild:
 
     def _mock_console_lines(self, mock_session, mocker, lines: list[str]):
         mock_response = mocker.Mock()
-        mock_response.iter_lines.return_value = iter(lines)
+        mock_response.iter_content.return_value = iter([''.join(f'{line}\n' for line in lines).encode()])
         mock_session.get.return_value = mock_response
         return mock_response
 
@@ -621,6 +916,68 @@ class TestBuild:
         jenkins.get_build_console_output(fullname='example-job', number=1, limit=2)
         mock_response.close.assert_called_once()
 
+    def test_get_build_console_output_tail(self, jenkins, mock_session, mocker):
+        first = mocker.Mock(headers={'X-Text-Size': '100000'})
+        window = mocker.Mock(content=b'xx\nERROR: a\nINFO: b\nERROR: c\nINFO: d\n', headers={'X-Text-Size': '100000'})
+        mock_session.get.side_effect = [first, window]
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, tail=1, pattern='ERROR') == 'ERROR: c'
+        # The first read only tells the size of the log, its body is never read
+        first.close.assert_called_once()
+        assert not first.iter_content.called
+        assert [call.args[0] for call in mock_session.get.call_args_list] == [
+            'https://example.com/job/example-job/1/logText/progressiveText?start=0',
+            'https://example.com/job/example-job/1/logText/progressiveText?start=34464',
+        ]
+
+        # The size is remembered, the next tail only reads the end of the log
+        mock_session.get.reset_mock(side_effect=True)
+        mock_session.get.return_value = mocker.Mock(
+            content=b'partial\nline1\nline2\n', headers={'X-Text-Size': '100000'}
+        )
+
+        assert jenkins.get_build_console_output(fullname='example-job', number=1, tail=2, offset=5) == 'line1\nline2'
+        mock_session.get.assert_called_once_with(
+            'https://example.com/job/example-job/1/logText/progressiveText?start=34464', timeout=75, stream=True
+        )
+
+    def test_grep_build_console_output(self, jenkins, mock_session, mocker):
+        mock_response = self._mock_console_lines(mock_session, mocker, ['ERROR: a', 'WARN: b', 'ERROR: c', 'd'])
+
+        result = jenkins.grep_build_console_output(
+            fullname='example-job', number=1, patterns={'errors': 'ERROR', 'warnings': 'WARN'}, limit=1
+        )
+
+        assert result == {
+            'errors': [ConsoleMatch(line=1, text='ERROR: a')],
+            'warnings': [ConsoleMatch(line=2, text='WARN: b')],
+        }
+        mock_session.get.assert_called_once()
+        mock_response.close.assert_called_once()
+
+    def test_get_build_failure_excerpt(self, jenkins, mock_session, mocker):
+        self._mock_console_lines(mock_session, mocker, ['step', 'ERROR: boom', 'Finished: FAILURE'])
+
+        assert jenkins.get_build_failure_excerpt(fullname='example-job', number=1) == [
+            ConsoleExcerpt(kind='tail', start=1, end=3, text='step\nERROR: boom\nFinished: FAILURE')
+        ]
+
+    def test_get_build_console_progress(self, jenkins, mock_session, mocker):
+        mock_session.get.return_value = mocker.Mock(
+            content=b'line1\nline2\npart', headers={'X-Text-Size': '116', 'X-More-Data': 'true'}
+        )
+
+        chunk = jenkins.get_build_console_progress(fullname='example-job', number=1, cursor=encode_cursor(1, 100))
+
+        assert chunk == ConsoleChunk(text='line1\nline2\n', cursor=encode_cursor(1, 112), more_data=True)
+        mock_session.get.assert_called_once_with(
+            'https://example.com/job/example-job/1/logText/progressiveText?start=100', timeout=75, stream=True
+        )
+
+    def test_get_build_console_progress_rejects_cursor_of_another_build(self, jenkins):
+        with pytest.raises(ValueError, match='Invalid console cursor'):
+            jenkins.get_build_console_progress(fullname='example-job', number=2, cursor=encode_cursor(1, 100))
+
     def test_stop_build(self, jenkins, mock_session):
         assert jenkins.stop_build(fullname='example-job', number=42) is None
 
@@ -647,8 +1004,9 @@ class TestBuild:
         )
 
     def test_get_build_parameters(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'actions': [
                     {
                         '_class': 'hudson.model.ParametersAction',
@@ -658,7 +1016,7 @@ class TestBuild:
                         ],
                     },
                 ]
-            }
+            },
         )
 
         assert jenkins.get_build_parameters(fullname='example-job', number=1) == {
@@ -676,13 +1034,14 @@ class TestBuild:
         )
 
     def test_get_build_parameters_no_params(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(json=lambda: {'actions': []})
+        mock_session.request.return_value = json_response(mocker, {'actions': []})
 
         assert jenkins.get_build_parameters(fullname='example-job', number=1) == {}
 
     def test_get_build_test_report(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'suites': [
                     {
                         'name': 'Example Suite',
@@ -701,7 +1060,7 @@ class TestBuild:
                         ],
                     }
                 ]
-            }
+            },
         )
 
         assert jenkins.get_build_test_report(fullname='example-job', number=1) == {
@@ -726,25 +1085,34 @@ class TestBuild:
         }
 
     def test_get_running_builds(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'computer': [
                     {
                         'displayName': 'node-1',
-                        'offline': False,
                         'executors': [
                             {
                                 'currentExecutable': {
                                     'number': 3,
                                     'url': 'https://example.com/job/example-job/3/',
                                     'timestamp': 1767975558000,
-                                    'fullDisplayName': 'Example Job #3',
+                                }
+                            },
+                            {'currentExecutable': None},
+                        ],
+                        'oneOffExecutors': [
+                            {
+                                'currentExecutable': {
+                                    'number': 7,
+                                    'url': 'https://example.com/job/pipeline/7/',
+                                    'timestamp': 1767975559000,
                                 }
                             }
                         ],
                     }
                 ]
-            }
+            },
         )
 
         assert jenkins.get_running_builds() == [
@@ -752,12 +1120,29 @@ class TestBuild:
                 url='https://example.com/job/example-job/3/',
                 number=3,
                 timestamp=1767975558000,
-            )
+            ),
+            Build(
+                url='https://example.com/job/pipeline/7/',
+                number=7,
+                timestamp=1767975559000,
+            ),
         ]
 
+        mock_session.request.assert_called_once_with(
+            method='GET',
+            url='https://example.com/computer/api/json?tree=computer[displayName,'
+            'executors[currentExecutable[number,url,timestamp]],'
+            'oneOffExecutors[currentExecutable[number,url,timestamp]]]',
+            headers={'Jenkins-Crumb': 'crumb-value'},
+            params=None,
+            data=None,
+            timeout=75,
+        )
+
     def test_get_build_artifacts(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'artifacts': [
                     {
                         'fileName': 'index.html',
@@ -770,7 +1155,7 @@ class TestBuild:
                         'displayPath': 'trace.zip',
                     },
                 ]
-            }
+            },
         )
 
         assert jenkins.get_build_artifacts(fullname='example-job', number=1) == [
@@ -792,7 +1177,7 @@ class TestBuild:
         )
 
     def test_get_build_artifacts_empty(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(json=lambda: {'artifacts': []})
+        mock_session.request.return_value = json_response(mocker, {'artifacts': []})
 
         assert jenkins.get_build_artifacts(fullname='example-job', number=1) == []
 
@@ -832,123 +1217,10 @@ class TestBuild:
 
 
 class TestItem:
-    def test_get_items(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
-                'jobs': [
-                    {
-                        'name': 'example-job',
-                        'url': 'https://example.com/job/example-job/',
-                        '_class': 'hudson.model.WorkflowJob',
-                        'color': 'blue',
-                        'fullName': 'example-job',
-                    },
-                    {
-                        'name': 'example-folder',
-                        'url': 'https://example.com/job/example-folder/',
-                        '_class': 'com.cloudbees.hudson.plugins.folder.Folder',
-                        'fullName': 'example-folder',
-                        'jobs': [
-                            {
-                                'name': 'nested-job',
-                                'url': 'https://example.com/job/example-folder/job/nested-job/',
-                                '_class': 'hudson.model.FreeStyleProject',
-                                'color': 'red',
-                                'fullname': 'example-folder',
-                            },
-                            {
-                                'name': 'nested-multibranch',
-                                'url': 'https://example.com/job/example-folder/job/nested-multibranch',
-                                '_class': 'org.jenkinsci.plugins.workflow.multibranch.WorkflowMultiBranchProject',
-                                'fullname': 'example-multibranch',
-                                'jobs': [
-                                    {
-                                        'name': 'example-job',
-                                        'url': 'https://example.com/job/example-folder/job/nested-multibranch/job/example-job/',
-                                        '_class': 'hudson.model.WorkflowJob',
-                                        'color': 'blue',
-                                        'fullname': 'example-multibranch/job/example-job',
-                                    }
-                                ],
-                            },
-                        ],
-                    },
-                ]
-            }
-        )
-
-        assert jenkins.get_items() == [
-            Job(
-                class_='hudson.model.WorkflowJob',
-                name='example-job',
-                url='https://example.com/job/example-job/',
-                fullname='example-job',
-                color='blue',
-            ),
-            Folder(
-                class_='com.cloudbees.hudson.plugins.folder.Folder',
-                name='example-folder',
-                url='https://example.com/job/example-folder/',
-                fullname='example-folder',
-                jobs=[
-                    FreeStyleProject(
-                        class_='hudson.model.FreeStyleProject',
-                        name='nested-job',
-                        url='https://example.com/job/example-folder/job/nested-job/',
-                        fullname='example-folder',
-                        color='red',
-                    ),
-                    MultiBranchProject(
-                        class_='org.jenkinsci.plugins.workflow.multibranch.WorkflowMultiBranchProject',
-                        name='nested-multibranch',
-                        url='https://example.com/job/example-folder/job/nested-multibranch',
-                        fullname='example-multibranch',
-                        jobs=[
-                            Job(
-                                class_='hudson.model.WorkflowJob',
-                                name='example-job',
-                                url='https://example.com/job/example-folder/job/nested-multibranch/job/example-job/',
-                                fullname='example-multibranch/job/example-job',
-                                color='blue',
-                            )
-                        ],
-                    ),
-                ],
-            ),
-            FreeStyleProject(
-                class_='hudson.model.FreeStyleProject',
-                name='nested-job',
-                url='https://example.com/job/example-folder/job/nested-job/',
-                fullname='example-folder',
-                color='red',
-            ),
-            MultiBranchProject(
-                class_='org.jenkinsci.plugins.workflow.multibranch.WorkflowMultiBranchProject',
-                name='nested-multibranch',
-                url='https://example.com/job/example-folder/job/nested-multibranch',
-                fullname='example-multibranch',
-                jobs=[
-                    Job(
-                        class_='hudson.model.WorkflowJob',
-                        name='example-job',
-                        url='https://example.com/job/example-folder/job/nested-multibranch/job/example-job/',
-                        fullname='example-multibranch/job/example-job',
-                        color='blue',
-                    )
-                ],
-            ),
-            Job(
-                class_='hudson.model.WorkflowJob',
-                name='example-job',
-                url='https://example.com/job/example-folder/job/nested-multibranch/job/example-job/',
-                fullname='example-multibranch/job/example-job',
-                color='blue',
-            ),
-        ]
-
     def test_get_item(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'name': 'example-folder',
                 'url': 'https://example.com/job/example-folder/',
                 '_class': 'com.cloudbees.hudson.plugins.folder.Folder',
@@ -962,7 +1234,7 @@ class TestItem:
                         'fullname': 'example-folder/example-job',
                     }
                 ],
-            }
+            },
         )
 
         assert jenkins.get_item(fullname='example-folder') == Folder(
@@ -981,6 +1253,25 @@ class TestItem:
             ],
         )
 
+    def test_get_last_build_number(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'lastBuild': {'number': 42}})
+
+        assert jenkins.get_last_build_number(fullname='folder/example-job') == 42
+
+        mock_session.request.assert_called_once_with(
+            method='GET',
+            url='https://example.com/job/folder/job/example-job/api/json?tree=lastBuild[number]',
+            headers={'Jenkins-Crumb': 'crumb-value'},
+            params=None,
+            data=None,
+            timeout=75,
+        )
+
+    def test_get_last_build_number_never_built(self, jenkins, mock_session, mocker):
+        mock_session.request.return_value = json_response(mocker, {'lastBuild': None})
+
+        assert jenkins.get_last_build_number(fullname='example-job') is None
+
     def test_get_item_config(self, jenkins, mock_session, mocker):
         mock_session.request.return_value = mocker.Mock(text='<project>config</project>')
 
@@ -1004,8 +1295,9 @@ class TestItem:
         )
 
     def test_query_items(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.get.return_value = json_response(
+            mocker,
+            {
                 'jobs': [
                     {
                         'name': 'example-job',
@@ -1022,7 +1314,7 @@ class TestItem:
                         'fullName': 'another-job',
                     },
                 ]
-            }
+            },
         )
 
         assert jenkins.query_items(
@@ -1059,6 +1351,197 @@ class TestItem:
             )
         ]
 
+    def test_query_items_streams_listing(self, jenkins, mock_session, mocker):
+        body = json.dumps(
+            {
+                '_class': 'hudson.model.Hudson',
+                'jobs': [
+                    {'name': f'job-{i}', 'url': f'https://example.com/job/job-{i}/', '_class': 'Job', 'color': 'blue'}
+                    for i in range(50)
+                ],
+            }
+        ).encode()
+        # The body arrives in small chunks, elements are cut across them
+        mock_session.get.return_value = mocker.Mock(
+            iter_content=lambda chunk_size: [body[i : i + 7] for i in range(0, len(body), 7)]
+        )
+
+        assert [item.fullname for item in jenkins.query_items()] == [f'job-{i}' for i in range(50)]
+        assert mock_session.get.call_args.kwargs['stream'] is True
+
+    def test_query_items_uses_index(self, jenkins, mock_session, mocker):
+        mock_session.get.return_value = json_response(
+            mocker,
+            {
+                'jobs': [{'name': 'a', 'url': 'https://example.com/job/a/', '_class': 'Job', 'color': 'blue'}],
+            },
+        )
+        monotonic = mocker.patch('mcp_jenkins.jenkins.item_index.time.monotonic', return_value=0)
+
+        assert [item.fullname for item in jenkins.query_items(color_pattern='blue')] == ['a']
+        assert jenkins.query_items(color_pattern='red') == []
+        assert mock_session.get.call_count == 1
+
+        # A stale index still answers while it is rebuilt in the background
+        monotonic.return_value = TTL_ITEM_INDEX
+        assert [item.fullname for item in jenkins.query_items()] == ['a']
+        jenkins._item_index_refresh.join()
+        assert mock_session.get.call_count == 2
+        assert jenkins._item_index.age() == 0
+
+    def test_query_items_syncs_due_folders(self, jenkins, mock_session, mocker):
+        query = 'tree=jobs[url,color,name,lastBuild[number],jobs[name]]'
+        responses = {
+            f'https://example.com/api/json?{query}': [
+                {'name': 'folder', 'url': 'https://example.com/job/folder/', '_class': 'Folder', 'jobs': [{}]},
+            ],
+            f'https://example.com/job/folder/api/json?{query}': [
+                {
+                    'name': 'job',
+                    'url': 'https://example.com/job/folder/job/job/',
+                    '_class': 'Job',
+                    'color': 'blue',
+                    'lastBuild': {'number': 1},
+                },
+            ],
+        }
+        mock_session.get.side_effect = lambda url, **kwargs: json_response(
+            mocker, {'jobs': [dict(job) for job in responses[url]]}
+        )
+        clock = mocker.patch('mcp_jenkins.jenkins.item_index.time.monotonic', return_value=0)
+
+        assert [item.fullname for item in jenkins.query_items()] == ['folder', 'folder/job']
+        assert mock_session.get.call_count == 2
+
+        # The staleness bound lists every folder older than it again
+        clock.return_value = ITEM_SYNC_MIN_INTERVAL
+        responses[f'https://example.com/job/folder/api/json?{query}'][0]['lastBuild'] = {'number': 2}
+        jenkins.query_items(max_staleness=ITEM_SYNC_MIN_INTERVAL - 1)
+        assert mock_session.get.call_count == 4
+
+        # Only the folder whose listing changed is due again soon
+        clock.return_value = 2 * ITEM_SYNC_MIN_INTERVAL
+        jenkins._sync_item_index()
+        assert mock_session.get.call_args.args[0] == f'https://example.com/job/folder/api/json?{query}'
+        assert mock_session.get.call_count == 5
+
+    def test_query_items_down_to_folder_depth(self, jenkins, mock_session, mocker):
+        query = 'tree=jobs[url,color,name,lastBuild[number],jobs[name]]'
+        responses = {
+            f'https://example.com/api/json?{query}': [
+                {'name': 'job', 'url': 'https://example.com/job/job/', '_class': 'Job', 'color': 'blue'},
+                {'name': 'folder', 'url': 'https://example.com/job/folder/', '_class': 'Folder', 'jobs': [{}]},
+                {'name': 'empty', 'url': 'https://example.com/job/empty/', '_class': 'Folder', 'jobs': []},
+            ],
+            f'https://example.com/job/folder/api/json?{query}': [
+                {'name': 'sub', 'url': 'https://example.com/job/folder/job/sub/', '_class': 'Folder', 'jobs': [{}]},
+            ],
+            f'https://example.com/job/folder/job/sub/api/json?{query}': [
+                {
+                    'name': 'nested',
+                    'url': 'https://example.com/job/folder/job/sub/job/nested/',
+                    '_class': 'Job',
+                    'color': 'red',
+                },
+            ],
+        }
+        mock_session.get.side_effect = lambda url, **kwargs: json_response(
+            mocker, {'jobs': [dict(job) for job in responses[url]]}
+        )
+        mocker.patch('mcp_jenkins.jenkins.item_index.time.monotonic', return_value=0)
+
+        # Only the root is listed, its folders come without jobs
+        items = jenkins.query_items(folder_depth=0)
+        assert [item.fullname for item in items] == ['job', 'folder', 'empty']
+        assert dump_items(items)[1] == {
+            'class_': 'Folder',
+            'name': 'folder',
+            'url': 'https://example.com/job/folder/',
+            'fullname': 'folder',
+        }
+        assert mock_session.get.call_count == 1
+
+        # A deeper query lists the folders below, the empty one is never listed
+        assert [item.fullname for item in jenkins.query_items()] == [
+            'job',
+            'folder',
+            'empty',
+            'folder/sub',
+            'folder/sub/nested',
+        ]
+        assert mock_session.get.call_count == 3
+
+    def test_query_items_cold_start_syncs_once(self, jenkins, mock_session, mocker):
+        def listing(url: str, **kwargs: object) -> object:
+            time.sleep(0.05)
+            return json_response(
+                mocker, {'jobs': [{'name': 'a', 'url': 'https://example.com/job/a/', '_class': 'Job', 'color': 'blue'}]}
+            )
+
+        mock_session.get.side_effect = listing
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: jenkins.query_items(), range(4)))
+
+        assert all([item.fullname for item in result] == ['a'] for result in results)
+        assert mock_session.get.call_count == 1
+
+    def test_get_items_page(self, jenkins, mock_session, mocker):
+        mock_session.get.return_value = json_response(
+            mocker,
+            {
+                'jobs': [
+                    {'name': f'job-{i}', 'url': f'https://example.com/job/job-{i}/', '_class': 'Job', 'color': 'blue'}
+                    for i in range(5)
+                ]
+            },
+        )
+
+        first = jenkins.get_items_page(page_size=2)
+        second = jenkins.get_items_page(page_size=2, cursor=first.next_cursor)
+        last = jenkins.get_items_page(page_size=2, cursor=second.next_cursor)
+
+        assert [item.fullname for item in first.items] == ['job-0', 'job-1']
+        assert [item.fullname for item in second.items] == ['job-2', 'job-3']
+        assert [item.fullname for item in last.items] == ['job-4']
+        assert (first.total, last.next_cursor) == (5, None)
+        # The following pages are sliced out of the snapshot of the first one
+        assert mock_session.get.call_count == 1
+
+    def test_get_items_page_filtered(self, jenkins, mock_session, mocker):
+        mock_session.get.return_value = json_response(
+            mocker,
+            {
+                'jobs': [
+                    {'name': 'a', 'url': 'https://example.com/job/a/', '_class': 'Job', 'color': 'blue'},
+                    {'name': 'b', 'url': 'https://example.com/job/b/', '_class': 'Job', 'color': 'red'},
+                ]
+            },
+        )
+
+        page = jenkins.get_items_page(color_pattern='red', page_size=10)
+
+        assert [item.fullname for item in page.items] == ['b']
+        assert (page.total, page.next_cursor) == (1, None)
+
+    def test_get_items_page_invalid_cursor(self, jenkins):
+        with pytest.raises(ValueError, match='Invalid page cursor'):
+            jenkins.get_items_page(cursor='not a cursor')
+
+        with pytest.raises(ValueError, match='Expired page cursor'):
+            # A well formed cursor ('gone:2') of a snapshot that is no longer cached
+            jenkins.get_items_page(cursor='Z29uZToy')
+
+        with pytest.raises(ValueError, match='Invalid page cursor'):
+            jenkins.get_items_page(cursor=base64.urlsafe_b64encode(b'gone:-2').decode())
+
+    @pytest.mark.parametrize('page_size', [0, -1])
+    def test_get_items_page_invalid_page_size(self, jenkins, mock_session, page_size):
+        with pytest.raises(ValueError, match=f'Invalid page size: {page_size}, it must be 1 or more'):
+            jenkins.get_items_page(page_size=page_size)
+
+        mock_session.get.assert_not_called()
+
     def test_build_item(self, jenkins, mock_session, mocker):
         mock_session.request.return_value = mocker.Mock(
             status_code=201, headers={'Location': 'https://example.com/queue/item/123/'}
@@ -1085,13 +1568,14 @@ class TestItem:
 
 class TestPlugin:
     def test_get_plugins(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0', 'enabled': True},
                     {'shortName': 'plugin-b', 'version': '2.0', 'enabled': False},
                 ]
-            }
+            },
         )
 
         assert jenkins.get_plugins(depth=0) == [
@@ -1100,25 +1584,27 @@ class TestPlugin:
         ]
 
     def test_get_plugin_found(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0'},
                     {'shortName': 'plugin-b', 'version': '2.0'},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugin(short_name='plugin-b')
         assert result == {'shortName': 'plugin-b', 'version': '2.0'}
 
     def test_get_plugin_not_found(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0'},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugin(short_name='nonexistent')
@@ -1128,15 +1614,17 @@ class TestPlugin:
         pass
 
     def test_get_plugins_with_problems_missing_dependency(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1147,7 +1635,7 @@ class TestPlugin:
                         ],
                     },
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -1156,15 +1644,17 @@ class TestPlugin:
         assert missing_dep['dependency'] == 'missing-dep'
 
     def test_get_plugins_with_problems_optional_dependency_ignored(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1175,7 +1665,7 @@ class TestPlugin:
                         ],
                     },
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -1183,15 +1673,17 @@ class TestPlugin:
         assert missing_optional is not None
 
     def test_get_plugins_with_problems_version_mismatch(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1203,7 +1695,7 @@ class TestPlugin:
                     },
                     {'shortName': 'dep-plugin', 'version': '1.5'},
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -1211,15 +1703,17 @@ class TestPlugin:
         assert version_issue is not None
 
     def test_get_plugins_with_problems_installed_version_higher_no_issue(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1231,7 +1725,7 @@ class TestPlugin:
                     },
                     {'shortName': 'dep-plugin', 'version': '2.0'},
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -1239,13 +1733,14 @@ class TestPlugin:
         assert version_issue is None
 
     def test_get_plugins_with_updates(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0', 'hasUpdate': True},
                     {'shortName': 'plugin-b', 'version': '2.0', 'hasUpdate': False},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugins_with_updates()
@@ -1253,13 +1748,14 @@ class TestPlugin:
         assert result[0]['shortName'] == 'plugin-a'
 
     def test_get_plugins_with_backup(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0', 'backupVersion': '0.9', 'downgradable': True},
                     {'shortName': 'plugin-b', 'version': '2.0'},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugins_with_backup()
@@ -1268,8 +1764,9 @@ class TestPlugin:
         assert result[0]['backupVersion'] == '0.9'
 
     def test_get_plugin_dependency_graph(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1286,7 +1783,7 @@ class TestPlugin:
                     },
                     {'shortName': 'plugin-c', 'version': '1.0', 'dependencies': []},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugin_dependency_graph('plugin-a')
@@ -1296,12 +1793,13 @@ class TestPlugin:
         assert len(result['edges']) == 2
 
     def test_get_plugin_dependency_graph_not_found(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {'shortName': 'plugin-a', 'version': '1.0', 'dependencies': []},
                 ]
-            }
+            },
         )
 
         result = jenkins.get_plugin_dependency_graph('nonexistent')
@@ -1309,15 +1807,17 @@ class TestPlugin:
         assert result['error'] == 'Plugin not found: nonexistent'
 
     def test_get_plugins_with_problems_disabled_plugin(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1326,7 +1826,7 @@ class TestPlugin:
                         'dependencies': [],
                     },
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -1335,15 +1835,17 @@ class TestPlugin:
         assert disabled['shortName'] == 'plugin-a'
 
     def test_get_plugins_with_problems_optional_version_mismatch(self, jenkins, mock_session, mocker):
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'version': '2.479.3',
-            }
+            },
         )
         mock_session.request.return_value.headers = {'X-Jenkins': '2.479.3'}
 
-        mock_session.request.return_value = mocker.Mock(
-            json=lambda: {
+        mock_session.request.return_value = json_response(
+            mocker,
+            {
                 'plugins': [
                     {
                         'shortName': 'plugin-a',
@@ -1355,7 +1857,7 @@ class TestPlugin:
                     },
                     {'shortName': 'optional-dep', 'version': '1.5'},
                 ]
-            }
+            },
         )
 
         problems = jenkins.get_plugins_with_problems()
@@ -0,0 +1,35 @@
+from mcp_jenkins.jenkins.model.build import Build
+from mcp_jenkins.jenkins.model.plugin import Plugin
+from mcp_jenkins.jenkins.model.queue import QueueItem
+from mcp_jenkins.jenkins.model.view import View
+from mcp_jenkins.jenkins.tree import model_tree
+
+
+def test_model_tree_depth_0():
+    assert model_tree(Build) == (
+        'number,url,timestamp,duration,estimatedDuration,building,result,'
+        'nextBuild[number,url],previousBuild[number,url]'
+    )
+
+
+def test_model_tree_nested_model_below_depth_keeps_required_fields():
+    assert model_tree(View) == 'name,url,description,jobs[_class,name,url,color],views[name,url]'
+
+
+def test_model_tree_expands_nested_models_with_depth():
+    assert model_tree(QueueItem) == 'id,inQueueSince,url,why,task'
+    assert model_tree(QueueItem, depth=1) == 'id,inQueueSince,url,why,task[fullDisplayName,name,url]'
+    assert model_tree(Plugin, depth=1).endswith(',dependencies[shortName,version,optional]')
+
+
+def test_model_tree_fields_override():
+    assert model_tree(Build, fields='result,actions[causes[shortDescription]]') == (
+        'number,url,result,actions[causes[shortDescription]]'
+    )
+
+
+def test_model_tree_fields_override_keeps_required_nested_fields():
+    assert model_tree(QueueItem, fields='blocked,executable[number,url]') == (
+        'id,inQueueSince,url,why,task,blocked,executable[number,url]'
+    )
+    assert model_tree(View, fields='jobs[color]') == 'name,url,jobs[_class,name,url,color]'
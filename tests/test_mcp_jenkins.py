@@ -52,3 +52,23 @@ def test_main(mocker):
     )
 
     mock_mcp.run_async.assert_called_once_with(transport='stdio')
+
+
+def test_main_jenkins_async(mocker):
+    mocker.patch('mcp_jenkins.asyncio')
+    mocker.patch('mcp_jenkins.server.mcp')
+    environ = mocker.patch.dict('mcp_jenkins.os.environ', {})
+
+    CliRunner().invoke(main, ['--jenkins-async'])
+
+    assert environ['jenkins_async'] == 'true'
+
+
+def test_main_jenkins_worker_threads(mocker):
+    mocker.patch('mcp_jenkins.asyncio')
+    mocker.patch('mcp_jenkins.server.mcp')
+    environ = mocker.patch.dict('mcp_jenkins.os.environ', {})
+
+    CliRunner().invoke(main, ['--jenkins-worker-threads', '8'])
+
+    assert environ['jenkins_worker_threads'] == '8'
@@ -1,12 +1,21 @@
 import pytest
 
-from mcp_jenkins.jenkins.model.build import Artifact, Build, BuildReplay
+from mcp_jenkins.core.middleware import MARKER_SIZE
+from mcp_jenkins.jenkins.model.build import (
+    Artifact,
+    Build,
+    BuildReplay,
+    ConsoleChunk,
+    ConsoleExcerpt,
+    ConsoleMatch,
+    ConsoleSearchResult,
+)
 from mcp_jenkins.server import build
 
 
 @pytest.fixture
 def mock_jenkins(mocker):
-    mock_jenkins = mocker.Mock()
+    mock_jenkins = mocker.AsyncMock()
 
     mocker.patch('mcp_jenkins.server.build.jenkins', return_value=mock_jenkins)
 
@@ -27,7 +36,7 @@ async def test_get_running_builds(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build.return_value = Build(number=1, url='1', building=False, timestamp=1234567890)
 
     assert await build.get_build(mocker.Mock(), fullname='job1') == {
@@ -40,7 +49,7 @@ async def test_get_build(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_scripts(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_replay.return_value = BuildReplay(scripts=['script1', 'script2'])
 
     assert await build.get_build_scripts(mocker.Mock(), fullname='job1') == [
@@ -51,12 +60,15 @@ async def test_get_build_scripts(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_console_output(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_console_output.return_value = 'Console output here'
 
-    assert await build.get_build_console_output(mocker.Mock(), fullname='job1') == 'Console output here'
+    ctx = mocker.Mock()
+    ctx.request_context.lifespan_context.response_max_bytes = None
+
+    assert await build.get_build_console_output(ctx, fullname='job1') == 'Console output here'
     mock_jenkins.get_build_console_output.assert_called_once_with(
-        fullname='job1', number=1, pattern=None, offset=0, limit=None
+        fullname='job1', number=1, pattern=None, offset=0, limit=None, tail=None, max_bytes=None
     )
 
 
@@ -64,10 +76,13 @@ async def test_get_build_console_output(mock_jenkins, mocker):
 async def test_get_build_console_output_with_number(mock_jenkins, mocker):
     mock_jenkins.get_build_console_output.return_value = 'output'
 
-    assert await build.get_build_console_output(mocker.Mock(), fullname='job1', number=5) == 'output'
+    ctx = mocker.Mock()
+    ctx.request_context.lifespan_context.response_max_bytes = None
+
+    assert await build.get_build_console_output(ctx, fullname='job1', number=5) == 'output'
     mock_jenkins.get_item.assert_not_called()
     mock_jenkins.get_build_console_output.assert_called_once_with(
-        fullname='job1', number=5, pattern=None, offset=0, limit=None
+        fullname='job1', number=5, pattern=None, offset=0, limit=None, tail=None, max_bytes=None
     )
 
 
@@ -75,26 +90,133 @@ async def test_get_build_console_output_with_number(mock_jenkins, mocker):
 async def test_get_build_console_output_with_all_params(mock_jenkins, mocker):
     mock_jenkins.get_build_console_output.return_value = 'ERROR: boom'
 
-    result = await build.get_build_console_output(
-        mocker.Mock(), fullname='job1', number=3, pattern='ERROR', offset=1, limit=10
-    )
+    ctx = mocker.Mock()
+    ctx.request_context.lifespan_context.response_max_bytes = 1000
+
+    result = await build.get_build_console_output(ctx, fullname='job1', number=3, pattern='ERROR', offset=1, limit=10)
     assert result == 'ERROR: boom'
+    # The budget of the response, less room for the note of a cut output
     mock_jenkins.get_build_console_output.assert_called_once_with(
-        fullname='job1', number=3, pattern='ERROR', offset=1, limit=10
+        fullname='job1', number=3, pattern='ERROR', offset=1, limit=10, tail=None, max_bytes=1000 - MARKER_SIZE
     )
 
 
 @pytest.mark.asyncio
 async def test_get_build_console_output_no_build(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = None
+    mock_jenkins.get_last_build_number.return_value = None
 
     with pytest.raises(ValueError, match='No build found for job: job1'):
         await build.get_build_console_output(mocker.Mock(), fullname='job1')
 
 
+@pytest.mark.asyncio
+async def test_grep_build_console_output(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 3
+    mock_jenkins.grep_build_console_output.return_value = {'errors': [ConsoleMatch(line=5, text='ERROR: boom')]}
+
+    result = await build.grep_build_console_output(
+        mocker.Mock(), fullname='job1', patterns={'errors': 'ERROR'}, after=2
+    )
+
+    assert result == {'errors': [{'line': 5, 'text': 'ERROR: boom', 'before': [], 'after': []}]}
+    mock_jenkins.grep_build_console_output.assert_called_once_with(
+        fullname='job1', number=3, patterns={'errors': 'ERROR'}, before=0, after=2, limit=None
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('context', 'message'), [({'before': -1}, 'Invalid before: -1'), ({'after': -2}, 'Invalid after: -2')]
+)
+async def test_grep_build_console_output_rejects_negative_context(mock_jenkins, mocker, context, message):
+    with pytest.raises(ValueError, match=message):
+        await build.grep_build_console_output(mocker.Mock(), fullname='job1', patterns={'errors': 'ERROR'}, **context)
+
+    mock_jenkins.grep_build_console_output.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_build_failure_excerpt(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 4
+    mock_jenkins.get_build_failure_excerpt.return_value = [
+        ConsoleExcerpt(kind='tail', start=9, end=10, text='ERROR: boom\nFinished: FAILURE')
+    ]
+
+    assert await build.get_build_failure_excerpt(mocker.Mock(), fullname='job1', max_bytes=100) == [
+        {'kind': 'tail', 'start': 9, 'end': 10, 'text': 'ERROR: boom\nFinished: FAILURE'}
+    ]
+    mock_jenkins.get_build_failure_excerpt.assert_called_once_with(fullname='job1', number=4, max_bytes=100)
+
+
+@pytest.mark.asyncio
+async def test_search_builds_console_output(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 12
+    mock_jenkins.search_build_console_output.side_effect = lambda fullname, number, pattern: (
+        ConsoleSearchResult(number=number, count=number % 2, first_match='ERROR' if number % 2 else None)
+        if number > 9
+        else None
+    )
+    ctx = mocker.AsyncMock()
+
+    assert await build.search_builds_console_output(ctx, fullname='job1', pattern='ERROR', count=5) == [
+        {'number': 12, 'count': 0, 'first_match': None},
+        {'number': 11, 'count': 1, 'first_match': 'ERROR'},
+        {'number': 10, 'count': 0, 'first_match': None},
+    ]
+    assert mock_jenkins.search_build_console_output.call_count == 5
+    ctx.report_progress.assert_called_with(5, 5)
+
+
+@pytest.mark.asyncio
+async def test_search_builds_console_output_reports_errors_per_build(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 3
+
+    def search(fullname, number, pattern):
+        if number == 2:
+            msg = 'reset by peer'
+            raise ConnectionError(msg)
+        return ConsoleSearchResult(number=number, count=1, first_match='ERROR')
+
+    mock_jenkins.search_build_console_output.side_effect = search
+    ctx = mocker.AsyncMock()
+
+    assert await build.search_builds_console_output(ctx, fullname='job1', pattern='ERROR', count=3) == [
+        {'number': 3, 'count': 1, 'first_match': 'ERROR'},
+        {'number': 2, 'error': 'ConnectionError: reset by peer'},
+        {'number': 1, 'count': 1, 'first_match': 'ERROR'},
+    ]
+    ctx.report_progress.assert_called_with(3, 3)
+
+
+@pytest.mark.asyncio
+async def test_search_builds_console_output_clamps_count(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 500
+    mock_jenkins.search_build_console_output.return_value = None
+
+    assert await build.search_builds_console_output(mocker.AsyncMock(), fullname='job1', pattern='x', count=1000) == []
+    assert mock_jenkins.search_build_console_output.call_count == build.SEARCH_MAX_BUILDS
+
+    with pytest.raises(ValueError, match='Invalid count: 0'):
+        await build.search_builds_console_output(mocker.AsyncMock(), fullname='job1', pattern='x', count=0)
+
+
+@pytest.mark.asyncio
+async def test_follow_build_console_output(mock_jenkins, mocker):
+    mock_jenkins.get_last_build_number.return_value = 7
+    mock_jenkins.get_build_console_progress.return_value = ConsoleChunk(text='line\n', cursor='abc', more_data=True)
+
+    assert await build.follow_build_console_output(mocker.Mock(), fullname='job1', cursor='xyz') == {
+        'number': 7,
+        'text': 'line\n',
+        'cursor': 'abc',
+        'more_data': True,
+    }
+    mock_jenkins.get_build_console_progress.assert_called_once_with(fullname='job1', number=7, cursor='xyz')
+
+
 @pytest.mark.asyncio
 async def test_get_build_test_reports(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_test_report.return_value = {'reports': ['report1', 'report2']}
 
     assert await build.get_build_test_report(mocker.Mock(), fullname='job1') == {'reports': ['report1', 'report2']}
@@ -102,7 +224,7 @@ async def test_get_build_test_reports(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_parameters(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_parameters.return_value = {'BRANCH': 'main', 'DEBUG': True}
 
     assert await build.get_build_parameters(mocker.Mock(), fullname='job1') == {
@@ -119,7 +241,7 @@ async def test_stop_build(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_all_build_artifacts(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_artifacts.return_value = [
         Artifact(
             fileName='index.html',
@@ -150,7 +272,7 @@ async def test_get_all_build_artifacts_with_number(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_artifact_text(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_artifact.return_value = b'<html>report</html>'
 
     result = await build.get_build_artifact(
@@ -161,7 +283,7 @@ async def test_get_build_artifact_text(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_artifact_binary(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_artifact.return_value = bytes(range(256))
 
     result = await build.get_build_artifact(mocker.Mock(), fullname='job1', relative_path='trace.zip')
@@ -183,7 +305,7 @@ async def test_get_build_artifact_with_number(mock_jenkins, mocker):
 
 @pytest.mark.asyncio
 async def test_get_build_artifact_url(mock_jenkins, mocker):
-    mock_jenkins.get_item.return_value.lastBuild.number = 1
+    mock_jenkins.get_last_build_number.return_value = 1
     mock_jenkins.get_build_artifact_url.return_value = 'https://jenkins.example.com/job/job1/1/artifact/trace.zip'
 
     result = await build.get_build_artifact_url(mocker.Mock(), fullname='job1', relative_path='trace.zip')
@@ -1,12 +1,13 @@
 import pytest
 
-from mcp_jenkins.jenkins.model.item import Folder, Job
+from mcp_jenkins.jenkins.base import ITEM_PAGE_SIZE
+from mcp_jenkins.jenkins.model.item import Folder, ItemPage, Job
 from mcp_jenkins.server import item
 
 
 @pytest.fixture
 def mock_jenkins(mocker):
-    mock_jenkins = mocker.Mock()
+    mock_jenkins = mocker.AsyncMock()
 
     mocker.patch('mcp_jenkins.server.item.jenkins', return_value=mock_jenkins)
 
@@ -15,7 +16,7 @@ def mock_jenkins(mocker):
 
 @pytest.mark.asyncio
 async def test_get_all_items(mock_jenkins, mocker):
-    mock_jenkins.get_items.return_value = [
+    mock_jenkins.query_items.return_value = [
         Job(fullname='job1', color='blue', name='job1', url='1', class_='Job'),
         Folder(fullname='job2', jobs=[], class_='Folder', name='folder', url='1'),
     ]
@@ -38,6 +39,38 @@ async def test_get_all_items(mock_jenkins, mocker):
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_all_items_max_staleness(mock_jenkins, mocker):
+    mock_jenkins.query_items.return_value = []
+
+    assert await item.get_all_items(mocker.Mock(), max_staleness=30) == []
+    mock_jenkins.query_items.assert_called_once_with(max_staleness=30)
+
+
+@pytest.mark.asyncio
+async def test_get_all_items_page(mock_jenkins, mocker):
+    mock_jenkins.get_items_page.return_value = ItemPage(
+        items=[Job(fullname='job1', color='blue', name='job1', url='1', class_='Job')], next_cursor='next', total=3
+    )
+
+    assert await item.get_all_items(mocker.Mock(), page_size=1) == {
+        'items': [{'class_': 'Job', 'color': 'blue', 'fullname': 'job1', 'name': 'job1', 'url': '1'}],
+        'next_cursor': 'next',
+        'total': 3,
+    }
+    mock_jenkins.get_items_page.assert_called_once_with(page_size=1, cursor=None, max_staleness=None)
+    mock_jenkins.query_items.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_all_items_page_size_zero_is_passed_on(mock_jenkins, mocker):
+    mock_jenkins.get_items_page.side_effect = ValueError('Invalid page size: 0, it must be 1 or more')
+
+    with pytest.raises(ValueError, match='Invalid page size: 0'):
+        await item.get_all_items(mocker.Mock(), page_size=0)
+    mock_jenkins.get_items_page.assert_called_once_with(page_size=0, cursor=None, max_staleness=None)
+
+
 @pytest.mark.asyncio
 async def test_get_item(mock_jenkins, mocker):
     mock_jenkins.get_item.return_value = Job(fullname='job1', color='blue', name='job1', url='1', class_='Job')
@@ -89,6 +122,26 @@ async def test_query_items(mock_jenkins, mocker):
     ]
 
 
+@pytest.mark.asyncio
+async def test_query_items_next_page(mock_jenkins, mocker):
+    mock_jenkins.get_items_page.return_value = ItemPage(items=[], next_cursor=None, total=0)
+
+    assert await item.query_items(mocker.Mock(), color_pattern='red', cursor='next') == {
+        'items': [],
+        'next_cursor': None,
+        'total': 0,
+    }
+    mock_jenkins.get_items_page.assert_called_once_with(
+        class_pattern=None,
+        fullname_pattern=None,
+        color_pattern='red',
+        folder_depth=None,
+        page_size=ITEM_PAGE_SIZE,
+        cursor='next',
+        max_staleness=None,
+    )
+
+
 @pytest.mark.asyncio
 async def test_build_item(mock_jenkins, mocker):
     mock_jenkins.build_item.return_value = None
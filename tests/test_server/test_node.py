@@ -6,7 +6,7 @@ from mcp_jenkins.server import node
 
 @pytest.fixture
 def mock_jenkins(mocker):
-    mock_jenkins = mocker.Mock()
+    mock_jenkins = mocker.AsyncMock()
 
     mocker.patch('mcp_jenkins.server.node.jenkins', return_value=mock_jenkins)
 
@@ -5,7 +5,7 @@ from mcp_jenkins.server import plugin
 
 @pytest.fixture
 def mock_jenkins(mocker):
-    mock_jenkins = mocker.Mock()
+    mock_jenkins = mocker.AsyncMock()
 
     mocker.patch('mcp_jenkins.server.plugin.jenkins', return_value=mock_jenkins)
 
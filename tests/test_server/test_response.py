@@ -0,0 +1,47 @@
+import pytest
+
+from mcp_jenkins.core.middleware import continuation_key
+from mcp_jenkins.jenkins.cache import ResponseCache
+from mcp_jenkins.server import response
+
+
+@pytest.fixture
+def ctx(mocker):
+    ctx = mocker.Mock()
+    ctx.session_id = 'session'
+    ctx.request_context.lifespan_context.response_max_bytes = 4
+    ctx.request_context.lifespan_context.response_continuations = ResponseCache(copy=False)
+    ctx.request_context.lifespan_context.response_continuations.set(
+        continuation_key('session', 'token'), '["aé"]'.encode(), ttl=60
+    )
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_get_response_continuation(ctx):
+    # The page is cut back before the two bytes of the last character
+    assert await response.get_response_continuation(ctx, token='token') == {'text': '["a', 'next_offset': 3}
+    assert await response.get_response_continuation(ctx, token='token', offset=3) == {
+        'text': 'é"]',
+        'next_offset': None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_response_continuation_unknown_token(ctx):
+    with pytest.raises(ValueError, match='Unknown or expired continuation token: other'):
+        await response.get_response_continuation(ctx, token='other')
+
+
+@pytest.mark.asyncio
+async def test_get_response_continuation_of_another_session(ctx):
+    ctx.session_id = 'other'
+
+    with pytest.raises(ValueError, match='Unknown or expired continuation token: token'):
+        await response.get_response_continuation(ctx, token='token')
+
+
+@pytest.mark.asyncio
+async def test_get_response_continuation_negative_offset(ctx):
+    with pytest.raises(ValueError, match='Invalid offset: -1'):
+        await response.get_response_continuation(ctx, token='token', offset=-1)
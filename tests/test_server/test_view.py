@@ -5,7 +5,7 @@ from mcp_jenkins.server import view
 
 @pytest.fixture
 def mock_jenkins(mocker):
-    mock_jenkins = mocker.Mock()
+    mock_jenkins = mocker.AsyncMock()
 
     mocker.patch('mcp_jenkins.server.view.jenkins', return_value=mock_jenkins)
 
@@ -63,7 +63,7 @@ async def test_get_view(mock_jenkins, mocker):
             },
         ],
     }
-    mock_jenkins.get_view.assert_called_once_with(view_path='frontend', depth=0)
+    mock_jenkins.get_view.assert_called_once_with(view_path='frontend', depth=0, fields=None)
 
 
 @pytest.mark.asyncio
@@ -80,7 +80,7 @@ async def test_get_view_nested(mock_jenkins, mocker):
 
     assert result['name'] == 'nightly'
     assert len(result['views']) == 2
-    mock_jenkins.get_view.assert_called_once_with(view_path='frontend/nightly', depth=0)
+    mock_jenkins.get_view.assert_called_once_with(view_path='frontend/nightly', depth=0, fields=None)
 
 
 @pytest.mark.asyncio
@@ -98,4 +98,4 @@ async def test_get_view_with_depth(mock_jenkins, mocker):
 
     await view.get_view(mocker.Mock(), view_path='frontend', depth=1)
 
-    mock_jenkins.get_view.assert_called_once_with(view_path='frontend', depth=1)
+    mock_jenkins.get_view.assert_called_once_with(view_path='frontend', depth=1, fields=None)